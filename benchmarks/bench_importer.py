@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the post importer.
+
+Writes a synthetic NDJSON dump and a JSON export, imports them back with
+several worker counts and reports the throughput in MB/s.
+
+Usage:
+    python benchmarks/bench_importer.py --count 1000000 --workers 1 4 8
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from presentation.output_manager import OutputManager
+from presentation.serializers import post_to_row
+from storage.post_importer import PostImporter
+
+from bench_serializers import make_posts
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmark the post importer')
+    parser.add_argument('--count', '-n', type=int, default=1000000, help='Number of posts (default: 1000000)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, os.cpu_count() or 1],
+                        help='Worker process counts to compare')
+    args = parser.parse_args()
+
+    posts = make_posts(args.count)
+    print(f"{'file':<8} {'workers':>7} {'seconds':>8} {'MB':>8} {'MB/s':>8}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        ndjson_path = os.path.join(tmp_dir, "posts.ndjson")
+        with open(ndjson_path, 'w', encoding='utf-8') as f:
+            for post in posts:
+                f.write(json.dumps(post_to_row(post)) + "\n")
+        json_path = os.path.join(tmp_dir, "posts.json")
+        OutputManager().export_to_json(posts, json_path, indent=None)
+        del posts
+
+        runs = [("ndjson", ndjson_path, workers) for workers in args.workers] + [("json", json_path, 1)]
+        for name, path, workers in runs:
+            importer = PostImporter(workers=workers)
+            start = time.perf_counter()
+            rows = sum(len(batch['id']) for batch in importer.iter_batches(path))
+            elapsed = time.perf_counter() - start
+
+            megabytes = os.path.getsize(path) / 1e6
+            assert rows == args.count, f"imported {rows} of {args.count} rows"
+            print(f"{name:<8} {workers:>7} {elapsed:>8.2f} {megabytes:>8.1f} {megabytes / elapsed:>8.1f}")
+
+if __name__ == "__main__":
+    main()
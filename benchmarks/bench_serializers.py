@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the JSON export serializers.
+
+Writes a synthetic export with every installed serializer backend and
+reports the throughput in MB/s.
+
+Usage:
+    python benchmarks/bench_serializers.py --count 1000000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from core.data_models import RedditPost
+from presentation.serializers import available_backends, get_serializer
+
+def make_posts(count):
+    """Generate synthetic posts with a mix of link and self posts."""
+    return [
+        RedditPost(
+            id=f"t{i:07x}",
+            title=f"Synthetic post number {i} about Python and performance",
+            author=f"user{i % 5000}",
+            upvotes=i % 10000,
+            downvotes=None,
+            score=i % 10000,
+            url=f"https://www.reddit.com/r/python/comments/t{i:07x}/",
+            created_utc=1600000000.0 + i,
+            num_comments=i % 500,
+            is_self=i % 3 == 0,
+            selftext=("Lorem ipsum dolor sit amet. " * 8) if i % 3 == 0 else None,
+            subreddit="python"
+        )
+        for i in range(count)
+    ]
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmark JSON export serializers')
+    parser.add_argument('--count', '-n', type=int, default=1000000, help='Number of posts (default: 1000000)')
+    parser.add_argument('--indent', action='store_true', help='Write indented output')
+    args = parser.parse_args()
+
+    posts = make_posts(args.count)
+    indent = 2 if args.indent else None
+    print(f"{'backend':<10} {'seconds':>8} {'MB':>8} {'MB/s':>8}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for backend in available_backends():
+            serializer = get_serializer(backend)
+            path = os.path.join(tmp_dir, f"{backend}.json")
+
+            start = time.perf_counter()
+            with open(path, 'wb') as f:
+                written = serializer.write(posts, f, indent=indent)
+            elapsed = time.perf_counter() - start
+
+            megabytes = written / 1e6
+            print(f"{backend:<10} {elapsed:>8.2f} {megabytes:>8.1f} {megabytes / elapsed:>8.1f}")
+
+if __name__ == "__main__":
+    main()
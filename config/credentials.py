@@ -36,7 +36,9 @@ class CredentialsManager:
         credentials = {
             'client_id': os.environ.get('REDDIT_CLIENT_ID'),
             'client_secret': os.environ.get('REDDIT_CLIENT_SECRET'),
-            'user_agent': os.environ.get('REDDIT_USER_AGENT')
+            'user_agent': os.environ.get('REDDIT_USER_AGENT'),
+            # Alternative API endpoint, e.g. the local stub server for load testing
+            'base_url': os.environ.get('REDDIT_BASE_URL')
         }
         
         # Validate required credentials
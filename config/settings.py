@@ -5,7 +5,7 @@ This module handles application configuration and settings management.
 """
 
 import os
-from typing import Optional
+from typing import List, Optional
 from utils.logger import configure_logger
 
 class Settings:
@@ -14,6 +14,7 @@ class Settings:
     # Default settings
     DEFAULT_SUBREDDIT = "python"
     DEFAULT_POST_LIMIT = 5
+    DEFAULT_STATE_DIR = "~/.reddit_fetcher"
     
     def __init__(self):
         """Initialize settings with default values."""
@@ -21,11 +22,18 @@ class Settings:
         self.post_limit = int(os.environ.get("REDDIT_POST_LIMIT", self.DEFAULT_POST_LIMIT))
         self.verbose = False
         
+        # Directory for state kept across runs (circuit breakers, snapshots)
+        self.state_dir = os.path.expanduser(
+            os.environ.get("REDDIT_FETCHER_STATE_DIR", self.DEFAULT_STATE_DIR)
+        )
+        
         # API Settings
         self.client_id = os.environ.get("REDDIT_CLIENT_ID")
         self.client_secret = os.environ.get("REDDIT_CLIENT_SECRET")
         self.user_agent = os.environ.get("REDDIT_USER_AGENT", 
                                          "python:reddit-fetcher:v1.0 (by /u/your_username)")
+        # How selftext is kept in memory (plain, zlib, zstd or heap)
+        self.text_storage = os.environ.get("REDDIT_TEXT_STORAGE", "plain")
         
     def configure(self, subreddit: Optional[str] = None, 
                   post_limit: Optional[int] = None,
@@ -69,3 +77,28 @@ class Settings:
             raise ValueError("Subreddit name is required")
             
         return True
+        
+    @property
+    def subreddits(self) -> List[str]:
+        """Get the configured subreddit names; several may be given separated by commas."""
+        return [name.strip() for name in self.subreddit.split(",") if name.strip()]
+        
+    @property
+    def snapshot_file(self) -> str:
+        """Get the path of the state snapshot restored at startup."""
+        return os.path.join(self.state_dir, "state.snapshot")
+        
+    @property
+    def link_cache_dir(self) -> str:
+        """Get the directory of the link metadata cache."""
+        return os.path.join(self.state_dir, "links")
+        
+    @property
+    def dead_letter_dir(self) -> str:
+        """Get the directory posts that could not be delivered to a sink are spooled to."""
+        return os.path.join(self.state_dir, "dead_letter")
+        
+    @property
+    def circuit_state_file(self) -> str:
+        """Get the path of the persisted circuit breaker states."""
+        return os.path.join(self.state_dir, "circuits.json")
@@ -4,14 +4,22 @@ API Client module for the Reddit Fetcher application.
 This module provides the low-level Reddit API client implementation.
 """
 
+import random
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
 
 import praw
+import prawcore
 from praw.models import Submission
 
+from core.circuit_breaker import CircuitBreakerRegistry
+from core.concurrency import AdaptiveConcurrencyController
+from utils.cache import TTLCache
 from utils.logger import get_logger
-from utils.error_handler import RedditAPIError, RateLimitError
+from utils.error_handler import CircuitOpenError, RedditAPIError, RateLimitError
+from utils.metrics import MetricsRegistry
+from utils.rate_limiter import RateLimiter
 
 logger = get_logger(__name__)
 
@@ -22,14 +30,41 @@ class RedditClient:
     MAX_RETRIES = 3
     RETRY_DELAY = 5  # seconds
     
-    def __init__(self, reddit_instance: praw.Reddit):
+    # Supported listing sorts
+    LISTING_SORTS = ("new", "hot", "rising", "top", "controversial")
+    TIME_FILTERED_SORTS = ("top", "controversial")
+    TIME_FILTERS = ("hour", "day", "week", "month", "year", "all")
+    
+    # Limits for combined r/a+b+c multireddit requests
+    MAX_MULTIREDDIT_NAME_LENGTH = 1500  # characters, keeps the URL well under server limits
+    MAX_SUBREDDITS_PER_REQUEST = 100
+    
+    # /api/info accepts at most 100 fullnames per request
+    INFO_BATCH_SIZE = 100
+    
+    def __init__(self, reddit_instance: praw.Reddit,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 cache: Optional[TTLCache] = None,
+                 metrics: Optional[MetricsRegistry] = None,
+                 concurrency: Optional[AdaptiveConcurrencyController] = None,
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None):
         """
         Initialize the Reddit client.
         
         Args:
             reddit_instance: Authenticated Reddit instance
+            rate_limiter: Rate limiter shared by all requests (optional)
+            cache: Listing response cache (optional)
+            metrics: Metrics registry (optional)
+            concurrency: Controller limiting in-flight requests (optional)
+            circuit_breakers: Per-subreddit circuit breakers (optional)
         """
         self.reddit = reddit_instance
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.cache = cache if cache is not None else TTLCache()
+        self.metrics = metrics or MetricsRegistry()
+        self.concurrency = concurrency or AdaptiveConcurrencyController(metrics=self.metrics)
+        self.circuit_breakers = circuit_breakers or CircuitBreakerRegistry()
         
     def get_subreddit(self, subreddit_name: str):
         """
@@ -51,6 +86,237 @@ class RedditClient:
             logger.error(f"Failed to get subreddit {subreddit_name}: {str(e)}")
             raise RedditAPIError(f"Failed to get subreddit {subreddit_name}: {str(e)}")
     
+    def fetch_listing(self, subreddit_name: str, sort: str = "new",
+                      time_filter: str = "all", limit: int = 5,
+                      before: Optional[str] = None,
+                      check_circuit: bool = True) -> List[Submission]:
+        """
+        Fetch a subreddit listing in the given sort order.
+        
+        Every listing goes through this method so that all sorts share the
+        rate limiter, the response cache, the retry policy and the metrics.
+        
+        Args:
+            subreddit_name: Name of the subreddit
+            sort: Listing sort (new, hot, rising, top, controversial)
+            time_filter: Time filter for top/controversial listings
+                (hour, day, week, month, year, all)
+            limit: Maximum number of posts to retrieve
+            before: Only return posts listed before (newer than) this post id (optional)
+            check_circuit: Whether to check the subreddit's circuit first; the
+                result is recorded either way (False when the caller already
+                called allow())
+            
+        Returns:
+            List[praw.models.Submission]: List of submission objects
+            
+        Raises:
+            ValueError: If the sort or time filter is not supported
+            CircuitOpenError: If the subreddit is skipped because its circuit is open
+            RedditAPIError: If the posts cannot be retrieved
+            RateLimitError: If rate limit is hit
+        """
+        if sort not in self.LISTING_SORTS:
+            raise ValueError(f"Unsupported listing sort: {sort}")
+        if sort in self.TIME_FILTERED_SORTS and time_filter not in self.TIME_FILTERS:
+            raise ValueError(f"Unsupported time filter: {time_filter}")
+            
+        cache_key = (subreddit_name.lower(), sort,
+                     time_filter if sort in self.TIME_FILTERED_SORTS else None, limit, before)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Cache hit for r/{subreddit_name}/{sort}")
+            self.metrics.increment("listing.cache_hits")
+            return list(cached)
+        self.metrics.increment("listing.cache_misses")
+        
+        def request():
+            subreddit = self.get_subreddit(subreddit_name)
+            listing = getattr(subreddit, sort)
+            options = {'limit': limit}
+            if sort in self.TIME_FILTERED_SORTS:
+                options['time_filter'] = time_filter
+            if before:
+                options['params'] = {'before': f"t3_{before}"}
+            return list(listing(**options))
+            
+        # Combined multireddit names are not tracked; their members are checked by the caller
+        breaker_name = None if "+" in subreddit_name else subreddit_name
+        if breaker_name and check_circuit and not self.circuit_breakers.allow(breaker_name):
+            self.metrics.increment("listing.circuit_open")
+            raise CircuitOpenError(f"Skipping r/{subreddit_name}: circuit open after repeated failures")
+            
+        logger.info(f"Fetching {limit} {sort} posts from r/{subreddit_name}")
+        try:
+            posts = self._call_with_retries(request, f"r/{subreddit_name}/{sort}")
+        except RateLimitError:
+            # Rate limits are not specific to a subreddit
+            if breaker_name:
+                self.circuit_breakers.release_trial(breaker_name)
+            raise
+        except RedditAPIError as e:
+            if breaker_name:
+                self.circuit_breakers.record_failure(
+                    breaker_name, str(e), permanent=self._is_permanent_error(e.__cause__)
+                )
+            raise
+        if breaker_name:
+            self.circuit_breakers.record_success(breaker_name)
+        logger.info(f"Successfully retrieved {len(posts)} posts")
+        
+        self.metrics.increment(f"listing.{sort}.posts", len(posts))
+        self.cache.set(cache_key, posts)
+        return list(posts)
+    
+    def fetch_multireddit_listing(self, subreddit_names: List[str], sort: str = "new",
+                                  time_filter: str = "all",
+                                  limit_per_subreddit: int = 5) -> Dict[str, List[Submission]]:
+        """
+        Fetch listings for many subreddits using combined multireddit requests.
+        
+        Subreddits are packed into r/a+b+c requests and the results are split
+        back per subreddit using each submission's subreddit. This is meant for
+        low-traffic subreddits: in a combined listing a busy subreddit can
+        crowd out quiet ones, so those may receive fewer posts than requested.
+        
+        A successful combined request closes the circuits of all its members.
+        When it fails, its members are fetched one by one so that a private or
+        banned subreddit only fails itself and is recorded by its own circuit.
+        
+        Args:
+            subreddit_names: Names of the subreddits
+            sort: Listing sort (new, hot, rising, top, controversial)
+            time_filter: Time filter for top/controversial listings
+            limit_per_subreddit: Maximum number of posts to keep per subreddit
+            
+        Returns:
+            Dict[str, List[praw.models.Submission]]: Submissions keyed by requested subreddit name;
+                subreddits with an open circuit or that failed on their own are left out
+            
+        Raises:
+            ValueError: If the sort or time filter is not supported
+            RateLimitError: If rate limit is hit
+        """
+        allowed = [name for name in subreddit_names if self.circuit_breakers.allow(name)]
+        if len(allowed) < len(subreddit_names):
+            logger.info(f"Skipping {len(subreddit_names) - len(allowed)} subreddits with open circuits")
+            
+        results: Dict[str, List[Submission]] = {name: [] for name in allowed}
+        requested = {name.lower(): name for name in allowed}
+        
+        for batch in self.pack_multireddits(allowed):
+            combined_name = "+".join(batch)
+            try:
+                submissions = self.fetch_listing(combined_name, sort, time_filter,
+                                                 limit_per_subreddit * len(batch))
+            except RateLimitError:
+                for name in batch:
+                    self.circuit_breakers.release_trial(name)
+                raise
+            except RedditAPIError as e:
+                logger.warning(f"Combined request r/{combined_name} failed, "
+                               f"fetching its {len(batch)} subreddits separately: {str(e)}")
+                self.metrics.increment("listing.multireddit_fallbacks")
+                self._fetch_members(batch, sort, time_filter, limit_per_subreddit, results)
+                continue
+            self.metrics.increment("listing.multireddit_batches")
+            for name in batch:
+                self.circuit_breakers.record_success(name)
+            
+            for submission in submissions:
+                name = requested.get(submission.subreddit.display_name.lower())
+                if name is not None and len(results[name]) < limit_per_subreddit:
+                    results[name].append(submission)
+                    
+        return results
+    
+    def _fetch_members(self, batch: List[str], sort: str, time_filter: str, limit: int,
+                       results: Dict[str, List[Submission]]) -> None:
+        """Fetch the members of a failed combined request separately, dropping those that fail."""
+        for index, name in enumerate(batch):
+            try:
+                results[name] = self.fetch_listing(name, sort, time_filter, limit, check_circuit=False)
+            except RateLimitError:
+                for remaining in batch[index + 1:]:
+                    self.circuit_breakers.release_trial(remaining)
+                raise
+            except RedditAPIError as e:
+                logger.warning(f"Skipping r/{name}: {str(e)}")
+                del results[name]
+    
+    def pack_multireddits(self, subreddit_names: List[str]) -> List[List[str]]:
+        """
+        Split subreddit names into batches that fit one multireddit request.
+        
+        Args:
+            subreddit_names: Names of the subreddits
+            
+        Returns:
+            List[List[str]]: Batches of subreddit names
+        """
+        batches: List[List[str]] = []
+        current: List[str] = []
+        current_length = 0
+        
+        for name in dict.fromkeys(subreddit_names):
+            # Account for the "+" separator in front of every name but the first
+            added_length = len(name) + (1 if current else 0)
+            if current and (current_length + added_length > self.MAX_MULTIREDDIT_NAME_LENGTH
+                            or len(current) >= self.MAX_SUBREDDITS_PER_REQUEST):
+                batches.append(current)
+                current, current_length = [], 0
+                added_length = len(name)
+            current.append(name)
+            current_length += added_length
+            
+        if current:
+            batches.append(current)
+            
+        logger.debug(f"Packed {len(subreddit_names)} subreddits into {len(batches)} multireddit requests")
+        return batches
+    
+    def fetch_info(self, post_ids: List[str], max_workers: Optional[int] = None) -> List[Submission]:
+        """
+        Fetch known posts by id through /api/info.
+        
+        Ids are batched INFO_BATCH_SIZE per request and the batches run
+        concurrently; every request still goes through the shared rate limiter.
+        
+        Args:
+            post_ids: Post ids, with or without the "t3_" prefix
+            max_workers: Maximum number of batches requested concurrently; the
+                concurrency controller decides how many are actually in flight
+            
+        Returns:
+            List[praw.models.Submission]: Submissions that still exist, in batch order
+            
+        Raises:
+            RedditAPIError: If a batch cannot be retrieved
+            RateLimitError: If rate limit is hit
+        """
+        fullnames = list(dict.fromkeys(
+            post_id if post_id.startswith("t3_") else f"t3_{post_id}" for post_id in post_ids
+        ))
+        batches = [fullnames[i:i + self.INFO_BATCH_SIZE]
+                   for i in range(0, len(fullnames), self.INFO_BATCH_SIZE)]
+        if not batches:
+            return []
+            
+        def request(batch: List[str]) -> List[Submission]:
+            return self._call_with_retries(
+                lambda: list(self.reddit.info(fullnames=batch)),
+                f"/api/info ({len(batch)} ids)"
+            )
+            
+        logger.info(f"Fetching {len(fullnames)} posts by id in {len(batches)} requests")
+        workers = min(max_workers or self.concurrency.max_limit, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(request, batches))
+            
+        submissions = [submission for batch in results for submission in batch]
+        self.metrics.increment("info.posts", len(submissions))
+        return submissions
+    
     def get_latest_posts(self, subreddit_name: str, limit: int = 5) -> List[Submission]:
         """
         Get the latest posts from a subreddit.
@@ -66,52 +332,109 @@ class RedditClient:
             RedditAPIError: If the posts cannot be retrieved
             RateLimitError: If rate limit is hit
         """
+        return self.fetch_listing(subreddit_name, sort="new", limit=limit)
+    
+    def _call_with_retries(self, request: Callable[[], Any], description: str) -> Any:
+        """
+        Run an API request under the rate limiter with retries.
+        
+        Rate limit and transient server errors are retried with exponential
+        backoff and jitter; any other error is raised immediately.
+        
+        Args:
+            request: Callable performing the request
+            description: Short description of the request for log messages
+            
+        Returns:
+            Any: Result of the request
+            
+        Raises:
+            RedditAPIError: If the request fails
+            RateLimitError: If rate limit is still hit after all retries
+        """
         retries = 0
-        while retries < self.MAX_RETRIES:
-            try:
-                logger.info(f"Fetching {limit} latest posts from r/{subreddit_name}")
-                subreddit = self.get_subreddit(subreddit_name)
+        while True:
+            waited = self.rate_limiter.acquire()
+            if waited:
+                self.metrics.observe("api.limiter_wait", waited)
                 
-                # Get the latest posts sorted by new
-                posts = list(subreddit.new(limit=limit))
-                
-                logger.info(f"Successfully retrieved {len(posts)} posts")
-                return posts
-                
-            except praw.exceptions.RedditAPIException as e:
-                logger.warning(f"Reddit API exception: {str(e)}")
+            self.metrics.increment("api.requests")
+            self.concurrency.acquire()
+            start = time.perf_counter()
+            try:
+                result = request()
+            except Exception as e:
+                self.metrics.observe("api.latency", time.perf_counter() - start)
+                self.metrics.increment("api.errors")
                 
-                # Check if it's a rate limit error
-                if any(error.error_type == "RATELIMIT" for error in e.items):
-                    retries += 1
-                    if retries >= self.MAX_RETRIES:
-                        logger.error(f"Rate limit exceeded after {retries} retries")
-                        raise RateLimitError(f"Reddit API rate limit exceeded: {str(e)}")
+                rate_limited = self._is_rate_limit_error(e)
+                transient = self._is_transient_error(e)
+                self.concurrency.release(overloaded=rate_limited or transient)
+                if not rate_limited and not transient:
+                    logger.error(f"Failed to fetch {description}: {str(e)}")
+                    if isinstance(e, RedditAPIError):
+                        raise
+                    raise RedditAPIError(f"Failed to fetch {description}: {str(e)}") from e
                     
-                    # Wait before retrying
-                    wait_time = self.RETRY_DELAY * retries
-                    logger.info(f"Rate limit hit, waiting {wait_time} seconds before retry {retries}/{self.MAX_RETRIES}")
-                    time.sleep(wait_time)
-                else:
-                    # For other Reddit API exceptions, raise immediately
-                    raise RedditAPIError(f"Reddit API error: {str(e)}")
+                retries += 1
+                if rate_limited:
+                    self.metrics.increment("api.rate_limited")
+                if retries >= self.MAX_RETRIES:
+                    logger.error(f"Giving up on {description} after {retries} retries")
+                    if rate_limited:
+                        raise RateLimitError(f"Reddit API rate limit exceeded: {str(e)}") from e
+                    raise RedditAPIError(f"Failed to fetch {description} after {retries} retries: {str(e)}") from e
                     
-            except Exception as e:
-                logger.error(f"Failed to fetch posts: {str(e)}")
+                # Exponential backoff with jitter so parallel callers do not retry in lockstep
+                wait_time = self.RETRY_DELAY * (2 ** (retries - 1))
+                wait_time += random.uniform(0, self.RETRY_DELAY)
+                logger.info(f"{'Rate limit hit' if rate_limited else 'Transient error'}, "
+                            f"waiting {wait_time:.1f} seconds before retry {retries}/{self.MAX_RETRIES}")
+                self.metrics.increment("api.retries")
+                time.sleep(wait_time)
                 
-                # Check if it's a rate limit error (for other exception types)
-                if "rate limit" in str(e).lower() or "ratelimit" in str(e).lower():
-                    retries += 1
-                    if retries >= self.MAX_RETRIES:
-                        logger.error(f"Rate limit exceeded after {retries} retries")
-                        raise RateLimitError(f"Reddit API rate limit exceeded: {str(e)}")
-                    
-                    # Wait before retrying
-                    wait_time = self.RETRY_DELAY * retries
-                    logger.info(f"Rate limit hit, waiting {wait_time} seconds before retry {retries}/{self.MAX_RETRIES}")
-                    time.sleep(wait_time)
-                else:
-                    raise RedditAPIError(f"Failed to fetch posts from r/{subreddit_name}: {str(e)}")
+            else:
+                latency = time.perf_counter() - start
+                self.concurrency.release(latency=latency)
+                self.metrics.observe("api.latency", latency)
+                self._observe_quota()
+                return result
                 
-        # This should not be reached, but just in case
-        raise RedditAPIError(f"Failed to fetch posts after {self.MAX_RETRIES} retries")
+    def _observe_quota(self) -> None:
+        """Feed the rate-limit headers of the last response to the limiter and controller."""
+        limits = getattr(getattr(self.reddit, "auth", None), "limits", None)
+        if not isinstance(limits, dict) or limits.get("remaining") is None:
+            return
+            
+        remaining = limits["remaining"]
+        self.metrics.set_gauge("api.quota_remaining", remaining)
+        self.concurrency.observe_quota(remaining)
+        
+        reset_timestamp = limits.get("reset_timestamp")
+        if remaining < 1 and reset_timestamp:
+            # Hold every caller back until the quota period resets
+            self.rate_limiter.penalize(max(0.0, reset_timestamp - time.time()))
+            
+    @staticmethod
+    def _is_rate_limit_error(error: Exception) -> bool:
+        """Check whether an exception signals that the rate limit was hit."""
+        if isinstance(error, praw.exceptions.RedditAPIException):
+            return any(item.error_type == "RATELIMIT" for item in error.items)
+        if isinstance(error, prawcore.exceptions.TooManyRequests):
+            return True
+        message = str(error).lower()
+        return "rate limit" in message or "ratelimit" in message
+        
+    @staticmethod
+    def _is_permanent_error(error: Optional[Exception]) -> bool:
+        """Check whether an exception means the subreddit is private, banned or missing."""
+        return isinstance(error, (prawcore.exceptions.Forbidden,
+                                  prawcore.exceptions.NotFound,
+                                  prawcore.exceptions.Redirect,
+                                  prawcore.exceptions.UnavailableForLegalReasons))
+        
+    @staticmethod
+    def _is_transient_error(error: Exception) -> bool:
+        """Check whether an exception is a server or network error worth retrying."""
+        return isinstance(error, (prawcore.exceptions.ServerError,
+                                  prawcore.exceptions.RequestException))
@@ -32,10 +32,16 @@ class RedditAuthenticator:
             logger.info("Authenticating with Reddit API")
             credentials = self.credentials_manager.get_credentials()
             
+            endpoints = {}
+            if credentials.get('base_url'):
+                logger.info(f"Using Reddit API at {credentials['base_url']}")
+                endpoints = {'oauth_url': credentials['base_url'], 'reddit_url': credentials['base_url']}
+            
             reddit = praw.Reddit(
                 client_id=credentials['client_id'],
                 client_secret=credentials['client_secret'],
-                user_agent=credentials['user_agent']
+                user_agent=credentials['user_agent'],
+                **endpoints
             )
             
             # Verify credentials by making a simple API call
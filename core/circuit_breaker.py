@@ -0,0 +1,232 @@
+"""
+Circuit Breaker module for the Reddit Fetcher application.
+
+This module isolates failing subreddits so that repeated runs skip them
+cheaply instead of spending quota on requests that are known to fail.
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+@dataclass
+class CircuitRecord:
+    """Persisted state of one circuit."""
+
+    state: str = CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    cooldown: float = 0.0
+    last_error: Optional[str] = None
+    trial_started_at: float = 0.0
+
+
+class CircuitBreakerRegistry:
+    """Per-subreddit circuit breakers with exponential cool-down, persisted to JSON."""
+
+    DEFAULT_FAILURE_THRESHOLD = 3
+    DEFAULT_BASE_COOLDOWN = 60  # seconds
+    DEFAULT_MAX_COOLDOWN = 24 * 3600  # seconds
+    DEFAULT_TRIAL_TIMEOUT = 300  # seconds
+
+    def __init__(self, path: Optional[str] = None,
+                 failure_threshold: Optional[int] = None,
+                 base_cooldown: Optional[float] = None,
+                 max_cooldown: Optional[float] = None,
+                 trial_timeout: Optional[float] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            path: JSON file the circuit states are persisted to (optional)
+            failure_threshold: Consecutive failures that open a circuit
+            base_cooldown: Cool-down after the first opening, in seconds
+            max_cooldown: Upper bound of the cool-down, in seconds
+            trial_timeout: Time a half-open trial may take before the circuit
+                reopens, in seconds
+        """
+        self.path = path
+        self.failure_threshold = failure_threshold or self.DEFAULT_FAILURE_THRESHOLD
+        self.base_cooldown = base_cooldown or self.DEFAULT_BASE_COOLDOWN
+        self.max_cooldown = max_cooldown or self.DEFAULT_MAX_COOLDOWN
+        self.trial_timeout = trial_timeout or self.DEFAULT_TRIAL_TIMEOUT
+        self._records: Dict[str, CircuitRecord] = {}
+        self._lock = threading.Lock()
+        if path:
+            self.load()
+
+    @staticmethod
+    def _key(name: str) -> str:
+        """Normalize a subreddit name into a circuit key."""
+        return name.lower()
+
+    def state(self, name: str) -> str:
+        """Get the state of a subreddit's circuit."""
+        record = self._records.get(self._key(name))
+        return record.state if record else CLOSED
+
+    def allow(self, name: str, now: Optional[float] = None) -> bool:
+        """
+        Check whether a request for a subreddit may be sent.
+
+        An open circuit whose cool-down has passed moves to half-open and
+        lets a single trial request through. A trial that has not reported
+        back within the trial timeout is treated as lost and the circuit
+        reopens, waiting out its cool-down again.
+
+        Args:
+            name: Subreddit name
+            now: Current Unix time (defaults to time.time())
+
+        Returns:
+            bool: True if the request may be sent
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            record = self._records.get(self._key(name))
+            if record is None or record.state == CLOSED:
+                return True
+            if record.state == HALF_OPEN and now >= record.trial_started_at + self.trial_timeout:
+                record.state = OPEN
+                record.opened_at = now
+                logger.info(f"Circuit for r/{name} reopened, trial request timed out")
+                self._persist_locked()
+                return False
+            if record.state == OPEN and now >= record.opened_at + record.cooldown:
+                record.state = HALF_OPEN
+                record.trial_started_at = now
+                logger.info(f"Circuit for r/{name} half-open, sending a trial request")
+                return True
+            return False
+
+    def record_success(self, name: str) -> None:
+        """
+        Record a successful request, closing the circuit.
+
+        Args:
+            name: Subreddit name
+        """
+        with self._lock:
+            record = self._records.pop(self._key(name), None)
+        if record is not None:
+            if record.state != CLOSED:
+                logger.info(f"Circuit for r/{name} closed")
+            self.save()
+
+    def record_failure(self, name: str, error: str, permanent: bool = False,
+                       now: Optional[float] = None) -> None:
+        """
+        Record a failed request, opening the circuit when needed.
+
+        Args:
+            name: Subreddit name
+            error: Error message
+            permanent: Whether the error cannot resolve by retrying soon
+                (private, banned or missing subreddit); opens the circuit at once
+            now: Current Unix time (defaults to time.time())
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            record = self._records.setdefault(self._key(name), CircuitRecord())
+            record.failures += 1
+            record.last_error = error
+
+            if record.state == HALF_OPEN:
+                # The trial failed: reopen with a doubled cool-down
+                record.cooldown = min(self.max_cooldown, record.cooldown * 2)
+            elif permanent or record.failures >= self.failure_threshold:
+                record.cooldown = self.base_cooldown
+            else:
+                self._persist_locked()
+                return
+
+            record.state = OPEN
+            record.opened_at = now
+            logger.warning(f"Circuit for r/{name} open for {record.cooldown:.0f}s: {error}")
+            self._persist_locked()
+
+    def release_trial(self, name: str, now: Optional[float] = None) -> None:
+        """
+        Reopen a half-open circuit whose trial request ended without a verdict.
+
+        Used when the trial hit an error that says nothing about the subreddit,
+        such as a rate limit; the circuit waits out its current cool-down
+        again instead of staying half-open for good.
+
+        Args:
+            name: Subreddit name
+            now: Current Unix time (defaults to time.time())
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            record = self._records.get(self._key(name))
+            if record is None or record.state != HALF_OPEN:
+                return
+            record.state = OPEN
+            record.opened_at = now
+            logger.info(f"Circuit for r/{name} reopened, trial request was interrupted")
+            self._persist_locked()
+
+    def load(self, now: Optional[float] = None) -> None:
+        """
+        Load persisted circuit states, ignoring a missing or corrupt file.
+
+        A circuit saved while half-open belongs to a trial that died with the
+        previous run; it is restored as open with its cool-down re-armed.
+
+        Args:
+            now: Current Unix time (defaults to time.time())
+        """
+        if not self.path or not os.path.exists(self.path):
+            return
+        now = time.time() if now is None else now
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("expected a JSON object")
+            self._records = {key: CircuitRecord(**value) for key, value in data.items()}
+            for record in self._records.values():
+                if record.state == HALF_OPEN:
+                    record.state = OPEN
+                    record.opened_at = now
+            logger.debug(f"Loaded {len(self._records)} circuit states from {self.path}")
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable circuit state file {self.path}: {str(e)}")
+
+    def save(self) -> None:
+        """Persist the circuit states."""
+        with self._lock:
+            self._persist_locked()
+
+    def _persist_locked(self) -> None:
+        """
+        Write the circuit states atomically; the lock must be held.
+
+        Write errors are logged rather than raised, as this runs while a
+        request error is being handled and must not replace that error.
+        """
+        if not self.path:
+            return
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({key: asdict(record) for key, record in self._records.items()}, f)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save circuit states to {self.path}: {str(e)}")
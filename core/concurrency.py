@@ -0,0 +1,176 @@
+"""
+Concurrency module for the Reddit Fetcher application.
+
+This module provides an AIMD (additive increase, multiplicative decrease)
+controller for the number of in-flight Reddit API requests.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional
+
+from utils.logger import get_logger
+from utils.metrics import MetricsRegistry
+
+logger = get_logger(__name__)
+
+class AdaptiveConcurrencyController:
+    """Limits in-flight requests, adapting the limit to latency and rate-limit feedback."""
+
+    DEFAULT_INITIAL_LIMIT = 4
+    DEFAULT_MIN_LIMIT = 1
+    DEFAULT_MAX_LIMIT = 16
+
+    # Multiplier applied to the limit on overload
+    DECREASE_FACTOR = 0.5
+    # Minimum time between two decreases, so one burst of errors counts once
+    DECREASE_COOLDOWN = 1.0  # seconds
+    # p95 latency above baseline * LATENCY_TOLERANCE counts as overload
+    LATENCY_TOLERANCE = 2.0
+    # Number of latency samples per p95 evaluation
+    LATENCY_WINDOW = 50
+    # How fast the latency baseline may drift upwards per evaluation
+    BASELINE_DRIFT = 0.05
+    # Remaining request quota below which the limit is no longer increased
+    LOW_QUOTA = 20
+
+    def __init__(self, initial_limit: Optional[int] = None,
+                 min_limit: Optional[int] = None,
+                 max_limit: Optional[int] = None,
+                 metrics: Optional[MetricsRegistry] = None):
+        """
+        Initialize the controller.
+
+        Args:
+            initial_limit: Starting number of concurrent requests
+            min_limit: Lowest limit the controller backs off to
+            max_limit: Highest limit the controller grows to
+            metrics: Metrics registry the current limit is published to (optional)
+        """
+        self.min_limit = min_limit or self.DEFAULT_MIN_LIMIT
+        self.max_limit = max_limit or self.DEFAULT_MAX_LIMIT
+        self._limit = float(min(max(initial_limit or self.DEFAULT_INITIAL_LIMIT, self.min_limit),
+                                self.max_limit))
+        self.metrics = metrics or MetricsRegistry()
+
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._successes = 0
+        self._last_decrease = float("-inf")
+        self._latencies: Deque[float] = deque(maxlen=self.LATENCY_WINDOW)
+        self._samples_since_check = 0
+        self._baseline: Optional[float] = None
+        self._latency_healthy = True
+        self._quota_remaining: Optional[float] = None
+        self._publish()
+
+    @property
+    def limit(self) -> int:
+        """Get the current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Get the number of requests currently in flight."""
+        return self._in_flight
+
+    def _publish(self) -> None:
+        """Publish the controller state to the metrics registry."""
+        self.metrics.set_gauge("concurrency.limit", int(self._limit))
+        self.metrics.set_gauge("concurrency.in_flight", self._in_flight)
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a free request slot.
+
+        Args:
+            timeout: Maximum number of seconds to wait (optional)
+
+        Returns:
+            bool: True if a slot was acquired
+        """
+        with self._condition:
+            acquired = self._condition.wait_for(lambda: self._in_flight < int(self._limit), timeout)
+            if acquired:
+                self._in_flight += 1
+                self._publish()
+            return acquired
+
+    def release(self, latency: Optional[float] = None, overloaded: bool = False) -> None:
+        """
+        Free a request slot and report the outcome of the request.
+
+        Args:
+            latency: Request latency in seconds if the request succeeded
+            overloaded: Whether the request failed with a rate limit or server error
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if overloaded:
+                self._decrease("overload")
+            elif latency is not None:
+                self._on_success(latency)
+            self._publish()
+            self._condition.notify_all()
+
+    def observe_quota(self, remaining: Optional[float]) -> None:
+        """
+        Report the remaining request quota announced by the API.
+
+        Args:
+            remaining: Remaining requests in the current rate-limit period
+        """
+        with self._condition:
+            self._quota_remaining = remaining
+            if remaining is not None and remaining < int(self._limit):
+                # Not even the requests in flight fit in the quota
+                self._decrease("quota exhausted")
+                self._publish()
+
+    def _on_success(self, latency: float) -> None:
+        """Record a successful request and grow the limit when healthy."""
+        self._latencies.append(latency)
+        self._samples_since_check += 1
+        if self._samples_since_check >= self.LATENCY_WINDOW:
+            self._samples_since_check = 0
+            self._check_latency()
+
+        quota_healthy = self._quota_remaining is None or self._quota_remaining >= self.LOW_QUOTA
+        if not (self._latency_healthy and quota_healthy):
+            return
+
+        # Additive increase: one extra slot per full window of successful requests
+        self._successes += 1
+        if self._successes >= int(self._limit) and self._limit < self.max_limit:
+            self._successes = 0
+            self._limit = min(self.max_limit, self._limit + 1)
+            self.metrics.increment("concurrency.increases")
+            logger.debug(f"Concurrency limit raised to {int(self._limit)}")
+
+    def _check_latency(self) -> None:
+        """Compare the recent p95 latency with the baseline."""
+        ordered = sorted(self._latencies)
+        p95 = ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+        self.metrics.set_gauge("concurrency.p95_latency", p95)
+
+        if self._baseline is None:
+            self._baseline = p95
+            return
+
+        self._latency_healthy = p95 <= self._baseline * self.LATENCY_TOLERANCE
+        if not self._latency_healthy:
+            self._decrease(f"p95 latency {p95:.3f}s above baseline {self._baseline:.3f}s")
+        self._baseline = min(p95, self._baseline * (1 + self.BASELINE_DRIFT))
+
+    def _decrease(self, reason: str) -> None:
+        """Shrink the limit multiplicatively, at most once per cooldown period."""
+        now = time.monotonic()
+        if now - self._last_decrease < self.DECREASE_COOLDOWN:
+            return
+
+        self._last_decrease = now
+        self._successes = 0
+        self._limit = max(self.min_limit, int(self._limit * self.DECREASE_FACTOR))
+        self.metrics.increment("concurrency.decreases")
+        logger.info(f"Concurrency limit lowered to {int(self._limit)} ({reason})")
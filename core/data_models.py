@@ -4,10 +4,28 @@ Data Models module for the Reddit Fetcher application.
 This module defines data structures for Reddit posts and other entities.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+from core.text_storage import SelftextField, make_preview
+
+
+@dataclass
+class LinkMetadata:
+    """Metadata of the page a link post points to."""
+    
+    url: str
+    final_url: Optional[str] = None
+    status: Optional[int] = None
+    content_type: Optional[str] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    thumbnail_url: Optional[str] = None
+    thumbnail_sha256: Optional[str] = None  # key of the thumbnail in the disk cache
+    fetched_at: Optional[float] = None
+    error: Optional[str] = None
+
 
 @dataclass
 class RedditPost:
@@ -23,7 +41,21 @@ class RedditPost:
     created_utc: float
     num_comments: int
     is_self: bool
-    selftext: Optional[str] = None
+    # Kept as configured with core.text_storage.set_text_storage()
+    selftext: Optional[str] = SelftextField()
+    subreddit: Optional[str] = None
+    # Share of the votes that are upvotes, as reported by Reddit
+    upvote_ratio: Optional[float] = None
+    # Filled in by the optional link enrichment stage
+    link: Optional[LinkMetadata] = field(default=None, compare=False, repr=False)
+    
+    @property
+    def selftext_preview(self) -> str:
+        """Get a short preview of the selftext without decompressing it."""
+        stored = self.__dict__.get('_selftext')
+        if stored is None or isinstance(stored, str):
+            return make_preview(stored)
+        return stored.preview
     
     @property
     def created_datetime(self) -> datetime:
@@ -52,5 +84,7 @@ class RedditPost:
             created_utc=submission.created_utc,
             num_comments=submission.num_comments,
             is_self=submission.is_self,
-            selftext=submission.selftext if submission.is_self else None
+            selftext=submission.selftext if submission.is_self else None,
+            subreddit=submission.subreddit.display_name if getattr(submission, 'subreddit', None) else None,
+            upvote_ratio=getattr(submission, 'upvote_ratio', None)
         )
@@ -0,0 +1,308 @@
+"""
+Pipeline module for the Reddit Fetcher application.
+
+This module runs a chain of stages (for example fetch, convert, process and
+render) concurrently. Each stage has its own worker threads and reads from a
+bounded queue, so a slow stage blocks the stages feeding it instead of
+letting work pile up in memory. Per-stage throughput, busy time, time spent
+blocked on a full downstream queue and queue depths are recorded.
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Marks the end of the items flowing into a queue
+_DONE = object()
+
+
+class _Cancelled(Exception):
+    """Raised inside workers once the pipeline is aborted."""
+
+
+@dataclass
+class StageStats:
+    """Counters of a single pipeline stage."""
+
+    name: str
+    workers: int
+    items_in: int = 0
+    items_out: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0  # time spent in the stage function, summed over workers
+    blocked_seconds: float = 0.0  # time spent waiting for room in the downstream queue
+    max_queue_depth: int = 0
+    queue_depth_sum: int = 0
+    started: Optional[float] = None
+    finished: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        """Get the wall time between the first item and the end of the stage."""
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Get the output items per second of wall time."""
+        elapsed = self.elapsed
+        return self.items_out / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def mean_queue_depth(self) -> float:
+        """Get the mean depth of the input queue seen by the workers."""
+        return self.queue_depth_sum / self.items_in if self.items_in else 0.0
+
+
+class Stage:
+    """A step of a pipeline: a function applied to every item by one or more workers."""
+
+    def __init__(self, name: str, func: Callable[[Any], Any], workers: int = 1,
+                 queue_size: Optional[int] = None, flatten: bool = False,
+                 on_error: Optional[Callable[[Any, Exception], None]] = None):
+        """
+        Initialize the stage.
+
+        The function returns the item passed downstream; None drops the
+        item. With flatten, it returns an iterable of items instead.
+
+        Args:
+            name: Stage name used in the stats
+            func: Function applied to each input item
+            workers: Number of worker threads
+            queue_size: Capacity of the input queue (pipeline default if omitted)
+            flatten: Whether func returns several items per input
+            on_error: Called with the item and the exception when func raises;
+                its return value replaces the result of func, so returning None
+                drops the item, and raising aborts the pipeline (by default
+                every error aborts it)
+
+        Raises:
+            ValueError: If workers is not positive
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.queue_size = queue_size
+        self.flatten = flatten
+        self.on_error = on_error
+
+
+class Pipeline:
+    """Runs stages concurrently, connected by bounded queues."""
+
+    DEFAULT_QUEUE_SIZE = 100  # items buffered in front of each stage
+    POLL_INTERVAL = 0.1  # seconds between checks for cancellation while blocked
+
+    def __init__(self, stages: List[Stage], queue_size: Optional[int] = None):
+        """
+        Initialize the pipeline.
+
+        Args:
+            stages: Stages in order
+            queue_size: Default capacity of the queues between stages
+
+        Raises:
+            ValueError: If there are no stages
+        """
+        if not stages:
+            raise ValueError("a pipeline needs at least one stage")
+        self.stages = stages
+        self.queue_size = queue_size or self.DEFAULT_QUEUE_SIZE
+        self.stats = [StageStats(stage.name, stage.workers) for stage in stages]
+        self._cancel = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+
+    def run(self, items: Iterable[Any]) -> Iterator[Any]:
+        """
+        Feed items through the stages and yield the output of the last one.
+
+        Output comes out in completion order; with one worker per stage it
+        keeps the input order. The caller consuming the output is the final
+        stage: if it falls behind, the pipeline slows down to match. Closing
+        the iterator early cancels the pipeline.
+
+        Args:
+            items: Input items of the first stage
+
+        Yields:
+            Any: Output items of the last stage
+
+        Raises:
+            Exception: The first error not handled by a stage's on_error
+        """
+        self._cancel.clear()
+        self._error = None
+        queues = [queue.Queue(stage.queue_size or self.queue_size) for stage in self.stages]
+        queues.append(queue.Queue(self.queue_size))
+
+        threads = [threading.Thread(target=self._feed, args=(items, queues[0]),
+                                    name="pipeline-feed", daemon=True)]
+        for index, stage in enumerate(self.stages):
+            remaining = [stage.workers]
+            for number in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._work, args=(index, queues[index], queues[index + 1], remaining),
+                    name=f"pipeline-{stage.name}-{number}", daemon=True
+                ))
+        for thread in threads:
+            thread.start()
+
+        output = queues[-1]
+        try:
+            while True:
+                item = self._get(output)
+                if item is _DONE:
+                    break
+                yield item
+        except _Cancelled:
+            pass
+        finally:
+            # Also reached when the consumer stops early
+            self._cancel.set()
+            for thread in threads:
+                thread.join()
+
+        if self._error is not None:
+            raise self._error
+
+    def _abort(self, error: BaseException) -> None:
+        """Record the first fatal error and stop all workers."""
+        with self._lock:
+            if self._error is None:
+                self._error = error
+        self._cancel.set()
+
+    def _put(self, target: queue.Queue, item: Any) -> float:
+        """Put an item, waiting for room; returns the seconds spent blocked."""
+        try:
+            target.put_nowait(item)
+            return 0.0
+        except queue.Full:
+            pass
+        start = time.perf_counter()
+        while True:
+            if self._cancel.is_set():
+                raise _Cancelled()
+            try:
+                target.put(item, timeout=self.POLL_INTERVAL)
+                return time.perf_counter() - start
+            except queue.Full:
+                continue
+
+    def _get(self, source: queue.Queue) -> Any:
+        """Get an item, waiting until one is available."""
+        while True:
+            if self._cancel.is_set():
+                raise _Cancelled()
+            try:
+                return source.get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                continue
+
+    def _feed(self, items: Iterable[Any], target: queue.Queue) -> None:
+        """Put the input items into the first queue."""
+        try:
+            for item in items:
+                self._put(target, item)
+            self._put(target, _DONE)
+        except _Cancelled:
+            pass
+        except Exception as e:
+            logger.error(f"Pipeline input failed: {str(e)}")
+            self._abort(e)
+
+    def _work(self, index: int, source: queue.Queue, target: queue.Queue, remaining: List[int]) -> None:
+        """Worker loop of a stage."""
+        stage = self.stages[index]
+        stats = self.stats[index]
+        try:
+            while True:
+                item = self._get(source)
+                if item is _DONE:
+                    # Let the other workers of this stage see the end too
+                    self._put(source, _DONE)
+                    break
+
+                depth = source.qsize()
+                start = time.perf_counter()
+                with self._lock:
+                    if stats.started is None:
+                        stats.started = start
+                    stats.items_in += 1
+                    stats.queue_depth_sum += depth
+                    stats.max_queue_depth = max(stats.max_queue_depth, depth)
+
+                try:
+                    outputs = self._outputs(stage, stage.func(item))
+                except Exception as e:
+                    with self._lock:
+                        stats.errors += 1
+                    if stage.on_error is None:
+                        raise
+                    outputs = self._outputs(stage, stage.on_error(item, e))
+
+                busy = time.perf_counter() - start
+                blocked = 0.0
+                emitted = 0
+                for output in outputs:
+                    if output is not None:
+                        blocked += self._put(target, output)
+                        emitted += 1
+                with self._lock:
+                    stats.busy_seconds += busy
+                    stats.blocked_seconds += blocked
+                    stats.items_out += emitted
+        except _Cancelled:
+            return
+        except Exception as e:
+            logger.error(f"Pipeline stage {stage.name} failed: {str(e)}")
+            self._abort(e)
+            return
+
+        with self._lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+            if last:
+                stats.finished = time.perf_counter()
+        if last:
+            try:
+                self._put(target, _DONE)
+            except _Cancelled:
+                pass
+
+    @staticmethod
+    def _outputs(stage: Stage, result: Any) -> List[Any]:
+        """Turn the return value of a stage function into the items it emits."""
+        if stage.flatten:
+            return list(result) if result is not None else []
+        return [result]
+
+    def report(self) -> str:
+        """
+        Format the per-stage statistics.
+
+        Returns:
+            str: Table of stages with item counts, busy and blocked seconds,
+                throughput and input queue depths
+        """
+        lines = [f"{'stage':<10} {'workers':>7} {'in':>7} {'out':>7} {'errors':>6} "
+                 f"{'busy':>8} {'blocked':>8} {'items/s':>9} {'queue':>6} {'max':>5}"]
+        with self._lock:
+            for stats in self.stats:
+                lines.append(
+                    f"{stats.name:<10} {stats.workers:>7} {stats.items_in:>7} {stats.items_out:>7} "
+                    f"{stats.errors:>6} {stats.busy_seconds:>8.3f} {stats.blocked_seconds:>8.3f} "
+                    f"{stats.throughput:>9.1f} {stats.mean_queue_depth:>6.1f} {stats.max_queue_depth:>5}"
+                )
+        return "\n".join(lines)
@@ -0,0 +1,251 @@
+"""
+Text Storage module for the Reddit Fetcher application.
+
+This module decides how RedditPost.selftext is held in memory: as a plain
+str, compressed with zlib or zstd, or as a reference into an on-disk text
+heap. Compressed and on-disk bodies are only decoded when selftext is read;
+a short preview is kept alongside for rendering.
+"""
+
+import tempfile
+import threading
+import zlib
+from typing import Optional, Union
+
+from utils.error_handler import ConfigurationError
+from utils.logger import get_logger
+
+try:
+    import zstandard
+except ImportError:  # zstandard is an optional dependency
+    zstandard = None
+
+logger = get_logger(__name__)
+
+PREVIEW_LENGTH = 200
+
+def make_preview(text: Optional[str]) -> str:
+    """
+    Build the short preview of a post body shown by the console formatter.
+
+    Args:
+        text: Post body
+
+    Returns:
+        str: Stripped body, truncated to PREVIEW_LENGTH characters with "..."
+    """
+    text = (text or "").strip()
+    if len(text) > PREVIEW_LENGTH:
+        text = text[:PREVIEW_LENGTH - 3] + "..."
+    return text
+
+
+class CompressedText:
+    """A post body held compressed, decoded on every access."""
+
+    __slots__ = ('_data', '_codec', 'preview')
+
+    def __init__(self, data: bytes, codec: str, preview: str):
+        self._data = data
+        self._codec = codec
+        self.preview = preview
+
+    @property
+    def text(self) -> str:
+        """Decompress the body."""
+        if self._codec == "zstd":
+            return zstandard.ZstdDecompressor().decompress(self._data).decode('utf-8')
+        return zlib.decompress(self._data).decode('utf-8')
+
+    def __reduce__(self):
+        # Pickle the decoded text so copies do not depend on the codec being installed
+        return (str, (self.text,))
+
+
+class HeapText:
+    """A post body stored in a TextHeap file, read on every access."""
+
+    __slots__ = ('_heap', '_offset', '_length', 'preview')
+
+    def __init__(self, heap: "TextHeap", offset: int, length: int, preview: str):
+        self._heap = heap
+        self._offset = offset
+        self._length = length
+        self.preview = preview
+
+    @property
+    def text(self) -> str:
+        """Read the body from the heap file."""
+        return self._heap.read(self._offset, self._length)
+
+    def __reduce__(self):
+        # Heap offsets are meaningless in another process; pickle the text itself
+        return (str, (self.text,))
+
+
+StoredText = Union[str, CompressedText, HeapText]
+
+
+class TextStorage:
+    """Keeps post bodies as plain strings (the default)."""
+
+    def store(self, text: Optional[str]) -> Optional[StoredText]:
+        """
+        Convert a post body to its stored form.
+
+        Args:
+            text: Post body
+
+        Returns:
+            Optional[StoredText]: Value kept on the post
+        """
+        return text
+
+
+class CompressedTextStorage(TextStorage):
+    """Keeps long post bodies compressed in memory."""
+
+    CODECS = ("zlib", "zstd")
+    DEFAULT_MIN_LENGTH = 512  # shorter bodies are not worth compressing
+
+    def __init__(self, codec: str = "zlib", min_length: Optional[int] = None, level: Optional[int] = None):
+        """
+        Initialize the storage.
+
+        Args:
+            codec: Compression codec (zlib or zstd)
+            min_length: Minimum body length in characters that gets compressed
+            level: Compression level (codec default if omitted)
+
+        Raises:
+            ConfigurationError: If the codec is unknown or not installed
+        """
+        if codec not in self.CODECS:
+            raise ConfigurationError(f"Unsupported text codec: {codec}")
+        if codec == "zstd" and zstandard is None:
+            raise ConfigurationError("zstd text compression requires zstandard (pip install zstandard)")
+        self.codec = codec
+        self.min_length = self.DEFAULT_MIN_LENGTH if min_length is None else min_length
+        if codec == "zstd":
+            self._compress = zstandard.ZstdCompressor(level=level or 3).compress
+        else:
+            self._compress = lambda data: zlib.compress(data, 6 if level is None else level)
+
+    def store(self, text: Optional[str]) -> Optional[StoredText]:
+        if text is None or len(text) < self.min_length:
+            return text
+        return CompressedText(self._compress(text.encode('utf-8')), self.codec, make_preview(text))
+
+
+class TextHeap(TextStorage):
+    """Keeps long post bodies in an append-only file and only their offsets in memory."""
+
+    DEFAULT_MIN_LENGTH = 512
+
+    def __init__(self, path: Optional[str] = None, min_length: Optional[int] = None):
+        """
+        Initialize the heap.
+
+        Args:
+            path: Heap file path (defaults to an anonymous temporary file)
+            min_length: Minimum body length in characters that goes to the heap
+        """
+        self.path = path
+        self.min_length = self.DEFAULT_MIN_LENGTH if min_length is None else min_length
+        self._file = open(path, 'w+b') if path else tempfile.TemporaryFile()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def store(self, text: Optional[str]) -> Optional[StoredText]:
+        if text is None or len(text) < self.min_length:
+            return text
+        data = text.encode('utf-8')
+        with self._lock:
+            offset = self._size
+            self._file.seek(offset)
+            self._file.write(data)
+            self._size += len(data)
+        return HeapText(self, offset, len(data), make_preview(text))
+
+    def read(self, offset: int, length: int) -> str:
+        """
+        Read a body back from the heap.
+
+        Args:
+            offset: Byte offset of the body
+            length: Byte length of the body
+
+        Returns:
+            str: The body
+        """
+        with self._lock:
+            self._file.seek(offset)
+            return self._file.read(length).decode('utf-8')
+
+    @property
+    def size(self) -> int:
+        """Get the number of bytes written to the heap."""
+        return self._size
+
+    def close(self) -> None:
+        """Close the heap file; posts referencing it can no longer be read."""
+        self._file.close()
+
+
+STORAGE_MODES = ("plain", "zlib", "zstd", "heap")
+
+def create_text_storage(mode: str) -> TextStorage:
+    """
+    Create a text storage by name.
+
+    Args:
+        mode: plain, zlib, zstd or heap
+
+    Returns:
+        TextStorage: The storage
+
+    Raises:
+        ConfigurationError: If the mode is unknown or its codec is not installed
+    """
+    if mode == "plain":
+        return TextStorage()
+    if mode == "heap":
+        return TextHeap()
+    if mode in CompressedTextStorage.CODECS:
+        return CompressedTextStorage(mode)
+    raise ConfigurationError(f"Unsupported selftext storage: {mode}")
+
+
+_storage: TextStorage = TextStorage()
+
+def get_text_storage() -> TextStorage:
+    """Get the storage new posts keep their selftext in."""
+    return _storage
+
+def set_text_storage(storage: Optional[TextStorage]) -> None:
+    """
+    Choose how new posts keep their selftext; existing posts are unchanged.
+
+    Args:
+        storage: TextStorage, CompressedTextStorage or TextHeap (None resets to plain strings)
+    """
+    global _storage
+    _storage = storage or TextStorage()
+    logger.debug(f"Selftext storage set to {type(_storage).__name__}")
+
+
+class SelftextField:
+    """Descriptor storing RedditPost.selftext through the configured text storage."""
+
+    def __set_name__(self, owner, name):
+        self._attribute = f"_{name}"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            # Class access returns the dataclass default
+            return None
+        value = instance.__dict__.get(self._attribute)
+        return value if value is None or isinstance(value, str) else value.text
+
+    def __set__(self, instance, value):
+        instance.__dict__[self._attribute] = _storage.store(value)
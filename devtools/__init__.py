@@ -0,0 +1,3 @@
+"""
+Developer tools package for the Reddit Fetcher application.
+"""
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Reddit API stand-in server for load testing.
+
+This module serves synthetic Reddit API responses over HTTP so the real
+PRAW/HTTP path of the fetcher can be exercised without touching Reddit.
+It implements the OAuth token endpoint, subreddit listings, /api/info and
+/api/morechildren, with configurable latency, error rates and
+X-Ratelimit-* headers.
+
+Point the fetcher at it with REDDIT_BASE_URL, e.g.:
+    python -m devtools.reddit_stub --port 8080 --latency 0.05 --error-rate 0.01
+    REDDIT_BASE_URL=http://127.0.0.1:8080 python main.py -s python
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+LISTING_SORTS = ("new", "hot", "rising", "top", "controversial")
+MAX_LISTING_POSTS = 1000  # like Reddit, listings end after 1000 posts
+
+def _stable_int(text: str, modulo: int) -> int:
+    """Derive a deterministic integer from a string."""
+    return int(hashlib.sha1(text.encode('utf-8')).hexdigest()[:12], 16) % modulo
+
+def _to_base36(number: int) -> str:
+    """Encode a non-negative integer in base 36, like Reddit ids."""
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    result = ""
+    while True:
+        number, remainder = divmod(number, 36)
+        result = digits[remainder] + result
+        if number == 0:
+            return result
+
+
+class StubState:
+    """Configuration and shared counters of a stub server."""
+
+    def __init__(self, latency: float = 0.0, latency_jitter: float = 0.0,
+                 error_rate: float = 0.0, rate_limit: int = 600,
+                 rate_limit_period: float = 600.0, seed: Optional[int] = None):
+        """
+        Initialize the stub state.
+
+        Args:
+            latency: Base response delay in seconds
+            latency_jitter: Maximum extra random delay in seconds
+            error_rate: Fraction of API requests answered with a 5xx error
+            rate_limit: Requests allowed per rate-limit period before 429s
+            rate_limit_period: Length of the rate-limit period in seconds
+            seed: Random seed for reproducible latency and errors
+        """
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.rate_limit_period = rate_limit_period
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.period_start = time.time()
+        self.used = 0
+        self.requests: Dict[str, int] = {}
+        # (listing, after fullname) -> position of the next page
+        self.cursors: Dict[Tuple[str, str], int] = {}
+
+    def take_quota(self) -> Tuple[bool, float, float]:
+        """
+        Count a request against the rate limit.
+
+        Returns:
+            Tuple[bool, float, float]: Whether the request is allowed, the
+                remaining quota and the seconds until the period resets
+        """
+        with self.lock:
+            now = time.time()
+            if now - self.period_start >= self.rate_limit_period:
+                self.period_start = now
+                self.used = 0
+            self.used += 1
+            remaining = max(0, self.rate_limit - self.used)
+            reset = self.period_start + self.rate_limit_period - now
+            return self.used <= self.rate_limit, remaining, reset
+
+    def count(self, endpoint: str) -> None:
+        """Count a request per endpoint."""
+        with self.lock:
+            self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+
+
+def make_post(subreddit: str, index: int, now: float) -> Dict[str, Any]:
+    """
+    Generate the data of a synthetic submission.
+
+    Args:
+        subreddit: Subreddit name
+        index: Position of the post in the subreddit's new listing (0 = newest)
+        now: Reference Unix time
+
+    Returns:
+        Dict[str, Any]: Submission data in Reddit's t3 format
+    """
+    return post_data(post_id_at(subreddit, index), subreddit, now - index * 60)
+
+def post_id_at(subreddit: str, index: int) -> str:
+    """
+    Get the id of the post at a position of a subreddit's new listing.
+
+    Args:
+        subreddit: Subreddit name
+        index: Position of the post (0 = newest)
+
+    Returns:
+        str: Post id without prefix
+    """
+    return _to_base36(_stable_int(f"{subreddit}:{index}", 36 ** 7))
+
+def post_data(post_id: str, subreddit: str, created_utc: float) -> Dict[str, Any]:
+    """
+    Generate the data of a synthetic submission with a known id.
+
+    Args:
+        post_id: Post id without prefix
+        subreddit: Subreddit name
+        created_utc: Creation time
+
+    Returns:
+        Dict[str, Any]: Submission data in Reddit's t3 format
+    """
+    seed = _stable_int(post_id, 1 << 30)
+    is_self = seed % 3 == 0
+    score = seed % 5000
+    permalink = f"/r/{subreddit}/comments/{post_id}/synthetic_post/"
+    return {
+        'id': post_id,
+        'name': f"t3_{post_id}",
+        'title': f"Synthetic post {post_id} in r/{subreddit}",
+        'author': f"user{seed % 1000}",
+        'subreddit': subreddit,
+        'subreddit_name_prefixed': f"r/{subreddit}",
+        'ups': score,
+        'downs': 0,
+        'score': score,
+        # Like Reddit, listings hide downvotes and only report the ratio
+        'upvote_ratio': (51 + _stable_int(post_id + ":ratio", 50)) / 100,
+        'num_comments': seed % 300,
+        'created_utc': float(int(created_utc)),
+        'is_self': is_self,
+        'selftext': f"Body of synthetic post {post_id}. " * 5 if is_self else "",
+        'url': f"https://www.reddit.com{permalink}" if is_self else f"https://example.com/{post_id}",
+        'permalink': permalink,
+        'over_18': False,
+        'stickied': False,
+    }
+
+def listing(children: List[Dict[str, Any]], after: Optional[str],
+            before: Optional[str] = None) -> Dict[str, Any]:
+    """Wrap things in Reddit's Listing envelope."""
+    return {'kind': 'Listing', 'data': {'after': after, 'before': before, 'dist': len(children),
+                                       'children': children}}
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Handles requests against the stub API."""
+
+    server_version = "RedditStub/1.0"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def state(self) -> StubState:
+        return self.server.state
+
+    def log_message(self, format, *args):
+        logger.debug("stub: " + format % args)
+
+    def _send_json(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        """Send a JSON response."""
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=UTF-8')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _read_form(self) -> Dict[str, List[str]]:
+        """Read a form-encoded request body."""
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode('utf-8') if length else ""
+        return parse_qs(body)
+
+    def do_POST(self):
+        parsed = urlparse(self.path)
+        form = self._read_form()
+        if parsed.path == '/api/v1/access_token':
+            self.state.count('access_token')
+            self._send_json(200, {'access_token': 'stub-token', 'token_type': 'bearer',
+                                  'expires_in': 3600, 'scope': '*'})
+        elif parsed.path == '/api/v1/revoke_token':
+            self._send_json(204, {})
+        else:
+            self._handle_api(parsed.path, form)
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        self._handle_api(parsed.path, parse_qs(parsed.query))
+
+    def _handle_api(self, path: str, params: Dict[str, List[str]]) -> None:
+        """Apply latency, errors and rate limits, then dispatch an API request."""
+        state = self.state
+        delay = state.latency + state.random.uniform(0, state.latency_jitter)
+        if delay:
+            time.sleep(delay)
+
+        allowed, remaining, reset = state.take_quota()
+        headers = {
+            'X-Ratelimit-Remaining': f"{remaining:.1f}",
+            'X-Ratelimit-Used': str(state.used),
+            'X-Ratelimit-Reset': str(int(reset)),
+        }
+        if not allowed:
+            state.count('429')
+            self._send_json(429, {'message': 'Too Many Requests', 'error': 429}, headers)
+            return
+        if state.error_rate and state.random.random() < state.error_rate:
+            state.count('5xx')
+            self._send_json(503, {'message': 'Service Unavailable', 'error': 503}, headers)
+            return
+
+        body = self._dispatch(path.rstrip('/'), params)
+        if body is None:
+            self._send_json(404, {'message': 'Not Found', 'error': 404}, headers)
+        else:
+            self._send_json(200, body, headers)
+
+    def _dispatch(self, path: str, params: Dict[str, List[str]]) -> Optional[Any]:
+        """Build the body of an API response, or None for unknown paths."""
+        parts = [part for part in path.split('/') if part]
+        now = time.time()
+
+        if parts == ['api', 'v1', 'me']:
+            self.state.count('me')
+            return {'name': 'stub_user', 'id': 'stub'}
+
+        if parts == ['api', 'info']:
+            self.state.count('info')
+            ids = ",".join(params.get('id', [])).split(',')
+            children = []
+            for fullname in filter(None, ids):
+                post_id = fullname.split('_', 1)[-1]
+                created = now - _stable_int(post_id, 86400)
+                children.append({'kind': 't3', 'data': post_data(post_id, 'stub', created)})
+            return listing(children, None)
+
+        if parts == ['api', 'morechildren']:
+            self.state.count('morechildren')
+            link_id = params.get('link_id', ['t3_unknown'])[0]
+            children = params.get('children', [''])[0].split(',')
+            things = [
+                {'kind': 't1', 'data': {
+                    'id': child, 'name': f"t1_{child}", 'link_id': link_id,
+                    'parent_id': link_id, 'body': f"Synthetic comment {child}",
+                    'author': f"user{_stable_int(child, 1000)}", 'score': _stable_int(child, 100),
+                    'created_utc': now, 'replies': '',
+                }}
+                for child in children if child
+            ]
+            return {'json': {'errors': [], 'data': {'things': things}}}
+
+        if len(parts) == 3 and parts[0] == 'r' and parts[2] in LISTING_SORTS:
+            self.state.count(parts[2])
+            return self._subreddit_listing(parts[1], params, now)
+
+        return None
+
+    def _subreddit_listing(self, name: str, params: Dict[str, List[str]], now: float) -> Dict[str, Any]:
+        """Build a listing page for one subreddit or an a+b+c multireddit."""
+        limit = min(100, int(params.get('limit', ['25'])[0]))
+        after = params.get('after', [None])[0]
+        before = params.get('before', [None])[0]
+        subreddits = name.split('+')
+
+        def page(start: int, end: int) -> List[Dict[str, Any]]:
+            return [
+                {'kind': 't3', 'data': make_post(subreddits[index % len(subreddits)],
+                                                 index // len(subreddits), now)}
+                for index in range(start, end)
+            ]
+
+        if before and not after:
+            # The posts just newer than the cursor, as one page; like Reddit,
+            # an unknown cursor gives an empty listing
+            position = self._listing_position(name, before)
+            if position is None:
+                return listing([], None)
+            start = max(0, position - limit)
+            children = page(start, position)
+            return listing(children, None, children[0]['data']['name'] if start > 0 else None)
+
+        start = self.state.cursors.get((name.lower(), after), 0) if after else 0
+        children = page(start, start + limit)
+
+        # Listings are effectively endless; stop after 1000 posts like Reddit does
+        next_after = None
+        if children and start + limit < MAX_LISTING_POSTS:
+            next_after = children[-1]['data']['name']
+            with self.state.lock:
+                self.state.cursors[(name.lower(), next_after)] = start + limit
+        return listing(children, next_after)
+
+    def _listing_position(self, name: str, fullname: str) -> Optional[int]:
+        """Find the position of a post in a subreddit or multireddit listing."""
+        with self.state.lock:
+            next_position = self.state.cursors.get((name.lower(), fullname))
+        if next_position is not None:
+            return next_position - 1
+        subreddits = name.split('+')
+        for index in range(MAX_LISTING_POSTS):
+            post_id = post_id_at(subreddits[index % len(subreddits)], index // len(subreddits))
+            if fullname == f"t3_{post_id}":
+                return index
+        return None
+
+
+class RedditStubServer:
+    """Runs the stub API in a background thread of the current process."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, **options):
+        """
+        Initialize the server.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            **options: StubState options (latency, latency_jitter, error_rate,
+                rate_limit, rate_limit_period, seed)
+        """
+        self.httpd = ThreadingHTTPServer((host, port), StubRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = StubState(**options)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def state(self) -> StubState:
+        """Get the shared state of the server."""
+        return self.httpd.state
+
+    @property
+    def base_url(self) -> str:
+        """Get the base URL to point the client at."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "RedditStubServer":
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="reddit-stub", daemon=True)
+        self._thread.start()
+        logger.info(f"Reddit stub server listening on {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+
+def main():
+    """Run the stub server in the foreground."""
+    parser = argparse.ArgumentParser(description='Serve a synthetic Reddit API for load testing')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8080, help='Port to bind (default: 8080)')
+    parser.add_argument('--latency', type=float, default=0.0, help='Base response delay in seconds')
+    parser.add_argument('--latency-jitter', type=float, default=0.0, help='Maximum extra random delay')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 503')
+    parser.add_argument('--rate-limit', type=int, default=600, help='Requests per period before 429s')
+    parser.add_argument('--rate-limit-period', type=float, default=600.0, help='Rate-limit period in seconds')
+    parser.add_argument('--seed', type=int, help='Random seed for latency and errors')
+    args = parser.parse_args()
+
+    server = RedditStubServer(
+        args.host, args.port, latency=args.latency, latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate, rate_limit=args.rate_limit,
+        rate_limit_period=args.rate_limit_period, seed=args.seed
+    )
+    print(f"Serving synthetic Reddit API on {server.base_url} (Ctrl+C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+if __name__ == "__main__":
+    main()
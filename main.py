@@ -7,24 +7,169 @@ It demonstrates API authentication, data fetching, and proper error handling.
 """
 
 import argparse
+import itertools
 import sys
 from config.settings import Settings
+from core.api_client import RedditClient
 from core.auth import RedditAuthenticator
+from core.circuit_breaker import CircuitBreakerRegistry
+from core.pipeline import Pipeline, Stage
+from core.text_storage import create_text_storage, set_text_storage
+from services.link_enricher import LinkEnricher
+from services.post_service import PostService
+from services.query import F, Query
 from services.reddit_service import RedditService
+from storage.snapshot import SnapshotManager
 from presentation.console_formatter import ConsoleFormatter
+from presentation.sinks import SinkFanOut, create_sink
+from utils.bloom_filter import SeenIdFilter
 from utils.logger import get_logger
-from utils.error_handler import handle_application_error
+from utils.error_handler import PartialFetchError, handle_application_error
+from utils.profiler import ProfileSession, StageTimer
 
 logger = get_logger(__name__)
 
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description='Fetch latest posts from a subreddit')
-    parser.add_argument('--subreddit', '-s', type=str, help='Subreddit name to fetch posts from')
+    parser.add_argument('--subreddit', '-s', type=str,
+                        help='Subreddit name to fetch posts from (several may be separated by commas)')
     parser.add_argument('--limit', '-l', type=int, default=5, help='Number of posts to fetch (default: 5)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose logging')
+    parser.add_argument('--compact', '-c', action='store_true', help='Show one line per post')
+    parser.add_argument('--workers', '-w', type=int, default=1,
+                        help='Subreddits fetched concurrently (default: 1, which keeps subreddit order)')
+    parser.add_argument('--min-upvotes', type=int, help='Only show posts with at least this many upvotes')
+    parser.add_argument('--min-comments', type=int, help='Only show posts with at least this many comments')
+    parser.add_argument('--search', type=str, help='Only show posts whose title or text contains this text')
+    parser.add_argument('--enrich-links', action='store_true',
+                        help='Resolve link posts to their page title and description')
+    parser.add_argument('--sink', action='append', default=[], metavar='SPEC',
+                        help='Also write posts to a sink: an NDJSON file path, sqlite:<path> '
+                             'or an http(s) webhook URL (may be repeated)')
+    parser.add_argument('--new-only', action='store_true',
+                        help='Only show posts published since the previous run')
+    parser.add_argument('--cold', action='store_true',
+                        help='Ignore the saved state snapshot and start cold')
+    parser.add_argument('--profile', action='store_true',
+                        help='Profile the run and print a per-stage time breakdown')
+    parser.add_argument('--profile-mode', choices=ProfileSession.MODES, default='cprofile',
+                        help='Profiler used with --profile (default: cprofile)')
+    parser.add_argument('--profile-output', type=str,
+                        help='Profile output file (default: reddit_fetcher.pstats, '
+                             'or reddit_fetcher.speedscope.json in sample mode)')
     return parser.parse_args()
 
+def build_query(args) -> Query:
+    """
+    Build the query posts must match from the filter arguments.
+    
+    Args:
+        args: Parsed command line arguments
+        
+    Returns:
+        Query: Query over the fetched posts (matches every post without filters)
+    """
+    query = Query()
+    if args.min_upvotes is not None:
+        query = query.where(F.upvotes >= args.min_upvotes)
+    if args.min_comments is not None:
+        query = query.where(F.comments >= args.min_comments)
+    if args.search:
+        query = query.text(args.search)
+    return query
+
+def saving_snapshots(posts, snapshots: SnapshotManager):
+    """
+    Pass posts through, saving the state snapshot periodically during long runs.
+    
+    Args:
+        posts: Posts coming out of the pipeline
+        snapshots: Snapshot manager of the run
+        
+    Yields:
+        RedditPost: The same posts
+    """
+    for post in posts:
+        yield post
+        snapshots.maybe_save()
+
+def run(args, settings: Settings, timer: StageTimer) -> int:
+    """
+    Authenticate, fetch, process and display posts.
+    
+    Args:
+        args: Parsed command line arguments
+        settings: Configured application settings
+        timer: Stage timer collecting per-stage wall time
+        
+    Returns:
+        int: Exit code
+    """
+    # Initialize authenticator
+    with timer.stage("auth"):
+        auth = RedditAuthenticator()
+        reddit_instance = auth.authenticate()
+    
+    # Initialize services
+    client = RedditClient(
+        reddit_instance,
+        circuit_breakers=CircuitBreakerRegistry(settings.circuit_state_file)
+    )
+    reddit_service = RedditService(reddit_instance, client=client, timer=timer)
+    
+    # Restore state saved by the previous run
+    snapshots = SnapshotManager(settings.snapshot_file)
+    snapshots.register("cursors", reddit_service, restore=not args.cold)
+    seen = SeenIdFilter()
+    snapshots.register("seen_ids", seen, restore=not args.cold)
+    
+    # Initialize presenters
+    formatter = ConsoleFormatter()
+    
+    # Fetch, convert, process, enrich and display posts as concurrent pipeline stages
+    subreddit_names = settings.subreddits
+    post_limit = settings.post_limit
+    failures = {}
+    stages = reddit_service.pipeline_stages("new", post_limit, workers=args.workers, failures=failures,
+                                            new_only=args.new_only, seen=seen)
+    stages.append(PostService().pipeline_stage(query=build_query(args), timer=timer))
+    enricher = LinkEnricher(cache_dir=settings.link_cache_dir) if args.enrich_links else None
+    if enricher is not None:
+        stages.append(enricher.pipeline_stage())
+    sinks = SinkFanOut([create_sink(spec) for spec in args.sink], settings.dead_letter_dir) if args.sink else None
+    if sinks is not None:
+        sinks.replay_dead_letters()
+        stages.append(Stage("sink", sinks.write))
+    pipeline = Pipeline(stages)
+    
+    logger.info(f"Fetching {post_limit} posts from r/{', r/'.join(subreddit_names)}")
+    try:
+        posts = saving_snapshots(pipeline.run(subreddit_names), snapshots)
+        first = next(posts, None)
+        if first is None and len(failures) == len(subreddit_names) == 1:
+            raise next(iter(failures.values()))
+        
+        # Rendering consumes the pipeline output while later subreddits are fetched
+        with timer.stage("render"):
+            formatter.display_posts(itertools.chain([first], posts) if first is not None else [],
+                                    compact=args.compact)
+    finally:
+        snapshots.save()
+        if enricher is not None:
+            enricher.close()
+        if sinks is not None:
+            sinks.close()
+        if args.profile:
+            print(pipeline.report(), file=sys.stderr)
+    
+    if failures:
+        succeeded = [name for name in subreddit_names if name not in failures]
+        raise PartialFetchError(succeeded, failures)
+    
+    logger.info("Process completed successfully")
+    return 0
+
 def main():
     """Main application entry point."""
     try:
@@ -39,28 +184,19 @@ def main():
             verbose=args.verbose
         )
         
-        # Initialize authenticator
-        auth = RedditAuthenticator()
-        reddit_instance = auth.authenticate()
-        
-        # Initialize services
-        reddit_service = RedditService(reddit_instance)
-        
-        # Initialize presenters
-        formatter = ConsoleFormatter()
-        
-        # Fetch and display posts
-        subreddit_name = settings.subreddit
-        post_limit = settings.post_limit
-        
-        logger.info(f"Fetching {post_limit} posts from r/{subreddit_name}")
-        posts = reddit_service.get_latest_posts(subreddit_name, post_limit)
-        
-        # Format and display results
-        formatter.display_posts(posts)
+        set_text_storage(create_text_storage(settings.text_storage))
         
-        logger.info("Process completed successfully")
-        return 0
+        timer = StageTimer()
+        if not args.profile:
+            return run(args, settings, timer)
+            
+        default_output = ("reddit_fetcher.pstats" if args.profile_mode == "cprofile"
+                          else "reddit_fetcher.speedscope.json")
+        try:
+            with ProfileSession(args.profile_output or default_output, args.profile_mode):
+                return run(args, settings, timer)
+        finally:
+            print(timer.report(), file=sys.stderr)
         
     except Exception as e:
         return handle_application_error(e)
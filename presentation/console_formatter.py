@@ -5,77 +5,208 @@ This module provides formatting and display utilities for console output.
 """
 
 import datetime
-from typing import List
+import sys
+from typing import Dict, Iterable, List, Optional, TextIO
 
 from core.data_models import RedditPost
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+BOLD = "\033[1m"
+RESET = "\033[0m"
+
 class ConsoleFormatter:
     """Formats and displays Reddit posts in the console."""
-    
+
+    # Number of posts rendered per write when displaying large result sets
+    CHUNK_SIZE = 1000
+    # Smaller chunks for posts streamed from a pipeline, so output shows up early
+    STREAM_CHUNK_SIZE = 50
+
+    # Maximum number of cached minute buckets for date formatting
+    MAX_DATE_CACHE = 4096
+
+    # Width of the title column in compact mode
+    COMPACT_TITLE_WIDTH = 60
+
+    def __init__(self, stream: Optional[TextIO] = None, color: Optional[bool] = None):
+        """
+        Initialize the console formatter.
+
+        Args:
+            stream: Output stream (defaults to sys.stdout at display time)
+            color: Whether to emit ANSI codes (defaults to whether the stream is a TTY)
+        """
+        self.stream = stream
+        self.color = color
+        self._date_cache: Dict[int, str] = {}
+
+    def _output(self) -> TextIO:
+        """Get the stream posts are written to."""
+        return self.stream if self.stream is not None else sys.stdout
+
+    def _use_color(self) -> bool:
+        """Check whether ANSI codes should be emitted."""
+        if self.color is not None:
+            return self.color
+        isatty = getattr(self._output(), "isatty", None)
+        return bool(isatty and isatty())
+
+    def format_date(self, created_utc: float) -> str:
+        """
+        Format a post timestamp, caching the formatted minute.
+
+        Args:
+            created_utc: Unix timestamp
+
+        Returns:
+            str: Local time formatted as YYYY-mm-dd HH:MM:SS
+        """
+        seconds = int(created_utc)
+        minute, second = divmod(seconds, 60)
+        prefix = self._date_cache.get(minute)
+        if prefix is None:
+            if len(self._date_cache) >= self.MAX_DATE_CACHE:
+                self._date_cache.clear()
+            # UTC offsets are whole minutes, so the minute prefix is shared by all its seconds
+            prefix = datetime.datetime.fromtimestamp(minute * 60).strftime("%Y-%m-%d %H:%M")
+            self._date_cache[minute] = prefix
+        return f"{prefix}:{second:02d}"
+
     def format_post(self, post: RedditPost, index: int = None) -> str:
         """
         Format a Reddit post for console display.
-        
+
         Args:
             post: The post to format
             index: Optional index for numbered lists
-            
+
         Returns:
             str: Formatted post string
         """
+        return self._format_post(post, index, self._use_color())
+
+    def _format_post(self, post: RedditPost, index: Optional[int], color: bool) -> str:
+        """Format a post with the color decision already made."""
         # Format the creation date
-        created_date = datetime.datetime.fromtimestamp(post.created_utc)
-        date_str = created_date.strftime("%Y-%m-%d %H:%M:%S")
-        
+        date_str = self.format_date(post.created_utc)
+
         # Format the post title with optional index
         if index is not None:
             title_line = f"{index}. {post.title}"
         else:
             title_line = post.title
-            
+
         # Build the formatted string
         lines = [
-            f"\033[1m{title_line}\033[0m",  # Bold title
+            f"{BOLD}{title_line}{RESET}" if color else title_line,  # Bold title
             f"Author: u/{post.author}",
             f"Upvotes: {post.upvotes} | Comments: {post.num_comments}",
             f"Posted: {date_str}",
             f"URL: {post.url}"
         ]
-        
+
+        # Add the linked page title when the post was enriched
+        if post.link is not None and post.link.title:
+            lines.append(f"Link: {post.link.title}")
+
         # Add post content for self posts (truncated if too long)
-        if post.is_self and post.selftext:
-            text = post.selftext.strip()
-            if len(text) > 200:
-                text = text[:197] + "..."
+        if post.is_self:
+            text = post.selftext_preview
             if text:
                 lines.append(f"\nContent: {text}")
-                
+
         return "\n".join(lines)
-    
-    def display_posts(self, posts: List[RedditPost]) -> None:
+
+    def format_compact(self, post: RedditPost, index: Optional[int] = None) -> str:
         """
-        Display a list of Reddit posts in the console.
-        
+        Format a post as a single table row.
+
         Args:
-            posts: List of posts to display
+            post: The post to format
+            index: Optional row number
+
+        Returns:
+            str: One-line post summary
         """
-        if not posts:
-            print("No posts found.")
-            return
-            
-        logger.info(f"Displaying {len(posts)} posts")
-        
+        title = post.title.replace("\n", " ")
+        if len(title) > self.COMPACT_TITLE_WIDTH:
+            title = title[:self.COMPACT_TITLE_WIDTH - 3] + "..."
+        number = f"{index:>5} " if index is not None else ""
+        return (f"{number}{post.upvotes:>7} {post.num_comments:>6} "
+                f"{self.format_date(post.created_utc)} "
+                f"{post.author[:20]:<20} {title}")
+
+    def compact_header(self, numbered: bool = True) -> str:
+        """Get the header line of the compact table."""
+        number = f"{'#':>5} " if numbered else ""
+        return (f"{number}{'UPS':>7} {'CMTS':>6} {'POSTED':<19} "
+                f"{'AUTHOR':<20} TITLE")
+
+    def render_posts(self, posts: List[RedditPost], compact: bool = False) -> str:
+        """
+        Render a list of posts into a single string.
+
+        Args:
+            posts: List of posts to render
+            compact: Whether to use the one-line-per-post table format
+
+        Returns:
+            str: Rendered output, including the summary footer
+        """
+        return "".join(self._render_chunks(posts, compact, self._use_color()))
+
+    def _render_chunks(self, posts: Iterable[RedditPost], compact: bool, color: bool,
+                       chunk_size: Optional[int] = None):
+        """Yield the rendered output in chunks of chunk_size (default CHUNK_SIZE) posts."""
+        chunk_size = chunk_size or self.CHUNK_SIZE
+        parts = []
+        separator = "\n" + "-" * 80 + "\n\n"
+        i = 0
         for i, post in enumerate(posts, 1):
-            formatted_post = self.format_post(post, i)
-            
-            # Print with separator except for the first post
-            if i > 1:
-                print("\n" + "-" * 80 + "\n")
-                
-            print(formatted_post)
-        
-        print("\n" + "=" * 80)
-        print(f"Retrieved {len(posts)} posts from Reddit")
+            if i == 1 and compact:
+                parts.append(self.compact_header() + "\n")
+            if compact:
+                parts.append(self.format_compact(post, i))
+            else:
+                # Separator between posts, except before the first one
+                if i > 1:
+                    parts.append(separator)
+                parts.append(self._format_post(post, i, color))
+            parts.append("\n")
+
+            if i % chunk_size == 0:
+                yield "".join(parts)
+                parts = []
+
+        if not i:
+            yield "No posts found.\n"
+            return
+        parts.append("\n" + "=" * 80 + "\n")
+        parts.append(f"Retrieved {i} posts from Reddit\n")
+        yield "".join(parts)
+
+    def display_posts(self, posts: Iterable[RedditPost], compact: bool = False) -> None:
+        """
+        Display Reddit posts in the console.
+
+        Output is rendered in chunks and written with one call per chunk,
+        rather than one print per line. Posts may be streamed from an
+        iterator, in which case smaller chunks are written as they arrive.
+
+        Args:
+            posts: List or iterator of posts to display
+            compact: Whether to use the one-line-per-post table format
+        """
+        if isinstance(posts, list):
+            chunk_size = self.CHUNK_SIZE
+            if posts:
+                logger.info(f"Displaying {len(posts)} posts")
+        else:
+            chunk_size = self.STREAM_CHUNK_SIZE
+
+        stream = self._output()
+        for chunk in self._render_chunks(posts, compact, self._use_color(), chunk_size):
+            stream.write(chunk)
+            stream.flush()
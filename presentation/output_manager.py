@@ -4,10 +4,12 @@ Output Manager module for the Reddit Fetcher application.
 This module provides utilities for managing different output formats.
 """
 
-import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from core.data_models import RedditPost
+from presentation.parquet_exporter import ParquetExporter
+from presentation.serializers import get_serializer, post_to_row
+from storage.post_archive import PostArchiveWriter
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -29,42 +31,72 @@ class OutputManager:
         Returns:
             List[Dict[str, Any]]: List of post dictionaries
         """
-        return [
-            {
-                'id': post.id,
-                'title': post.title,
-                'author': post.author,
-                'upvotes': post.upvotes,
-                'score': post.score,
-                'url': post.url,
-                'created_utc': post.created_utc,
-                'num_comments': post.num_comments,
-                'is_self': post.is_self,
-                'selftext': post.selftext if post.is_self else None
-            }
-            for post in posts
-        ]
+        return [post_to_row(post) for post in posts]
         
-    def export_to_json(self, posts: List[RedditPost], file_path: str) -> None:
+    def export_to_json(self, posts: List[RedditPost], file_path: str,
+                       indent: Optional[int] = 2, backend: Optional[str] = None) -> None:
         """
         Export posts to a JSON file.
         
         Args:
             posts: List of posts to export
             file_path: Path to the output file
+            indent: Indentation width, or None for compact output
+            backend: Serializer backend (orjson, msgspec, json); defaults to the fastest installed
         """
         try:
             logger.info(f"Exporting {len(posts)} posts to JSON: {file_path}")
             
-            # Convert posts to dictionary format
-            posts_dict = self.posts_to_dict(posts)
+            serializer = get_serializer(backend)
             
-            # Write to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(posts_dict, f, indent=2, ensure_ascii=False)
+            # Stream the encoded posts to the file
+            with open(file_path, 'wb') as f:
+                serializer.write(posts, f, indent=indent)
                 
             logger.info(f"Successfully exported posts to {file_path}")
             
         except Exception as e:
             logger.error(f"Failed to export posts to JSON: {str(e)}")
             raise
+
+    def export_to_parquet(self, posts: List[RedditPost], directory: str,
+                          compression: str = "zstd") -> None:
+        """
+        Export posts to a Parquet dataset partitioned by subreddit and date.
+        
+        Args:
+            posts: List of posts to export
+            directory: Root directory of the dataset
+            compression: Parquet compression codec
+        """
+        try:
+            logger.info(f"Exporting {len(posts)} posts to Parquet: {directory}")
+            
+            with ParquetExporter(directory, compression=compression) as exporter:
+                exporter.write(posts)
+                
+            logger.info(f"Successfully exported posts to {directory}")
+            
+        except Exception as e:
+            logger.error(f"Failed to export posts to Parquet: {str(e)}")
+            raise
+
+    def export_to_archive(self, posts: List[RedditPost], file_path: str) -> None:
+        """
+        Export posts to a memory-mappable binary archive.
+        
+        Args:
+            posts: List of posts to export
+            file_path: Path to the archive file
+        """
+        try:
+            logger.info(f"Exporting {len(posts)} posts to archive: {file_path}")
+            
+            with PostArchiveWriter(file_path) as writer:
+                writer.add_many(posts)
+                
+            logger.info(f"Successfully exported posts to {file_path}")
+            
+        except Exception as e:
+            logger.error(f"Failed to export posts to archive: {str(e)}")
+            raise
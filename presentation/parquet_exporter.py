@@ -0,0 +1,211 @@
+"""
+Parquet Exporter module for the Reddit Fetcher application.
+
+This module writes Reddit posts as partitioned, compressed Parquet files.
+"""
+
+import os
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is an optional dependency
+    pa = None
+    pq = None
+
+from core.data_models import RedditPost
+from utils.error_handler import ConfigurationError
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+def post_schema():
+    """
+    Get the Arrow schema used for exported posts.
+
+    Returns:
+        pyarrow.Schema: Schema with dictionary-encoded author and subreddit columns
+    """
+    if pa is None:
+        raise ConfigurationError("Parquet export requires pyarrow. Install it with: pip install pyarrow")
+
+    return pa.schema([
+        ('id', pa.string()),
+        ('title', pa.string()),
+        ('author', pa.dictionary(pa.int32(), pa.string())),
+        ('subreddit', pa.dictionary(pa.int32(), pa.string())),
+        ('upvotes', pa.int64()),
+        ('downvotes', pa.int64()),
+        ('score', pa.int64()),
+        ('url', pa.string()),
+        ('created_utc', pa.float64()),
+        ('num_comments', pa.int64()),
+        ('is_self', pa.bool_()),
+        ('selftext', pa.string()),
+        ('upvote_ratio', pa.float64()),
+    ])
+
+def posts_to_record_batch(posts: List[RedditPost]):
+    """
+    Convert posts to an Arrow record batch.
+
+    Args:
+        posts: List of posts to convert
+
+    Returns:
+        pyarrow.RecordBatch: Record batch following post_schema()
+    """
+    schema = post_schema()
+    columns = [
+        pa.array([post.id for post in posts], pa.string()),
+        pa.array([post.title for post in posts], pa.string()),
+        pa.array([post.author for post in posts], pa.string()).dictionary_encode(),
+        pa.array([post.subreddit for post in posts], pa.string()).dictionary_encode(),
+        pa.array([post.upvotes for post in posts], pa.int64()),
+        pa.array([post.downvotes for post in posts], pa.int64()),
+        pa.array([post.score for post in posts], pa.int64()),
+        pa.array([post.url for post in posts], pa.string()),
+        pa.array([post.created_utc for post in posts], pa.float64()),
+        pa.array([post.num_comments for post in posts], pa.int64()),
+        pa.array([post.is_self for post in posts], pa.bool_()),
+        pa.array([post.selftext for post in posts], pa.string()),
+        pa.array([post.upvote_ratio for post in posts], pa.float64()),
+    ]
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+class ParquetExporter:
+    """Streams posts into Parquet files partitioned by subreddit and date."""
+
+    DEFAULT_ROW_GROUP_SIZE = 10000
+    DEFAULT_MAX_BUFFERED_ROWS = 100000
+    DEFAULT_COMPRESSION = "zstd"
+    MAX_OPEN_WRITERS = 64
+
+    def __init__(self, base_dir: str, compression: Optional[str] = None,
+                 row_group_size: Optional[int] = None,
+                 max_open_writers: Optional[int] = None,
+                 max_buffered_rows: Optional[int] = None):
+        """
+        Initialize the Parquet exporter.
+
+        Output is laid out as base_dir/subreddit=<name>/date=<YYYY-MM-DD>/part-<id>.parquet.
+        Posts are buffered per partition and written out one row group at a time.
+        When the buffers of all partitions together exceed max_buffered_rows,
+        the largest partitions are written out early as smaller row groups.
+
+        Args:
+            base_dir: Root directory of the partitioned dataset
+            compression: Parquet compression codec (default: zstd)
+            row_group_size: Number of rows buffered per partition before a row group is written
+            max_open_writers: Maximum number of partition files kept open at once
+            max_buffered_rows: Maximum number of rows buffered across all partitions
+
+        Raises:
+            ConfigurationError: If pyarrow is not installed
+        """
+        self.schema = post_schema()
+        self.base_dir = base_dir
+        self.compression = compression or self.DEFAULT_COMPRESSION
+        self.row_group_size = row_group_size or self.DEFAULT_ROW_GROUP_SIZE
+        self.max_open_writers = max_open_writers or self.MAX_OPEN_WRITERS
+        self.max_buffered_rows = max_buffered_rows or self.DEFAULT_MAX_BUFFERED_ROWS
+        self._buffers: Dict[Tuple[str, str], List[RedditPost]] = {}
+        self._buffered_rows = 0
+        self._writers: "OrderedDict[Tuple[str, str], pq.ParquetWriter]" = OrderedDict()
+        self.rows_written = 0
+
+    @staticmethod
+    def partition_for(post: RedditPost) -> Tuple[str, str]:
+        """
+        Get the (subreddit, date) partition of a post.
+
+        Args:
+            post: The post to partition
+
+        Returns:
+            Tuple[str, str]: Subreddit name and UTC creation date
+        """
+        date = datetime.fromtimestamp(post.created_utc, tz=timezone.utc).strftime("%Y-%m-%d")
+        return (post.subreddit or "unknown", date)
+
+    def write(self, posts: Iterable[RedditPost]) -> None:
+        """
+        Append posts to the dataset.
+
+        Args:
+            posts: Posts to append
+        """
+        for post in posts:
+            partition = self.partition_for(post)
+            buffer = self._buffers.setdefault(partition, [])
+            buffer.append(post)
+            self._buffered_rows += 1
+            if len(buffer) >= self.row_group_size:
+                self._flush_partition(partition)
+            elif self._buffered_rows > self.max_buffered_rows:
+                self._flush_largest()
+
+    def flush(self) -> None:
+        """Write out every buffered partition as a row group."""
+        for partition in list(self._buffers):
+            self._flush_partition(partition)
+
+    def close(self) -> None:
+        """Flush buffered posts and finalize all open files."""
+        self.flush()
+        while self._writers:
+            _, writer = self._writers.popitem(last=False)
+            writer.close()
+        logger.info(f"Wrote {self.rows_written} posts to Parquet dataset {self.base_dir}")
+
+    def _flush_largest(self) -> None:
+        """Write out the largest partitions until half the buffer budget is free."""
+        for partition in sorted(self._buffers, key=lambda key: len(self._buffers[key]), reverse=True):
+            if self._buffered_rows <= self.max_buffered_rows // 2:
+                break
+            self._flush_partition(partition)
+
+    def _flush_partition(self, partition: Tuple[str, str]) -> None:
+        """Write the buffered posts of one partition as a row group."""
+        posts = self._buffers.pop(partition, None)
+        if not posts:
+            return
+        self._buffered_rows -= len(posts)
+
+        writer = self._writer_for(partition)
+        writer.write_batch(posts_to_record_batch(posts))
+        self.rows_written += len(posts)
+
+    def _writer_for(self, partition: Tuple[str, str]):
+        """Get the open writer of a partition, opening a new part file if needed."""
+        writer = self._writers.get(partition)
+        if writer is not None:
+            self._writers.move_to_end(partition)
+            return writer
+
+        if len(self._writers) >= self.max_open_writers:
+            _, oldest = self._writers.popitem(last=False)
+            oldest.close()
+
+        subreddit, date = partition
+        directory = os.path.join(self.base_dir, f"subreddit={subreddit}", f"date={date}")
+        os.makedirs(directory, exist_ok=True)
+
+        # Every writer gets its own part file so appends never rewrite existing data
+        path = os.path.join(directory, f"part-{uuid.uuid4().hex}.parquet")
+        logger.debug(f"Opening Parquet part file {path}")
+        writer = pq.ParquetWriter(path, self.schema, compression=self.compression)
+        self._writers[partition] = writer
+        return writer
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
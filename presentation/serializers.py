@@ -0,0 +1,202 @@
+"""
+Serializers module for the Reddit Fetcher application.
+
+This module provides pluggable JSON encoders for exporting Reddit posts.
+The fastest installed backend is used: orjson, then msgspec, then the
+standard library json module.
+"""
+
+import json
+from operator import attrgetter
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # msgspec is an optional dependency
+    msgspec = None
+
+from core.data_models import RedditPost
+from utils.error_handler import ConfigurationError
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Fields written for every exported post, in output order
+EXPORT_FIELDS = (
+    'id', 'title', 'author', 'upvotes', 'score', 'url', 'created_utc',
+    'num_comments', 'is_self', 'selftext', 'subreddit', 'upvote_ratio'
+)
+
+_export_values = attrgetter(*EXPORT_FIELDS)
+
+def post_to_row(post: RedditPost) -> Dict[str, Any]:
+    """
+    Get the exported fields of a post as a dictionary.
+
+    Args:
+        post: The post to convert
+
+    Returns:
+        Dict[str, Any]: Exported fields of the post
+    """
+    return dict(zip(EXPORT_FIELDS, _export_values(post)))
+
+
+class JSONSerializer:
+    """Standard library JSON serializer, used when no faster backend is installed."""
+
+    name = "json"
+
+    # Number of posts encoded per write when streaming to a file
+    CHUNK_SIZE = 5000
+
+    def encode_rows(self, rows: List[Dict[str, Any]], indent: Optional[int]) -> bytes:
+        """
+        Encode a list of rows as a JSON array.
+
+        Args:
+            rows: Rows to encode
+            indent: Indentation width, or None for compact output
+
+        Returns:
+            bytes: UTF-8 encoded JSON array
+        """
+        separators = None if indent else (',', ':')
+        return json.dumps(rows, indent=indent, ensure_ascii=False,
+                          separators=separators).encode('utf-8')
+
+    def dumps(self, posts: Iterable[RedditPost], indent: Optional[int] = None) -> bytes:
+        """
+        Encode posts as a JSON array.
+
+        Args:
+            posts: Posts to encode
+            indent: Indentation width, or None for compact output
+
+        Returns:
+            bytes: UTF-8 encoded JSON array
+        """
+        return self.encode_rows([post_to_row(post) for post in posts], indent)
+
+    def encode_lines(self, rows: List[Dict[str, Any]]) -> bytes:
+        """
+        Encode rows as newline-delimited JSON.
+
+        Args:
+            rows: Rows to encode
+
+        Returns:
+            bytes: One UTF-8 encoded JSON object per line
+        """
+        return b"".join(self.encode_rows([row], None)[1:-1] + b"\n" for row in rows)
+
+    def write(self, posts: Iterable[RedditPost], f: BinaryIO,
+              indent: Optional[int] = None) -> int:
+        """
+        Stream posts to a binary file as one JSON array.
+
+        Posts are encoded in chunks so memory use does not grow with the
+        size of the export.
+
+        Args:
+            posts: Posts to write
+            f: Binary file object
+            indent: Indentation width, or None for compact output
+
+        Returns:
+            int: Number of bytes written
+        """
+        opening, separator, closing = (b"[\n  ", b",\n  ", b"\n]") if indent else (b"[", b",", b"]")
+        written = 0
+        chunk: List[Dict[str, Any]] = []
+
+        def flush():
+            nonlocal written
+            # Drop the brackets of the encoded chunk and splice it into the array
+            body = self.encode_rows(chunk, indent)[1:-1].strip()
+            written += f.write(separator if written else opening)
+            written += f.write(body)
+            chunk.clear()
+
+        for post in posts:
+            chunk.append(post_to_row(post))
+            if len(chunk) >= self.CHUNK_SIZE:
+                flush()
+        if chunk:
+            flush()
+
+        if not written:
+            return f.write(b"[]")
+        return written + f.write(closing)
+
+
+class OrjsonSerializer(JSONSerializer):
+    """Serializer backed by orjson."""
+
+    name = "orjson"
+
+    def encode_rows(self, rows: List[Dict[str, Any]], indent: Optional[int]) -> bytes:
+        """Encode a list of rows as a JSON array (orjson only supports 2-space indentation)."""
+        return orjson.dumps(rows, option=orjson.OPT_INDENT_2 if indent else 0)
+
+
+class MsgspecSerializer(JSONSerializer):
+    """Serializer backed by msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        """Initialize the serializer with a reusable encoder."""
+        self._encoder = msgspec.json.Encoder()
+
+    def encode_rows(self, rows: List[Dict[str, Any]], indent: Optional[int]) -> bytes:
+        """Encode a list of rows as a JSON array."""
+        encoded = self._encoder.encode(rows)
+        return msgspec.json.format(encoded, indent=indent) if indent else encoded
+
+
+SERIALIZERS = {
+    'orjson': (OrjsonSerializer, lambda: orjson is not None),
+    'msgspec': (MsgspecSerializer, lambda: msgspec is not None),
+    'json': (JSONSerializer, lambda: True),
+}
+
+def available_backends() -> List[str]:
+    """
+    Get the names of the installed serializer backends, fastest first.
+
+    Returns:
+        List[str]: Backend names
+    """
+    return [name for name, (_, available) in SERIALIZERS.items() if available()]
+
+def get_serializer(backend: Optional[str] = None) -> JSONSerializer:
+    """
+    Get a serializer by backend name, or the fastest installed one.
+
+    Args:
+        backend: Backend name (orjson, msgspec, json) or None to auto-select
+
+    Returns:
+        JSONSerializer: Serializer instance
+
+    Raises:
+        ConfigurationError: If the requested backend is unknown or not installed
+    """
+    if backend is None:
+        backend = available_backends()[0]
+
+    if backend not in SERIALIZERS:
+        raise ConfigurationError(f"Unknown serializer backend: {backend}")
+
+    serializer_class, available = SERIALIZERS[backend]
+    if not available():
+        raise ConfigurationError(f"Serializer backend '{backend}' is not installed")
+
+    logger.debug(f"Using {backend} serializer")
+    return serializer_class()
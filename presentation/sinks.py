@@ -0,0 +1,543 @@
+"""
+Sinks module for the Reddit Fetcher application.
+
+This module sends posts to output destinations (an NDJSON file, a SQLite
+database, an HTTP webhook) in batches. Each sink is driven by a background
+writer with its own bounded buffer, so a slow destination does not hold up
+the fetcher. Batches that keep failing are spooled to a dead-letter
+directory and can be replayed later.
+"""
+
+import glob
+import hashlib
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Dict, Iterable, List, Optional
+
+import requests
+
+from core.data_models import RedditPost
+from presentation.serializers import EXPORT_FIELDS, get_serializer, post_to_row
+from storage.post_importer import PostImporter
+from utils.error_handler import ConfigurationError
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Queue markers of the writer thread
+_FLUSH = object()
+_CLOSE = object()
+
+
+def sink_name(kind: str, target: str) -> str:
+    """
+    Derive a stable sink name from its kind and destination.
+
+    Dead-letter files are named after their sink, so two sinks of the same
+    kind must not share a name.
+
+    Args:
+        kind: Sink kind (file, sqlite, webhook)
+        target: File path or URL the sink writes to
+
+    Returns:
+        str: Name such as file-3f2a9c1d0b
+    """
+    if kind != "webhook":
+        target = os.path.abspath(target)
+    return f"{kind}-{hashlib.sha256(target.encode('utf-8')).hexdigest()[:10]}"
+
+
+class Sink:
+    """Base class of output destinations that accept posts in batches."""
+
+    def __init__(self, name: str):
+        """
+        Initialize the sink.
+
+        Args:
+            name: Sink name used in logs and dead-letter file names
+        """
+        self.name = name
+
+    def write_batch(self, posts: List[RedditPost]) -> None:
+        """
+        Write a batch of posts; raising makes the writer retry the batch.
+
+        Args:
+            posts: Posts to write
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release the resources of the sink."""
+
+
+class JSONLinesSink(Sink):
+    """Appends posts to a newline-delimited JSON file."""
+
+    def __init__(self, path: str, backend: Optional[str] = None, name: Optional[str] = None):
+        """
+        Initialize the sink.
+
+        Args:
+            path: Output file, appended to if it exists
+            backend: Serializer backend (orjson, msgspec, json); defaults to the fastest installed
+            name: Sink name (derived from the path if omitted)
+        """
+        super().__init__(name or sink_name("file", path))
+        self.path = path
+        self._serializer = get_serializer(backend)
+        self._file = open(path, 'ab')
+
+    def write_batch(self, posts: List[RedditPost]) -> None:
+        self._file.write(self._serializer.encode_lines([post_to_row(post) for post in posts]))
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class SQLiteSink(Sink):
+    """Upserts posts into a SQLite table keyed by post id."""
+
+    def __init__(self, path: str, table: str = "posts", name: Optional[str] = None):
+        """
+        Initialize the sink, creating the table if needed.
+
+        Args:
+            path: Database file
+            table: Table name
+            name: Sink name (derived from the path and table if omitted)
+
+        Raises:
+            ConfigurationError: If the table name is not a valid identifier
+        """
+        super().__init__(name or sink_name("sqlite", f"{os.path.abspath(path)}#{table}"))
+        if not table.isidentifier():
+            raise ConfigurationError(f"Invalid SQLite table name: {table}")
+        self.path = path
+        self.table = table
+        # Created here, used by the writer thread
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        columns = ", ".join(f"{name} PRIMARY KEY" if name == "id" else name for name in EXPORT_FIELDS)
+        self._connection.execute(f"CREATE TABLE IF NOT EXISTS {table} ({columns})")
+        # Tables created before a field was exported get the missing columns
+        existing = {row[1] for row in self._connection.execute(f"PRAGMA table_info({table})")}
+        for name in EXPORT_FIELDS:
+            if name not in existing:
+                self._connection.execute(f"ALTER TABLE {table} ADD COLUMN {name}")
+        self._insert = (f"INSERT OR REPLACE INTO {table} ({', '.join(EXPORT_FIELDS)}) "
+                        f"VALUES ({', '.join('?' * len(EXPORT_FIELDS))})")
+
+    def write_batch(self, posts: List[RedditPost]) -> None:
+        rows = [tuple(getattr(post, name) for name in EXPORT_FIELDS) for post in posts]
+        # One transaction per batch
+        with self._connection:
+            self._connection.executemany(self._insert, rows)
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class WebhookSink(Sink):
+    """POSTs batches of posts as JSON arrays to an HTTP endpoint."""
+
+    DEFAULT_TIMEOUT = (3.05, 30)  # connect and read timeouts in seconds
+
+    def __init__(self, url: str, headers: Optional[Dict[str, str]] = None,
+                 timeout: Optional[float] = None, session: Optional[requests.Session] = None,
+                 backend: Optional[str] = None, name: Optional[str] = None):
+        """
+        Initialize the sink.
+
+        Args:
+            url: Endpoint URL
+            headers: Extra request headers, e.g. for authentication
+            timeout: requests timeout, seconds or a (connect, read) tuple
+            session: HTTP session to use (one is created if omitted)
+            backend: Serializer backend; defaults to the fastest installed
+            name: Sink name (derived from the URL if omitted)
+        """
+        super().__init__(name or sink_name("webhook", url))
+        self.url = url
+        self.timeout = timeout or self.DEFAULT_TIMEOUT
+        self._owns_session = session is None
+        self.session = session or requests.Session()
+        self.session.headers.update({'Content-Type': 'application/json', **(headers or {})})
+        self._serializer = get_serializer(backend)
+
+    def write_batch(self, posts: List[RedditPost]) -> None:
+        response = self.session.post(self.url, data=self._serializer.dumps(posts), timeout=self.timeout)
+        response.raise_for_status()
+
+    def close(self) -> None:
+        if self._owns_session:
+            self.session.close()
+
+
+def create_sink(spec: str) -> Sink:
+    """
+    Create a sink from a command line specification.
+
+    Args:
+        spec: sqlite:<path>, http(s)://<url>, or file:<path> / <path> for NDJSON
+
+    Returns:
+        Sink: The sink
+
+    Raises:
+        ConfigurationError: If the specification is empty
+    """
+    if spec.startswith("sqlite:"):
+        return SQLiteSink(spec[len("sqlite:"):])
+    if spec.startswith(("http://", "https://")):
+        return WebhookSink(spec)
+    path = spec[len("file:"):] if spec.startswith("file:") else spec
+    if not path:
+        raise ConfigurationError(f"Invalid sink: {spec!r}")
+    return JSONLinesSink(path)
+
+
+class SinkWriter:
+    """Feeds a sink from a bounded buffer on a background thread, in batches."""
+
+    DEFAULT_BATCH_SIZE = 500  # posts per batch
+    DEFAULT_FLUSH_INTERVAL = 1.0  # seconds a partial batch waits before it is written
+    DEFAULT_MAX_PENDING = 10000  # posts buffered in front of the sink
+    DEFAULT_MAX_RETRIES = 3
+    DEFAULT_RETRY_DELAY = 0.5  # seconds, doubled after every failed attempt
+    OVERFLOW_POLICIES = ("spool", "block")
+    PUT_POLL_INTERVAL = 0.1  # seconds between checks that the writer thread is still alive
+
+    def __init__(self, sink: Sink, dead_letter_dir: Optional[str] = None,
+                 batch_size: Optional[int] = None,
+                 flush_interval: Optional[float] = None,
+                 max_pending: Optional[int] = None,
+                 max_retries: Optional[int] = None,
+                 retry_delay: Optional[float] = None,
+                 overflow: str = "spool"):
+        """
+        Initialize the writer and start its thread.
+
+        A batch is written once batch_size posts are buffered or the oldest
+        buffered post has waited flush_interval seconds. A batch still
+        failing after max_retries retries is spooled to the dead-letter
+        directory as NDJSON.
+
+        Args:
+            sink: Destination of the posts
+            dead_letter_dir: Directory failed batches are spooled to (dropped if omitted)
+            batch_size: Posts per batch
+            flush_interval: Maximum seconds a partial batch is held back
+            max_pending: Capacity of the buffer
+            max_retries: Retries of a failed batch
+            retry_delay: Delay before the first retry in seconds
+            overflow: What write() does when the buffer is full: spool the
+                post to the dead-letter directory, or block until there is room
+
+        Raises:
+            ConfigurationError: If the overflow policy is unknown
+        """
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ConfigurationError(f"Unsupported overflow policy: {overflow}")
+        self.sink = sink
+        self.dead_letter_dir = dead_letter_dir
+        self.batch_size = batch_size or self.DEFAULT_BATCH_SIZE
+        self.flush_interval = self.DEFAULT_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self.max_retries = self.DEFAULT_MAX_RETRIES if max_retries is None else max_retries
+        self.retry_delay = self.DEFAULT_RETRY_DELAY if retry_delay is None else retry_delay
+        self.overflow = overflow
+        self.stats = {'written': 0, 'batches': 0, 'retries': 0, 'failed_batches': 0, 'spooled': 0, 'dropped': 0}
+
+        self._queue: queue.Queue = queue.Queue(max_pending or self.DEFAULT_MAX_PENDING)
+        self._pending = 0
+        self._condition = threading.Condition()
+        self._spool_lock = threading.Lock()
+        self._spool_path: Optional[str] = None
+        self._serializer = get_serializer()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=f"sink-{sink.name}", daemon=True)
+        self._thread.start()
+
+    def write(self, post: RedditPost) -> None:
+        """
+        Queue a post for the sink.
+
+        Args:
+            post: Post to write
+        """
+        with self._condition:
+            self._pending += 1
+        try:
+            self._queue.put_nowait(post)
+            return
+        except queue.Full:
+            pass
+        if self.overflow == "block" and self._put(post):
+            return
+        self._spool([post])
+        self._done(1)
+
+    def write_many(self, posts: Iterable[RedditPost]) -> None:
+        """
+        Queue several posts for the sink.
+
+        Args:
+            posts: Posts to write
+        """
+        for post in posts:
+            self.write(post)
+
+    def flush(self, wait: bool = True, timeout: Optional[float] = None) -> bool:
+        """
+        Write the buffered posts without waiting for a full batch.
+
+        Args:
+            wait: Whether to wait until every queued post was written or spooled
+            timeout: Maximum seconds to wait
+
+        Returns:
+            bool: True if nothing is pending anymore (always True without wait,
+                False if the writer thread has stopped)
+        """
+        if not self._put(_FLUSH):
+            return False
+        if not wait:
+            return True
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending == 0 or not self._thread.is_alive(), timeout)
+            return self._pending == 0
+
+    def close(self) -> None:
+        """Write the remaining posts, stop the thread and close the sink."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._put(_CLOSE):
+            self._thread.join()
+        else:
+            logger.error(f"Sink {self.sink.name} writer stopped early, {self.pending} posts not written")
+        self.sink.close()
+        logger.info(f"Sink {self.sink.name}: {self.stats['written']} posts written, "
+                    f"{self.stats['spooled']} spooled")
+
+    @property
+    def pending(self) -> int:
+        """Get the number of posts queued or being written."""
+        with self._condition:
+            return self._pending
+
+    def _put(self, item: object) -> bool:
+        """Queue an item, waiting for room only while the writer thread runs."""
+        while self._thread.is_alive():
+            try:
+                self._queue.put(item, timeout=self.PUT_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _done(self, count: int) -> None:
+        """Mark posts as written, spooled or dropped."""
+        with self._condition:
+            self._pending -= count
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        """Writer thread: collect batches and hand them to the sink."""
+        try:
+            self._write_loop()
+        finally:
+            # Wake up flush() callers if the thread ends unexpectedly
+            with self._condition:
+                self._condition.notify_all()
+
+    def _write_loop(self) -> None:
+        """Collect queued posts into batches until the writer is closed."""
+        batch: List[RedditPost] = []
+        deadline = 0.0
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if batch else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = _FLUSH  # the oldest buffered post waited long enough
+
+            if item is _FLUSH or item is _CLOSE:
+                if batch:
+                    self._write_batch(batch)
+                    batch = []
+                if item is _CLOSE:
+                    return
+                continue
+
+            batch.append(item)
+            if len(batch) == 1:
+                deadline = time.monotonic() + self.flush_interval
+            if len(batch) >= self.batch_size:
+                self._write_batch(batch)
+                batch = []
+
+    def _write_batch(self, batch: List[RedditPost]) -> None:
+        """Write a batch with retries, spooling it if every attempt fails."""
+        try:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    self.sink.write_batch(batch)
+                except Exception as e:
+                    if attempt == self.max_retries:
+                        logger.error(f"Sink {self.sink.name} failed {attempt + 1} times: {str(e)}")
+                        break
+                    delay = self.retry_delay * 2 ** attempt
+                    logger.warning(f"Sink {self.sink.name} failed, retrying in {delay:.1f}s: {str(e)}")
+                    self.stats['retries'] += 1
+                    time.sleep(delay)
+                else:
+                    self.stats['written'] += len(batch)
+                    self.stats['batches'] += 1
+                    return
+            self.stats['failed_batches'] += 1
+            self._spool(batch)
+        finally:
+            self._done(len(batch))
+
+    def _spool(self, posts: List[RedditPost]) -> None:
+        """Append posts to this writer's dead-letter file."""
+        if self.dead_letter_dir is None:
+            with self._spool_lock:
+                self.stats['dropped'] += len(posts)
+            logger.warning(f"Dropped {len(posts)} posts for sink {self.sink.name} (no dead-letter directory)")
+            return
+        data = self._serializer.encode_lines([post_to_row(post) for post in posts])
+        with self._spool_lock:
+            try:
+                if self._spool_path is None:
+                    os.makedirs(self.dead_letter_dir, exist_ok=True)
+                    self._spool_path = os.path.join(
+                        self.dead_letter_dir, f"{self.sink.name}-{int(time.time())}-{uuid.uuid4().hex[:8]}.ndjson"
+                    )
+                with open(self._spool_path, 'ab') as f:
+                    f.write(data)
+            except OSError as e:
+                self.stats['dropped'] += len(posts)
+                logger.error(f"Dropped {len(posts)} posts for sink {self.sink.name}, spooling failed: {str(e)}")
+                return
+            self.stats['spooled'] += len(posts)
+        logger.warning(f"Spooled {len(posts)} posts for sink {self.sink.name} to {self._spool_path}")
+
+    def replay_dead_letters(self, timeout: Optional[float] = None) -> int:
+        """
+        Write the posts spooled for this sink by earlier runs.
+
+        A spool file is only deleted once its posts were written or spooled
+        again to this run's file, so nothing is lost if the sink still fails
+        or the process stops halfway.
+
+        Args:
+            timeout: Maximum seconds to wait for each file's posts
+
+        Returns:
+            int: Number of posts replayed
+        """
+        if self.dead_letter_dir is None:
+            return 0
+        replayed = 0
+        pattern = os.path.join(self.dead_letter_dir, f"{glob.escape(self.sink.name)}-*.ndjson")
+        for path in sorted(glob.glob(pattern)):
+            if path == self._spool_path:
+                continue
+            posts = PostImporter(workers=1).load(path)
+            self.write_many(posts)
+            if not self.flush(timeout=timeout):
+                logger.warning(f"Keeping {path}: sink {self.sink.name} did not catch up")
+                break
+            os.remove(path)
+            replayed += len(posts)
+        if replayed:
+            logger.info(f"Replayed {replayed} spooled posts to sink {self.sink.name}")
+        return replayed
+
+
+class SinkFanOut:
+    """Sends every post to several sinks, each with its own writer and buffer."""
+
+    def __init__(self, sinks: Iterable[Sink], dead_letter_dir: Optional[str] = None, **options):
+        """
+        Initialize the fan-out and start one writer per sink.
+
+        Args:
+            sinks: Destinations of the posts
+            dead_letter_dir: Directory failed batches are spooled to
+            **options: SinkWriter options (batch_size, flush_interval, ...)
+        """
+        self.writers = [SinkWriter(sink, dead_letter_dir, **options) for sink in sinks]
+
+    def write(self, post: RedditPost) -> RedditPost:
+        """
+        Queue a post for every sink.
+
+        Args:
+            post: Post to write
+
+        Returns:
+            RedditPost: The post, so write can serve as a pass-through pipeline stage
+        """
+        for writer in self.writers:
+            writer.write(post)
+        return post
+
+    def write_many(self, posts: Iterable[RedditPost]) -> None:
+        """
+        Queue several posts for every sink.
+
+        Args:
+            posts: Posts to write
+        """
+        for post in posts:
+            self.write(post)
+
+    def replay_dead_letters(self) -> int:
+        """
+        Queue the posts spooled by earlier runs for every sink.
+
+        Returns:
+            int: Number of posts queued
+        """
+        return sum(writer.replay_dead_letters() for writer in self.writers)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Write the buffered posts of every sink and wait for them.
+
+        Args:
+            timeout: Maximum seconds to wait per sink
+
+        Returns:
+            bool: True if every sink caught up
+        """
+        for writer in self.writers:
+            writer.flush(wait=False)
+        return all([writer.flush(timeout=timeout) for writer in self.writers])
+
+    def close(self) -> None:
+        """Write the remaining posts and close every sink."""
+        for writer in self.writers:
+            writer.close()
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Get the writer counters per sink name."""
+        return {writer.sink.name: dict(writer.stats) for writer in self.writers}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
@@ -0,0 +1,360 @@
+"""
+Aggregators module for the Reddit Fetcher application.
+
+This module provides incremental aggregations over a live stream of Reddit
+posts: windowed top-K, sliding-window counters and time-bucketed histograms.
+Each update costs a heap push or a bucket increment, and snapshots read the
+maintained state instead of re-sorting every post.
+"""
+
+import bisect
+import heapq
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.data_models import RedditPost
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class TopKAggregator:
+    """Tracks the top K posts by a numeric field, optionally within a time window."""
+
+    def __init__(self, k: int = 10, key: str = "score",
+                 window_seconds: Optional[float] = None,
+                 sum_fields: Tuple[str, ...] = ("num_comments",)):
+        """
+        Initialize the aggregator.
+
+        Only the latest version of each post id is counted. Posts leave the
+        window once their created_utc is older than window_seconds.
+
+        Args:
+            k: Number of posts kept in snapshots
+            key: RedditPost field to rank by
+            window_seconds: Window length in seconds, or None to keep posts forever
+            sum_fields: Numeric fields whose running totals are maintained
+        """
+        self.k = k
+        self.key = key
+        self.window_seconds = window_seconds
+        self.sum_fields = sum_fields
+        self._posts: Dict[str, Tuple[int, RedditPost]] = {}
+        self._ranking: List[Tuple[float, int, str]] = []  # max-heap via negated keys
+        self._expiry: List[Tuple[float, str]] = []
+        self._totals = {field: 0 for field in sum_fields}
+        self._version = 0
+
+    def update(self, post: RedditPost, now: Optional[float] = None) -> bool:
+        """
+        Add a post or a newer version of a post.
+
+        Args:
+            post: The post to add
+            now: Current Unix time (defaults to time.time())
+
+        Returns:
+            bool: True if the post id was not already tracked
+        """
+        now = time.time() if now is None else now
+        self._expire(now)
+        if self.window_seconds is not None and post.created_utc < now - self.window_seconds:
+            return False
+
+        previous = self._posts.get(post.id)
+        if previous is not None:
+            for field in self.sum_fields:
+                self._totals[field] -= getattr(previous[1], field) or 0
+        else:
+            heapq.heappush(self._expiry, (post.created_utc, post.id))
+
+        for field in self.sum_fields:
+            self._totals[field] += getattr(post, field) or 0
+
+        self._version += 1
+        self._posts[post.id] = (self._version, post)
+        heapq.heappush(self._ranking, (-getattr(post, self.key), self._version, post.id))
+
+        # Superseded versions stay in the heap until popped; rebuild when they dominate
+        if len(self._ranking) > 4 * len(self._posts) + self.k:
+            self._compact()
+
+        return previous is None
+
+    def update_many(self, posts: Iterable[RedditPost], now: Optional[float] = None) -> None:
+        """
+        Add several posts.
+
+        Args:
+            posts: Posts to add
+            now: Current Unix time (defaults to time.time())
+        """
+        for post in posts:
+            self.update(post, now)
+
+    def _expire(self, now: float) -> None:
+        """Drop posts that have left the window."""
+        if self.window_seconds is None:
+            return
+
+        cutoff = now - self.window_seconds
+        while self._expiry and self._expiry[0][0] < cutoff:
+            _, post_id = heapq.heappop(self._expiry)
+            entry = self._posts.pop(post_id, None)
+            if entry is not None:
+                for field in self.sum_fields:
+                    self._totals[field] -= getattr(entry[1], field) or 0
+
+    def _compact(self) -> None:
+        """Rebuild the ranking heap from the live posts only."""
+        self._ranking = [
+            (-getattr(post, self.key), version, post_id)
+            for post_id, (version, post) in self._posts.items()
+        ]
+        heapq.heapify(self._ranking)
+
+    def top(self, now: Optional[float] = None) -> List[RedditPost]:
+        """
+        Get the current top K posts, highest first.
+
+        Args:
+            now: Current Unix time (defaults to time.time())
+
+        Returns:
+            List[RedditPost]: Up to K posts
+        """
+        self._expire(time.time() if now is None else now)
+
+        result = []
+        kept = []
+        while self._ranking and len(result) < self.k:
+            entry = heapq.heappop(self._ranking)
+            live = self._posts.get(entry[2])
+            if live is None or live[0] != entry[1]:
+                continue  # superseded or expired
+            result.append(live[1])
+            kept.append(entry)
+
+        for entry in kept:
+            heapq.heappush(self._ranking, entry)
+        return result
+
+    def total(self, field: str) -> float:
+        """Get the running total of a summed field over the tracked posts."""
+        return self._totals[field]
+
+    def mean(self, field: str) -> Optional[float]:
+        """Get the mean of a summed field over the tracked posts, or None if empty."""
+        return self._totals[field] / len(self._posts) if self._posts else None
+
+    def __len__(self) -> int:
+        """Get the number of tracked posts (as of the last update or snapshot)."""
+        return len(self._posts)
+
+
+class SlidingWindowCounter:
+    """Counts events and sums values over a sliding time window using fixed buckets."""
+
+    def __init__(self, window_seconds: float, bucket_seconds: float = 1.0):
+        """
+        Initialize the counter.
+
+        Args:
+            window_seconds: Window length in seconds
+            bucket_seconds: Bucket resolution in seconds
+        """
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self._starts: List[float] = []  # sorted bucket start times
+        self._buckets: Dict[float, List[float]] = {}  # bucket start -> [count, sum]
+        self._count = 0
+        self._sum = 0.0
+
+    def add(self, timestamp: float, value: float = 1.0) -> None:
+        """
+        Record an event.
+
+        Args:
+            timestamp: Unix time of the event
+            value: Value summed for the event
+        """
+        start = timestamp - timestamp % self.bucket_seconds
+        bucket = self._buckets.get(start)
+        if bucket is None:
+            bucket = [0, 0.0]
+            self._buckets[start] = bucket
+            bisect.insort(self._starts, start)
+        bucket[0] += 1
+        bucket[1] += value
+        self._count += 1
+        self._sum += value
+
+    def _expire(self, now: float) -> None:
+        """Drop buckets that have left the window."""
+        expired = bisect.bisect_right(self._starts, now - self.window_seconds - self.bucket_seconds)
+        for start in self._starts[:expired]:
+            count, total = self._buckets.pop(start)
+            self._count -= count
+            self._sum -= total
+        del self._starts[:expired]
+
+    def count(self, now: Optional[float] = None) -> int:
+        """Get the number of events in the window."""
+        self._expire(time.time() if now is None else now)
+        return self._count
+
+    def sum(self, now: Optional[float] = None) -> float:
+        """Get the sum of event values in the window."""
+        self._expire(time.time() if now is None else now)
+        return self._sum
+
+    def rate(self, per_seconds: float = 60.0, now: Optional[float] = None) -> float:
+        """
+        Get the average event rate over the window.
+
+        Args:
+            per_seconds: Rate unit in seconds (60 gives events per minute)
+            now: Current Unix time (defaults to time.time())
+
+        Returns:
+            float: Events per unit of time
+        """
+        return self.count(now) * per_seconds / self.window_seconds
+
+
+class TimeBucketHistogram:
+    """Counts events per fixed time bucket, keeping the most recent buckets."""
+
+    def __init__(self, bucket_seconds: float = 60.0, max_buckets: int = 60):
+        """
+        Initialize the histogram.
+
+        Args:
+            bucket_seconds: Bucket width in seconds
+            max_buckets: Number of most recent buckets kept
+        """
+        self.bucket_seconds = bucket_seconds
+        self.max_buckets = max_buckets
+        self._counts: Dict[float, int] = {}
+
+    def add(self, timestamp: float, count: int = 1) -> None:
+        """
+        Record events in the bucket containing a timestamp.
+
+        Args:
+            timestamp: Unix time of the events
+            count: Number of events
+        """
+        start = timestamp - timestamp % self.bucket_seconds
+        self._counts[start] = self._counts.get(start, 0) + count
+        if len(self._counts) > self.max_buckets:
+            del self._counts[min(self._counts)]
+
+    def snapshot(self) -> List[Tuple[float, int]]:
+        """
+        Get the bucket counts.
+
+        Returns:
+            List[Tuple[float, int]]: (bucket start, count) pairs in time order
+        """
+        return sorted(self._counts.items())
+
+
+class SubredditStats:
+    """Rolling statistics of one subreddit."""
+
+    def __init__(self, window_seconds: float = 3600, top_k: int = 10,
+                 bucket_seconds: float = 60):
+        """
+        Initialize the statistics.
+
+        Args:
+            window_seconds: Rolling window length in seconds
+            top_k: Number of top posts kept
+            bucket_seconds: Width of the posts-per-bucket histogram
+        """
+        self.window_seconds = window_seconds
+        self.top_posts = TopKAggregator(top_k, "score", window_seconds)
+        self.new_posts = SlidingWindowCounter(window_seconds, bucket_seconds)
+        self.histogram = TimeBucketHistogram(bucket_seconds, int(window_seconds // bucket_seconds) or 1)
+
+    def update(self, post: RedditPost, now: Optional[float] = None) -> None:
+        """
+        Add a post or a newer version of a post.
+
+        Args:
+            post: The post to add
+            now: Current Unix time (defaults to time.time())
+        """
+        if self.top_posts.update(post, now):
+            self.new_posts.add(post.created_utc)
+            self.histogram.add(post.created_utc)
+
+    def snapshot(self, now: Optional[float] = None) -> Dict[str, object]:
+        """
+        Get the current statistics.
+
+        Args:
+            now: Current Unix time (defaults to time.time())
+
+        Returns:
+            Dict[str, object]: Top posts, posts per minute, average comments and histogram
+        """
+        now = time.time() if now is None else now
+        top_posts = self.top_posts.top(now)
+        return {
+            'top_posts': top_posts,
+            'posts_in_window': len(self.top_posts),
+            'posts_per_minute': self.new_posts.rate(60.0, now),
+            'average_comments': self.top_posts.mean("num_comments"),
+            'histogram': self.histogram.snapshot(),
+        }
+
+
+class LiveAggregator:
+    """Routes a stream of posts into per-subreddit rolling statistics."""
+
+    def __init__(self, window_seconds: float = 3600, top_k: int = 10,
+                 bucket_seconds: float = 60):
+        """
+        Initialize the aggregator.
+
+        Args:
+            window_seconds: Rolling window length in seconds
+            top_k: Number of top posts kept per subreddit
+            bucket_seconds: Width of the posts-per-bucket histograms
+        """
+        self.window_seconds = window_seconds
+        self.top_k = top_k
+        self.bucket_seconds = bucket_seconds
+        self.subreddits: Dict[str, SubredditStats] = {}
+
+    def update(self, posts: Iterable[RedditPost], now: Optional[float] = None) -> None:
+        """
+        Add posts from a poll.
+
+        Args:
+            posts: Posts to add
+            now: Current Unix time (defaults to time.time())
+        """
+        now = time.time() if now is None else now
+        for post in posts:
+            name = post.subreddit or "unknown"
+            stats = self.subreddits.get(name)
+            if stats is None:
+                stats = SubredditStats(self.window_seconds, self.top_k, self.bucket_seconds)
+                self.subreddits[name] = stats
+            stats.update(post, now)
+
+    def snapshot(self, now: Optional[float] = None) -> Dict[str, Dict[str, object]]:
+        """
+        Get the statistics of every subreddit.
+
+        Args:
+            now: Current Unix time (defaults to time.time())
+
+        Returns:
+            Dict[str, Dict[str, object]]: Statistics keyed by subreddit
+        """
+        now = time.time() if now is None else now
+        return {name: stats.snapshot(now) for name, stats in self.subreddits.items()}
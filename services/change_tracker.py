@@ -0,0 +1,161 @@
+"""
+Change Tracker module for the Reddit Fetcher application.
+
+This module detects which re-fetched posts actually changed since the last
+poll and reports their score and comment deltas.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.data_models import RedditPost
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+@dataclass
+class PostDelta:
+    """Change of a post between two observations."""
+
+    post: RedditPost
+    is_new: bool
+    score_delta: int
+    comments_delta: int
+    elapsed: float  # seconds since the previous observation
+
+    @property
+    def score_velocity(self) -> float:
+        """Get the score change per hour since the previous observation."""
+        return self.score_delta * 3600 / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def comment_velocity(self) -> float:
+        """Get the comment growth per hour since the previous observation."""
+        return self.comments_delta * 3600 / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class ChangeTracker:
+    """Keeps the last seen version of each post and emits only real changes."""
+
+    def __init__(self, min_score_delta: int = 1, min_comments_delta: int = 1,
+                 emit_new: bool = True):
+        """
+        Initialize the change tracker.
+
+        Args:
+            min_score_delta: Smallest absolute score change reported
+            min_comments_delta: Smallest absolute comment count change reported
+            emit_new: Whether posts seen for the first time are reported
+        """
+        self.min_score_delta = min_score_delta
+        self.min_comments_delta = min_comments_delta
+        self.emit_new = emit_new
+        # post id -> (score, num_comments, last seen time)
+        self._seen: Dict[str, Tuple[int, int, float]] = {}
+        self.emitted = 0
+        self.suppressed = 0
+
+    def observe(self, post: RedditPost, now: Optional[float] = None) -> Optional[PostDelta]:
+        """
+        Record a fetched post and get its change, if any.
+
+        The stored version is only replaced when a change is reported, so
+        changes below the thresholds accumulate across polls.
+
+        Args:
+            post: The fetched post
+            now: Observation time (defaults to time.time())
+
+        Returns:
+            Optional[PostDelta]: The change, or None if the post is unchanged
+        """
+        now = time.time() if now is None else now
+        previous = self._seen.get(post.id)
+
+        if previous is None:
+            self._seen[post.id] = (post.score, post.num_comments, now)
+            if not self.emit_new:
+                self.suppressed += 1
+                return None
+            self.emitted += 1
+            return PostDelta(post, True, 0, 0, 0.0)
+
+        score, num_comments, seen_at = previous
+        score_delta = post.score - score
+        comments_delta = post.num_comments - num_comments
+        if (abs(score_delta) < self.min_score_delta
+                and abs(comments_delta) < self.min_comments_delta):
+            self.suppressed += 1
+            return None
+
+        self._seen[post.id] = (post.score, post.num_comments, now)
+        self.emitted += 1
+        return PostDelta(post, False, score_delta, comments_delta, now - seen_at)
+
+    def track(self, posts: Iterable[RedditPost], now: Optional[float] = None) -> List[PostDelta]:
+        """
+        Record a batch of fetched posts and get the changes.
+
+        Args:
+            posts: Fetched posts
+            now: Observation time (defaults to time.time())
+
+        Returns:
+            List[PostDelta]: Changes, in input order
+        """
+        now = time.time() if now is None else now
+        deltas = [delta for delta in (self.observe(post, now) for post in posts) if delta is not None]
+        logger.debug(f"{len(deltas)} changed posts, {self.suppressed} suppressed so far")
+        return deltas
+
+    def changed_posts(self, posts: Iterable[RedditPost], now: Optional[float] = None) -> List[RedditPost]:
+        """
+        Filter a batch of fetched posts down to the new or changed ones.
+
+        Args:
+            posts: Fetched posts
+            now: Observation time (defaults to time.time())
+
+        Returns:
+            List[RedditPost]: Posts that should be passed downstream
+        """
+        return [delta.post for delta in self.track(posts, now)]
+
+    def forget(self, older_than: float) -> int:
+        """
+        Drop posts whose last reported change is older than a timestamp.
+
+        Args:
+            older_than: Unix time cutoff
+
+        Returns:
+            int: Number of posts dropped
+        """
+        stale = [post_id for post_id, (_, _, seen_at) in self._seen.items() if seen_at < older_than]
+        for post_id in stale:
+            del self._seen[post_id]
+        return len(stale)
+
+    def snapshot_state(self) -> Dict[str, object]:
+        """Get the tracked versions and counters for a snapshot."""
+        return {'seen': dict(self._seen), 'emitted': self.emitted, 'suppressed': self.suppressed}
+
+    def restore_state(self, state: Dict[str, object]) -> None:
+        """
+        Restore the tracked versions and counters from a snapshot.
+
+        Args:
+            state: State returned by snapshot_state()
+        """
+        self._seen = dict(state['seen'])
+        self.emitted = state['emitted']
+        self.suppressed = state['suppressed']
+
+    def __len__(self) -> int:
+        """Get the number of tracked posts."""
+        return len(self._seen)
+
+    def __contains__(self, post_id: str) -> bool:
+        """Check whether a post id is tracked."""
+        return post_id in self._seen
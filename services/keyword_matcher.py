@@ -0,0 +1,312 @@
+"""
+Keyword Matcher module for the Reddit Fetcher application.
+
+This module matches posts against a large set of watched keywords in a
+single pass over their text, using an Aho-Corasick automaton instead of one
+substring search per keyword.
+"""
+
+import os
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from core.data_models import RedditPost
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+@dataclass
+class KeywordAlert:
+    """A post that mentions at least one watched keyword."""
+
+    post: RedditPost
+    keywords: List[str]  # in order of first occurrence
+
+
+class _Automaton:
+    """Aho-Corasick automaton over a fixed set of (already folded) keywords."""
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Build the automaton.
+
+        Args:
+            keywords: Keywords to match
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[str, ...]] = [()]
+        self.size = 0
+
+        for keyword in keywords:
+            self._insert(keyword)
+        self._link()
+
+    def _insert(self, keyword: str) -> None:
+        """Add a keyword to the trie."""
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = next_state
+        if keyword not in self._out[state]:
+            self._out[state] += (keyword,)
+            self.size += 1
+
+    def _link(self) -> None:
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                # The failure target is shallower, so its outputs are final already
+                self._out[child] += self._out[self._fail[child]]
+
+    def scan(self, text: str) -> Iterator[Tuple[int, str]]:
+        """
+        Find all keyword occurrences in a text.
+
+        Args:
+            text: Text to scan (folded like the keywords)
+
+        Yields:
+            Tuple[int, str]: End index (exclusive) and keyword of each occurrence
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                for keyword in out[state]:
+                    yield index + 1, keyword
+
+
+class KeywordMatcher:
+    """Matches posts against many keywords at once, with cheap incremental reloads."""
+
+    DEFAULT_FIELDS = ("title", "selftext")
+    # Added keywords go to a small side automaton until it outgrows this share
+    # of the main one; removed keywords are masked until the same share is reached
+    REBUILD_RATIO = 0.1
+    MIN_PENDING = 64
+
+    def __init__(self, keywords: Iterable[str] = (), case_sensitive: bool = False,
+                 whole_words: bool = True, fields: Tuple[str, ...] = DEFAULT_FIELDS):
+        """
+        Initialize the matcher.
+
+        Args:
+            keywords: Keywords to watch
+            case_sensitive: Whether matching respects case (otherwise casefolded)
+            whole_words: Whether matches must not be part of a longer word
+            fields: RedditPost text fields that are scanned
+        """
+        self.case_sensitive = case_sensitive
+        self.whole_words = whole_words
+        self.fields = fields
+        self._labels: Dict[str, str] = {}  # folded keyword -> keyword as given
+        self._main = _Automaton(())
+        self._delta = _Automaton(())
+        self._pending: List[str] = []  # keywords held by the side automaton
+        self._removed: Set[str] = set()
+        self._file_mtime: Optional[float] = None
+        self.add(keywords)
+
+    def _fold(self, text: str) -> str:
+        """Normalize text the way keywords are normalized."""
+        return text if self.case_sensitive else text.casefold()
+
+    def add(self, keywords: Iterable[str]) -> int:
+        """
+        Start watching keywords.
+
+        Args:
+            keywords: Keywords to add
+
+        Returns:
+            int: Number of keywords that were not watched yet
+        """
+        new = {}
+        for keyword in keywords:
+            keyword = keyword.strip()
+            folded = self._fold(keyword)
+            if folded and folded not in self._labels and folded not in new:
+                new[folded] = keyword
+        if not new:
+            return 0
+
+        self._labels.update(new)
+        revived = self._removed.intersection(new)
+        self._removed -= revived
+        pending = [folded for folded in new if folded not in revived]
+        if pending:
+            # Rebuilding the small side automaton is cheap; the main one is kept
+            self._pending.extend(pending)
+            self._delta = _Automaton(self._pending)
+        self._maybe_compact()
+        return len(new)
+
+    def remove(self, keywords: Iterable[str]) -> int:
+        """
+        Stop watching keywords.
+
+        Args:
+            keywords: Keywords to remove
+
+        Returns:
+            int: Number of keywords that were watched
+        """
+        removed = 0
+        for keyword in keywords:
+            folded = self._fold(keyword.strip())
+            if self._labels.pop(folded, None) is not None:
+                self._removed.add(folded)
+                removed += 1
+        if removed:
+            self._maybe_compact()
+        return removed
+
+    def reload(self, keywords: Iterable[str]) -> Tuple[int, int]:
+        """
+        Replace the watched keywords, touching only the ones that changed.
+
+        Args:
+            keywords: The complete new keyword list
+
+        Returns:
+            Tuple[int, int]: Number of keywords added and removed
+        """
+        wanted = {self._fold(keyword.strip()): keyword.strip() for keyword in keywords if keyword.strip()}
+        removed = self.remove([self._labels[folded] for folded in set(self._labels) - set(wanted)])
+        added = self.add(keyword for folded, keyword in wanted.items() if folded not in self._labels)
+        if added or removed:
+            logger.info(f"Keyword list reloaded: {added} added, {removed} removed, {len(self)} watched")
+        return added, removed
+
+    def reload_file(self, path: str) -> bool:
+        """
+        Reload the keywords from a file if it changed since the last call.
+
+        The file holds one keyword per line; blank lines and lines starting
+        with # are ignored.
+
+        Args:
+            path: Keyword file path
+
+        Returns:
+            bool: True if the file was read
+        """
+        mtime = os.stat(path).st_mtime
+        if mtime == self._file_mtime:
+            return False
+        with open(path, 'r', encoding='utf-8') as f:
+            keywords = [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+        self._file_mtime = mtime
+        self.reload(keywords)
+        return True
+
+    def _maybe_compact(self) -> None:
+        """Fold pending additions and removals into the main automaton when they pile up."""
+        limit = max(self.MIN_PENDING, self.REBUILD_RATIO * self._main.size)
+        if self._delta.size <= limit and len(self._removed) <= limit:
+            return
+        self._main = _Automaton(self._labels)
+        self._delta = _Automaton(())
+        self._pending = []
+        self._removed.clear()
+        logger.debug(f"Keyword automaton rebuilt with {self._main.size} keywords")
+
+    def snapshot_state(self) -> List[str]:
+        """Get the watched keywords for a snapshot."""
+        return list(self._labels.values())
+
+    def restore_state(self, state: List[str]) -> None:
+        """
+        Restore the watched keywords from a snapshot.
+
+        Args:
+            state: State returned by snapshot_state()
+        """
+        self.reload(state)
+
+    @staticmethod
+    def _is_word_char(char: str) -> bool:
+        """Check whether a character belongs to a word."""
+        return char.isalnum() or char == "_"
+
+    def find(self, text: str) -> List[str]:
+        """
+        Find the watched keywords occurring in a text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            List[str]: Matched keywords in order of first occurrence
+        """
+        folded = self._fold(text)
+        matches: Dict[str, int] = {}
+        for automaton in (self._main, self._delta):
+            if not automaton.size:
+                continue
+            for end, keyword in automaton.scan(folded):
+                if keyword in matches or keyword in self._removed:
+                    continue
+                start = end - len(keyword)
+                if self.whole_words and (
+                        (start > 0 and self._is_word_char(keyword[0]) and self._is_word_char(folded[start - 1]))
+                        or (end < len(folded) and self._is_word_char(keyword[-1])
+                            and self._is_word_char(folded[end]))):
+                    continue
+                matches[keyword] = start
+        return [self._labels[keyword] for keyword in sorted(matches, key=matches.get)]
+
+    def match(self, post: RedditPost) -> List[str]:
+        """
+        Find the watched keywords a post mentions.
+
+        Args:
+            post: The post to scan
+
+        Returns:
+            List[str]: Matched keywords in order of first occurrence
+        """
+        # Fields are joined with a newline so no keyword spans two of them
+        text = "\n".join(getattr(post, field) or "" for field in self.fields)
+        return self.find(text)
+
+    def alerts(self, posts: Iterable[RedditPost]) -> Iterator[KeywordAlert]:
+        """
+        Scan a stream of posts and emit an alert for each one that matches.
+
+        Args:
+            posts: Posts to scan (list or stream)
+
+        Yields:
+            KeywordAlert: Posts with their matched keywords
+        """
+        for post in posts:
+            keywords = self.match(post)
+            if keywords:
+                yield KeywordAlert(post, keywords)
+
+    def __len__(self) -> int:
+        """Get the number of watched keywords."""
+        return len(self._labels)
+
+    def __contains__(self, keyword: str) -> bool:
+        """Check whether a keyword is watched."""
+        return self._fold(keyword.strip()) in self._labels
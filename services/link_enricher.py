@@ -0,0 +1,437 @@
+"""
+Link Enricher module for the Reddit Fetcher application.
+
+This module resolves the URLs of link posts to page metadata (final URL,
+title, description, thumbnail). URLs are deduplicated before fetching and
+fetched concurrently through a pooled HTTP session, with a cap on the number
+of requests in flight per domain. Results are kept in a disk cache so the
+same page is not fetched again on the next run.
+"""
+
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict
+from html.parser import HTMLParser
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urljoin, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from core.data_models import LinkMetadata, RedditPost
+from core.pipeline import Stage
+from services.dedup import normalize_url
+from utils.disk_cache import DiskCache
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Hosts whose links point back at Reddit itself and are not worth resolving
+REDDIT_HOSTS = ("reddit.com", "redd.it", "redditmedia.com")
+
+_HEADER_CHARSET = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+# Matches both <meta charset="..."> and <meta http-equiv=... content="text/html; charset=...">
+_META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+_META_SNIFF_BYTES = 4096
+
+class _MetadataParser(HTMLParser):
+    """Extracts the title and Open Graph / Twitter card tags from a page head."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title: Optional[str] = None
+        self.meta: Dict[str, str] = {}
+        self.done = False
+        self._in_title = False
+        self._title_parts: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "title":
+            self._in_title = True
+        elif tag == "meta":
+            attributes = dict(attrs)
+            name = (attributes.get("property") or attributes.get("name") or "").lower()
+            content = attributes.get("content")
+            if name and content and name not in self.meta:
+                self.meta[name] = content.strip()
+        elif tag == "body":
+            self.done = True
+
+    def handle_endtag(self, tag):
+        if tag == "title" and self._in_title:
+            self._in_title = False
+            self.title = " ".join("".join(self._title_parts).split()) or None
+        elif tag == "head":
+            self.done = True
+
+    def handle_data(self, data):
+        if self._in_title:
+            self._title_parts.append(data)
+
+
+def parse_metadata(html: str, base_url: str) -> Dict[str, Optional[str]]:
+    """
+    Extract the title, description and thumbnail URL from an HTML page.
+
+    Open Graph tags take precedence over the <title> element and Twitter
+    card tags. Parsing stops at the end of the document head.
+
+    Args:
+        html: Page markup (at least its head)
+        base_url: URL the page was served from, for relative thumbnail URLs
+
+    Returns:
+        Dict[str, Optional[str]]: title, description and thumbnail_url
+    """
+    parser = _MetadataParser()
+    try:
+        # Feed in chunks so a large body after </head> is never parsed
+        for start in range(0, len(html), 8192):
+            parser.feed(html[start:start + 8192])
+            if parser.done:
+                break
+    except Exception as e:  # HTMLParser is lenient, but be defensive about odd markup
+        logger.debug(f"Stopped parsing {base_url}: {str(e)}")
+
+    meta = parser.meta
+    thumbnail = meta.get("og:image") or meta.get("twitter:image")
+    return {
+        'title': meta.get("og:title") or meta.get("twitter:title") or parser.title,
+        'description': meta.get("og:description") or meta.get("twitter:description") or meta.get("description"),
+        'thumbnail_url': urljoin(base_url, thumbnail) if thumbnail else None,
+    }
+
+def page_encoding(content_type: str, body: bytes) -> str:
+    """
+    Get the character encoding of an HTML page.
+
+    A charset in the Content-Type header wins, then a <meta> charset
+    declaration near the start of the page; otherwise UTF-8 is assumed.
+    The HTTP default of ISO-8859-1 for text types is deliberately ignored,
+    as pages that omit the charset are almost always UTF-8.
+
+    Args:
+        content_type: Content-Type header value
+        body: Start of the page
+
+    Returns:
+        str: Encoding name, not checked against the known codecs
+    """
+    match = _HEADER_CHARSET.search(content_type)
+    if match:
+        return match.group(1)
+    match = _META_CHARSET.search(body[:_META_SNIFF_BYTES])
+    if match:
+        return match.group(1).decode('ascii')
+    return "utf-8"
+
+def link_key(url: str) -> str:
+    """
+    Get the key identifying the page behind a URL.
+
+    Args:
+        url: Page URL
+
+    Returns:
+        str: The normalized URL, keeping non-default ports
+    """
+    port = urlsplit(url.strip()).port
+    key = normalize_url(url)
+    return f"{key}#{port}" if port else key
+
+def is_enrichable(post: RedditPost) -> bool:
+    """
+    Check whether a post links to an external http(s) page.
+
+    Args:
+        post: The post
+
+    Returns:
+        bool: True for link posts to non-Reddit pages
+    """
+    if post.is_self or not post.url:
+        return False
+    parts = urlsplit(post.url)
+    host = (parts.hostname or "").lower()
+    if parts.scheme not in ("http", "https"):
+        return False
+    return not any(host == reddit_host or host.endswith("." + reddit_host) for reddit_host in REDDIT_HOSTS)
+
+
+class LinkEnricher:
+    """Resolves link post URLs to page metadata with bounded concurrency and a disk cache."""
+
+    DEFAULT_MAX_WORKERS = 16  # requests in flight overall
+    DEFAULT_PER_DOMAIN_LIMIT = 4  # requests in flight per host
+    DEFAULT_TIMEOUT = (3.05, 10)  # connect and read timeouts in seconds
+    DEFAULT_MAX_BODY_BYTES = 512 * 1024  # bytes of a page read looking for its head
+    DEFAULT_MAX_THUMBNAIL_BYTES = 2 * 1024 * 1024
+    DEFAULT_CACHE_TTL = 7 * 24 * 3600
+    USER_AGENT = "RedditFetcher/1.0 link preview"
+
+    def __init__(self, cache_dir: Optional[str] = None,
+                 max_workers: Optional[int] = None,
+                 per_domain_limit: Optional[int] = None,
+                 timeout: Optional[Union[float, Tuple[float, float]]] = None,
+                 max_body_bytes: Optional[int] = None,
+                 cache_ttl: Optional[float] = None,
+                 fetch_thumbnails: bool = False,
+                 session: Optional[requests.Session] = None):
+        """
+        Initialize the enricher.
+
+        Args:
+            cache_dir: Directory of the disk cache (no caching if omitted)
+            max_workers: Maximum concurrent requests
+            per_domain_limit: Maximum concurrent requests to a single host
+            timeout: requests timeout, seconds or a (connect, read) tuple
+            max_body_bytes: Maximum bytes read from a page
+            cache_ttl: Seconds a cached result stays valid
+            fetch_thumbnails: Whether to download thumbnails into the cache
+            session: HTTP session to use (a pooled one is created if omitted)
+        """
+        self.max_workers = max_workers or self.DEFAULT_MAX_WORKERS
+        self.per_domain_limit = per_domain_limit or self.DEFAULT_PER_DOMAIN_LIMIT
+        self.timeout = timeout or self.DEFAULT_TIMEOUT
+        self.max_body_bytes = max_body_bytes or self.DEFAULT_MAX_BODY_BYTES
+        self.cache_ttl = self.DEFAULT_CACHE_TTL if cache_ttl is None else cache_ttl
+        self.fetch_thumbnails = fetch_thumbnails
+        self.cache = DiskCache(cache_dir) if cache_dir else None
+
+        self._owns_session = session is None
+        self.session = session or self._create_session()
+        self._domain_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {'fetched': 0, 'cached': 0, 'shared': 0, 'failed': 0}
+
+    def _create_session(self) -> requests.Session:
+        """Create a session whose connection pool fits the worker count."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.per_domain_limit)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers['User-Agent'] = self.USER_AGENT
+        return session
+
+    def _domain_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Get the semaphore limiting concurrent requests to the host of a URL."""
+        host = (urlsplit(url).hostname or "").lower()
+        with self._lock:
+            slot = self._domain_slots.get(host)
+            if slot is None:
+                slot = self._domain_slots[host] = threading.BoundedSemaphore(self.per_domain_limit)
+            return slot
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def resolve(self, url: str) -> LinkMetadata:
+        """
+        Resolve a single URL, using the cache when possible.
+
+        Concurrent calls for the same page share a single request. Failures
+        are returned with error set and are not cached, so they are retried on
+        the next run.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            LinkMetadata: Metadata of the page
+        """
+        key = link_key(url)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self._in_flight[key] = Future()
+        if not owner:
+            self._count('shared')
+            return future.result()
+
+        try:
+            # The previous owner may have filled the cache since the check above
+            metadata = self._cached(key) or self._resolve_uncached(key, url)
+            future.set_result(metadata)
+            return metadata
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def _cached(self, key: str) -> Optional[LinkMetadata]:
+        """Get the cached metadata of a page, if still valid."""
+        if self.cache is None:
+            return None
+        record = self.cache.get_record(key, max_age=self.cache_ttl)
+        if record is None:
+            return None
+        self._count('cached')
+        return LinkMetadata(**record)
+
+    def _resolve_uncached(self, key: str, url: str) -> LinkMetadata:
+        """Fetch a page, caching the result when it succeeded."""
+        with self._domain_slot(url):
+            metadata = self._fetch(url)
+
+        # The page's slot is released first: the thumbnail is usually on the same host
+        if metadata.error is None and self.fetch_thumbnails and metadata.thumbnail_url and self.cache is not None:
+            metadata.thumbnail_sha256 = self._fetch_thumbnail(metadata.thumbnail_url)
+
+        if metadata.error is None:
+            self._count('fetched')
+            if self.cache is not None:
+                self.cache.put_record(key, asdict(metadata))
+        else:
+            self._count('failed')
+            logger.debug(f"Could not resolve {url}: {metadata.error}")
+        return metadata
+
+    def _fetch(self, url: str) -> LinkMetadata:
+        """Fetch a page and parse its metadata."""
+        metadata = LinkMetadata(url=url, fetched_at=time.time())
+        try:
+            with self.session.get(url, timeout=self.timeout, stream=True, allow_redirects=True) as response:
+                metadata.final_url = response.url
+                metadata.status = response.status_code
+                content_type = response.headers.get('Content-Type', "")
+                metadata.content_type = content_type.split(";")[0].strip() or None
+                if response.status_code >= 400:
+                    metadata.error = f"HTTP {response.status_code}"
+                    return metadata
+                if metadata.content_type in ("text/html", "application/xhtml+xml"):
+                    body = self._read(response, self.max_body_bytes)
+                    html = body.decode(page_encoding(content_type, body), errors="replace")
+                    metadata.__dict__.update(parse_metadata(html, response.url))
+                elif metadata.content_type and metadata.content_type.startswith("image/"):
+                    metadata.thumbnail_url = response.url
+        except (requests.RequestException, LookupError, UnicodeError) as e:
+            metadata.error = f"{type(e).__name__}: {str(e)}"
+        return metadata
+
+    def _read(self, response: requests.Response, limit: int) -> bytes:
+        """Read at most limit bytes of a streamed response body."""
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=16384):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= limit or b"</head>" in chunk.lower():
+                break
+        return b"".join(chunks)[:limit]
+
+    def _fetch_thumbnail(self, url: str) -> Optional[str]:
+        """Download a thumbnail into the cache and return its content digest."""
+        try:
+            with self._domain_slot(url):
+                with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                    if response.status_code >= 400:
+                        return None
+                    data = self._read(response, self.DEFAULT_MAX_THUMBNAIL_BYTES + 1)
+        except requests.RequestException as e:
+            logger.debug(f"Could not fetch thumbnail {url}: {str(e)}")
+            return None
+        if len(data) > self.DEFAULT_MAX_THUMBNAIL_BYTES:
+            return None
+        return self.cache.put_blob(data)
+
+    def resolve_many(self, urls: Iterable[str]) -> Dict[str, LinkMetadata]:
+        """
+        Resolve several URLs concurrently, fetching each distinct page once.
+
+        URLs that normalize to the same key (tracking parameters, www.
+        prefixes, ...) share one request.
+
+        Args:
+            urls: Page URLs
+
+        Returns:
+            Dict[str, LinkMetadata]: Metadata by URL, for every input URL
+        """
+        by_key: Dict[str, List[str]] = {}
+        for url in urls:
+            by_key.setdefault(link_key(url), []).append(url)
+        if not by_key:
+            return {}
+
+        representatives = [group[0] for group in by_key.values()]
+        workers = min(self.max_workers, len(representatives))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="link-enricher") as executor:
+            resolved = list(executor.map(self.resolve, representatives))
+
+        results: Dict[str, LinkMetadata] = {}
+        for group, metadata in zip(by_key.values(), resolved):
+            for url in group:
+                results[url] = metadata
+        return results
+
+    def enrich(self, posts: Iterable[RedditPost]) -> List[RedditPost]:
+        """
+        Attach link metadata to the link posts among some posts.
+
+        Args:
+            posts: Posts to enrich (modified in place)
+
+        Returns:
+            List[RedditPost]: The posts, in input order
+        """
+        posts = list(posts)
+        targets = [post for post in posts if is_enrichable(post)]
+        results = self.resolve_many(post.url for post in targets)
+        for post in targets:
+            post.link = results[post.url]
+        logger.info(f"Enriched {len(targets)} link posts "
+                    f"({self.stats['fetched']} fetched, {self.stats['cached']} cached, "
+                    f"{self.stats['failed']} failed)")
+        return posts
+
+    def enrich_post(self, post: RedditPost) -> RedditPost:
+        """
+        Attach link metadata to a single post, for use as a pipeline stage.
+
+        Args:
+            post: Post to enrich (modified in place)
+
+        Returns:
+            RedditPost: The post
+        """
+        if is_enrichable(post):
+            post.link = self.resolve(post.url)
+        return post
+
+    def pipeline_stage(self) -> Stage:
+        """
+        Build the enrich stage of a pipeline.
+
+        A post whose link cannot be resolved is logged and passed on without
+        metadata instead of aborting the run.
+
+        Returns:
+            Stage: Enrich stage emitting every post
+        """
+        def keep_post(post: RedditPost, error: Exception) -> RedditPost:
+            logger.warning(f"Could not enrich post {post.id}: {type(error).__name__}: {str(error)}")
+            return post
+
+        return Stage("enrich", self.enrich_post, workers=self.max_workers, on_error=keep_post)
+
+    def close(self) -> None:
+        """Close the HTTP session if the enricher created it."""
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
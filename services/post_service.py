@@ -4,10 +4,19 @@ Post Service module for the Reddit Fetcher application.
 This module provides post processing services for Reddit posts.
 """
 
-from typing import List, Callable, Optional
+import threading
+from typing import List, Callable, Iterable, Iterator, Optional
 
 from core.data_models import RedditPost
+from core.pipeline import Stage
+from services.dedup import DuplicateIndex, deduplicate
+from services.keyword_matcher import KeywordAlert, KeywordMatcher
+from services.query import Query
+from services.ranking import rank_posts
+from storage.external_sort import external_sort
+from utils.error_handler import ConfigurationError
 from utils.logger import get_logger
+from utils.profiler import StageTimer
 
 logger = get_logger(__name__)
 
@@ -52,6 +61,24 @@ class PostService:
         logger.debug(f"Sorting {len(posts)} posts")
         return sorted(posts, key=key_func, reverse=reverse)
     
+    def sort_posts_external(self, posts: Iterable[RedditPost],
+                            key_func: Callable[[RedditPost], any],
+                            reverse: bool = False,
+                            memory_budget: Optional[int] = None) -> Iterator[RedditPost]:
+        """
+        Sort posts that may not fit in memory, spilling sorted runs to disk.
+        
+        Args:
+            posts: Posts to sort (list or stream)
+            key_func: Function that takes a post and returns a sort key
+            reverse: Whether to sort in reverse order
+            memory_budget: Approximate bytes of posts held in memory at once
+            
+        Returns:
+            Iterator[RedditPost]: Stream of posts in sorted order
+        """
+        return external_sort(posts, key_func, reverse, memory_budget)
+    
     def search_posts(self, posts: List[RedditPost], query: str, 
                     case_sensitive: bool = False) -> List[RedditPost]:
         """
@@ -81,6 +108,109 @@ class PostService:
                    (post.selftext and query in post.selftext)
             ]
     
+    def run_query(self, posts: Iterable[RedditPost], query: Query) -> List[RedditPost]:
+        """
+        Run a declarative query over posts in a single pass.
+        
+        Args:
+            posts: Posts to query (list or stream)
+            query: Query to run
+            
+        Returns:
+            List[RedditPost]: Matching posts in query order
+        """
+        return query.run(posts)
+    
+    def pipeline_stage(self, filter_func: Optional[Callable[[RedditPost], bool]] = None,
+                       query: Optional[Query] = None, timer: Optional[StageTimer] = None,
+                       workers: int = 1) -> Stage:
+        """
+        Build the process stage of a pipeline, dropping posts that do not match.
+        
+        Posts are checked one at a time as they stream through, so the query
+        may limit its results but cannot order them.
+        
+        Args:
+            filter_func: Function that takes a post and returns whether to keep it (optional)
+            query: Query whose conditions, text search and limit posts must pass (optional)
+            timer: Stage timer the processing time is added to (optional)
+            workers: Number of worker threads
+            
+        Returns:
+            Stage: Process stage emitting the matching posts
+            
+        Raises:
+            ConfigurationError: If the query orders its results
+        """
+        if query is not None and query.ordering:
+            raise ConfigurationError("Ordered queries need every post and cannot run as a pipeline stage")
+        timer = timer or StageTimer()
+        predicate = query.compile() if query is not None else None
+        max_results = query.max_results if query is not None else None
+        matched = [0]
+        lock = threading.Lock()
+        
+        def process(post: RedditPost) -> Optional[RedditPost]:
+            with timer.stage("process"):
+                if filter_func is not None and not filter_func(post):
+                    return None
+                if predicate is not None and not predicate(post.__getattribute__):
+                    return None
+                if max_results is not None:
+                    with lock:
+                        if matched[0] >= max_results:
+                            return None
+                        matched[0] += 1
+                return post
+        
+        return Stage("process", process, workers=workers)
+    
+    def match_keywords(self, posts: Iterable[RedditPost],
+                       matcher: KeywordMatcher) -> List[KeywordAlert]:
+        """
+        Match posts against all watched keywords, scanning each post once.
+        
+        Args:
+            posts: Posts to scan (list or stream)
+            matcher: Compiled keyword set
+            
+        Returns:
+            List[KeywordAlert]: Matching posts with their keywords
+        """
+        return list(matcher.alerts(posts))
+    
+    def deduplicate_posts(self, posts: List[RedditPost],
+                          index: Optional[DuplicateIndex] = None) -> List[RedditPost]:
+        """
+        Drop reposts, crossposts and near-duplicate titles, keeping the earliest post.
+        
+        Args:
+            posts: List of posts to deduplicate
+            index: Index of previously seen posts to check against (optional)
+            
+        Returns:
+            List[RedditPost]: Original posts in input order
+        """
+        originals, _ = deduplicate(posts, index)
+        return originals
+    
+    def rank_posts(self, posts: List[RedditPost], order: str = "hot",
+                   limit: Optional[int] = None, time_filter: str = "all") -> List[RedditPost]:
+        """
+        Re-rank posts like a Reddit listing, without fetching that listing.
+        
+        Args:
+            posts: List of posts to rank
+            order: hot, top, controversial or new
+            limit: Maximum number of posts returned
+            time_filter: Window of top and controversial rankings
+            
+        Returns:
+            List[RedditPost]: Ranked posts
+        """
+        logger.debug(f"Ranking {len(posts)} posts by {order}")
+        return rank_posts(posts, order, limit, time_filter)
+    
     def filter_by_min_upvotes(self, posts: List[RedditPost], 
                              min_upvotes: int) -> List[RedditPost]:
         """
@@ -0,0 +1,396 @@
+"""
+Query module for the Reddit Fetcher application.
+
+This module provides a declarative query object for filtering, searching,
+ordering and limiting Reddit posts in a single pass.
+
+Example:
+    query = (Query()
+             .where(F.upvotes >= 10, F.comments >= 5)
+             .text("python")
+             .order_by("-score")
+             .limit(20))
+    top_posts = query.run(posts)
+"""
+
+import heapq
+import itertools
+import operator
+from dataclasses import fields
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from core.data_models import RedditPost
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Short names accepted in queries for RedditPost attributes
+FIELD_ALIASES = {
+    'comments': 'num_comments',
+    'ups': 'upvotes',
+    'created': 'created_utc',
+}
+
+POST_FIELDS = tuple(field.name for field in fields(RedditPost))
+
+OPERATORS = {
+    '==': (operator.eq, '='),
+    '!=': (operator.ne, '!='),
+    '<': (operator.lt, '<'),
+    '<=': (operator.le, '<='),
+    '>': (operator.gt, '>'),
+    '>=': (operator.ge, '>='),
+}
+
+def resolve_field(name: str) -> str:
+    """
+    Resolve a field name or alias to a RedditPost attribute.
+
+    Args:
+        name: Field name or alias
+
+    Returns:
+        str: RedditPost attribute name
+
+    Raises:
+        ValueError: If the field does not exist
+    """
+    resolved = FIELD_ALIASES.get(name, name)
+    if resolved not in POST_FIELDS:
+        raise ValueError(f"Unknown post field: {name}")
+    return resolved
+
+
+class Condition:
+    """A comparison between a post field and a constant."""
+
+    def __init__(self, field: str, op: str, value: Any):
+        """
+        Initialize the condition.
+
+        Args:
+            field: RedditPost attribute name
+            op: Comparison operator (==, !=, <, <=, >, >=)
+            value: Value to compare against
+        """
+        self.field = field
+        self.op = op
+        self.value = value
+
+    def matches(self, value: Any) -> bool:
+        """Check whether a field value satisfies the condition."""
+        if value is None:
+            return False
+        return OPERATORS[self.op][0](value, self.value)
+
+    def __repr__(self) -> str:
+        return f"Condition({self.field} {self.op} {self.value!r})"
+
+
+class Field:
+    """Reference to a post field, used to build conditions with comparison operators."""
+
+    def __init__(self, name: str):
+        """
+        Initialize the field reference.
+
+        Args:
+            name: Field name or alias
+        """
+        self.name = resolve_field(name)
+
+    def __eq__(self, value) -> Condition:
+        return Condition(self.name, '==', value)
+
+    def __ne__(self, value) -> Condition:
+        return Condition(self.name, '!=', value)
+
+    def __lt__(self, value) -> Condition:
+        return Condition(self.name, '<', value)
+
+    def __le__(self, value) -> Condition:
+        return Condition(self.name, '<=', value)
+
+    def __gt__(self, value) -> Condition:
+        return Condition(self.name, '>', value)
+
+    def __ge__(self, value) -> Condition:
+        return Condition(self.name, '>=', value)
+
+    __hash__ = None
+
+
+class _FieldFactory:
+    """Creates Field references through attribute access, e.g. F.upvotes."""
+
+    def __getattr__(self, name: str) -> Field:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return Field(name)
+
+F = _FieldFactory()
+
+
+class _Descending:
+    """Wraps a non-numeric sort value so that it orders in reverse."""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def _post_accessor(post: RedditPost) -> Callable[[str], Any]:
+    """Get the field getter of a post."""
+    return post.__getattribute__
+
+
+class Query:
+    """Immutable, chainable query over Reddit posts."""
+
+    def __init__(self):
+        """Initialize an empty query that matches every post."""
+        self.conditions: Tuple[Condition, ...] = ()
+        self.search_text: Optional[str] = None
+        self.case_sensitive = False
+        self.ordering: Tuple[Tuple[str, bool], ...] = ()
+        self.max_results: Optional[int] = None
+
+    def _copy(self) -> "Query":
+        """Create a copy of the query to apply a modification to."""
+        query = Query()
+        query.__dict__.update(self.__dict__)
+        return query
+
+    def where(self, *conditions: Condition, **equals: Any) -> "Query":
+        """
+        Add conditions that every result must satisfy.
+
+        Args:
+            *conditions: Conditions built from fields, e.g. F.upvotes >= 10
+            **equals: Equality conditions by field name, e.g. author="spez"
+
+        Returns:
+            Query: New query with the conditions added
+        """
+        query = self._copy()
+        added = list(conditions)
+        added.extend(Condition(resolve_field(name), '==', value) for name, value in equals.items())
+        query.conditions = self.conditions + tuple(added)
+        return query
+
+    def text(self, search_text: str, case_sensitive: bool = False) -> "Query":
+        """
+        Require the title or self text to contain a string.
+
+        Args:
+            search_text: Text to search for
+            case_sensitive: Whether to use case-sensitive search
+
+        Returns:
+            Query: New query with the text search set
+        """
+        query = self._copy()
+        query.search_text = search_text
+        query.case_sensitive = case_sensitive
+        return query
+
+    def order_by(self, *keys: str) -> "Query":
+        """
+        Order results by one or more fields; prefix a field with '-' for descending.
+
+        Args:
+            *keys: Field names, e.g. "-score", "created_utc"
+
+        Returns:
+            Query: New query with the ordering set
+        """
+        query = self._copy()
+        query.ordering = tuple(
+            (resolve_field(key.lstrip('-')), key.startswith('-')) for key in keys
+        )
+        return query
+
+    def limit(self, count: int) -> "Query":
+        """
+        Limit the number of results.
+
+        Args:
+            count: Maximum number of results
+
+        Returns:
+            Query: New query with the limit set
+        """
+        query = self._copy()
+        query.max_results = count
+        return query
+
+    def compile(self) -> Callable[[Callable[[str], Any]], bool]:
+        """
+        Compile the conditions and text search into a single predicate.
+
+        The predicate takes a getter returning the value of a field by name,
+        so the same compiled query works on posts and on columnar rows.
+
+        Returns:
+            Callable: Predicate over a field getter
+        """
+        conditions = self.conditions
+        search_text = self.search_text
+        if search_text is not None and not self.case_sensitive:
+            search_text = search_text.lower()
+        case_sensitive = self.case_sensitive
+
+        def predicate(get: Callable[[str], Any]) -> bool:
+            for condition in conditions:
+                if not condition.matches(get(condition.field)):
+                    return False
+
+            if search_text is not None:
+                title = get('title') or ''
+                selftext = get('selftext') or ''
+                if not case_sensitive:
+                    title = title.lower()
+                    selftext = selftext.lower()
+                if search_text not in title and search_text not in selftext:
+                    return False
+
+            return True
+
+        return predicate
+
+    def _sort_key(self, accessor: Callable[[Any], Callable[[str], Any]]) -> Optional[Callable[[Any], tuple]]:
+        """Build a sort key over rows honouring the direction of every ordering field."""
+        if not self.ordering:
+            return None
+        ordering = self.ordering
+
+        def key(row) -> tuple:
+            get = accessor(row)
+            values = []
+            for field, descending in ordering:
+                value = get(field)
+                if value is None:
+                    # Missing values sort last regardless of direction
+                    values.append((1, 0))
+                    continue
+                if descending:
+                    value = -value if isinstance(value, (int, float)) else _Descending(value)
+                values.append((0, value))
+            return tuple(values)
+
+        return key
+
+    def _select(self, rows: Iterable[Any], accessor: Callable[[Any], Callable[[str], Any]]) -> List[Any]:
+        """Filter, order and limit rows in one pass over the input."""
+        predicate = self.compile()
+        matches = (row for row in rows if predicate(accessor(row)))
+        key = self._sort_key(accessor)
+
+        if key is None:
+            if self.max_results is None:
+                return list(matches)
+            return list(itertools.islice(matches, self.max_results))
+
+        if self.max_results is not None:
+            # Top-N selection keeps a heap of at most max_results rows
+            return heapq.nsmallest(self.max_results, matches, key=key)
+        return sorted(matches, key=key)
+
+    def run(self, posts: Iterable[RedditPost]) -> List[RedditPost]:
+        """
+        Run the query over a list or stream of posts.
+
+        Args:
+            posts: Posts to query; consumed exactly once
+
+        Returns:
+            List[RedditPost]: Matching posts in query order
+        """
+        results = self._select(posts, _post_accessor)
+        logger.debug(f"Query matched {len(results)} posts")
+        return results
+
+    def stream(self, posts: Iterable[RedditPost]) -> Iterator[RedditPost]:
+        """
+        Lazily yield matching posts from a stream.
+
+        Unordered queries yield matches as they arrive; ordered queries must
+        consume the whole stream first.
+
+        Args:
+            posts: Posts to query
+
+        Returns:
+            Iterator[RedditPost]: Matching posts
+        """
+        if self.ordering:
+            yield from self.run(posts)
+            return
+
+        predicate = self.compile()
+        matches = (post for post in posts if predicate(post.__getattribute__))
+        yield from itertools.islice(matches, self.max_results)
+
+    def run_columns(self, columns: Dict[str, Sequence[Any]]) -> List[int]:
+        """
+        Run the query over a columnar batch.
+
+        Args:
+            columns: Mapping of field name to a sequence of values, one per row
+                (e.g. pyarrow Table.to_pydict() or PostArchive columns)
+
+        Returns:
+            List[int]: Indices of the matching rows in query order
+        """
+        row_count = len(next(iter(columns.values()))) if columns else 0
+        return self._select(range(row_count), lambda row: lambda field: columns[field][row])
+
+    def to_sql(self, table: str = "posts") -> Tuple[str, List[Any]]:
+        """
+        Translate the query into a parameterized SQL statement.
+
+        The statement uses "?" placeholders and SQLite's instr() for text search,
+        and orders missing values last like run().
+
+        Args:
+            table: Name of the table holding the posts
+
+        Returns:
+            Tuple[str, List[Any]]: SQL statement and its parameters
+        """
+        clauses = []
+        params: List[Any] = []
+        for condition in self.conditions:
+            clauses.append(f"{condition.field} {OPERATORS[condition.op][1]} ?")
+            params.append(condition.value)
+
+        if self.search_text is not None:
+            if self.case_sensitive:
+                clauses.append("(instr(title, ?) > 0 OR instr(coalesce(selftext, ''), ?) > 0)")
+                params.extend([self.search_text] * 2)
+            else:
+                clauses.append("(instr(lower(title), ?) > 0 "
+                               "OR instr(lower(coalesce(selftext, '')), ?) > 0)")
+                params.extend([self.search_text.lower()] * 2)
+
+        sql = f"SELECT * FROM {table}"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        if self.ordering:
+            # NULLs sort last in either direction, matching run()
+            sql += " ORDER BY " + ", ".join(
+                f"{field} IS NULL, {field} {'DESC' if descending else 'ASC'}"
+                for field, descending in self.ordering
+            )
+        if self.max_results is not None:
+            sql += " LIMIT ?"
+            params.append(self.max_results)
+
+        return sql, params
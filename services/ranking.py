@@ -0,0 +1,324 @@
+"""
+Ranking module for the Reddit Fetcher application.
+
+This module re-ranks posts already in memory the way Reddit orders its
+listings (hot, top, controversial, new), so one fetched listing can serve
+several orderings without more API calls. Scores are computed column-wise
+over a whole batch, with numpy when it is installed and plain Python
+otherwise.
+"""
+
+import math
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy
+except ImportError:  # numpy is an optional dependency
+    numpy = None
+
+from core.data_models import RedditPost
+from utils.error_handler import ConfigurationError
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Reference time and decay of Reddit's hot formula: 12.5 hours of age
+# outweigh a tenfold score difference
+HOT_EPOCH = 1134028003
+HOT_DECAY = 45000
+
+# Seconds covered by each time filter of top and controversial listings
+TIME_WINDOWS = {
+    "hour": 3600,
+    "day": 24 * 3600,
+    "week": 7 * 24 * 3600,
+    "month": 30 * 24 * 3600,
+    "year": 365 * 24 * 3600,
+    "all": None,
+}
+
+ORDERS = ("hot", "top", "controversial", "new")
+
+def estimated_votes(post: RedditPost) -> Tuple[int, int]:
+    """
+    Get the upvotes and downvotes of a post, estimating them when the API reports no downvotes.
+
+    Reddit reports downs as 0 and ups equal to the score in listings, but
+    also an upvote ratio r = ups / (ups + downs). With score = ups - downs,
+    this gives downs = score * (1 - r) / (2r - 1). Without a usable ratio,
+    the difference between upvotes and score is used instead.
+
+    Args:
+        post: The post
+
+    Returns:
+        Tuple[int, int]: Upvote and downvote counts
+    """
+    upvotes = post.upvotes or 0
+    if post.downvotes:
+        return upvotes, post.downvotes
+    score = post.score or 0
+    ratio = post.upvote_ratio
+    if ratio is not None and ratio != 0.5 and score != 0:
+        downvotes = max(0, round(score * (1 - ratio) / (2 * ratio - 1)))
+        return max(0, score + downvotes), downvotes
+    return upvotes, max(0, upvotes - score)
+
+def estimated_downvotes(post: RedditPost) -> int:
+    """
+    Get the downvotes of a post, estimating them when the API reports none.
+
+    Args:
+        post: The post
+
+    Returns:
+        int: Downvote count (see estimated_votes())
+    """
+    return estimated_votes(post)[1]
+
+def hot_score(score: float, created_utc: float) -> float:
+    """
+    Compute Reddit's hot score of a single post.
+
+    Args:
+        score: Net score
+        created_utc: Creation time as a Unix timestamp
+
+    Returns:
+        float: Hot score, higher first
+    """
+    order = math.log10(max(abs(score), 1))
+    sign = 1 if score > 0 else -1 if score < 0 else 0
+    return round(sign * order + (created_utc - HOT_EPOCH) / HOT_DECAY, 7)
+
+def controversy_score(upvotes: float, downvotes: float) -> float:
+    """
+    Compute Reddit's controversy score of a single post.
+
+    Posts with many votes split evenly score highest.
+
+    Args:
+        upvotes: Upvote count
+        downvotes: Downvote count
+
+    Returns:
+        float: Controversy score, higher first (0 without votes on both sides)
+    """
+    if upvotes <= 0 or downvotes <= 0:
+        return 0.0
+    balance = downvotes / upvotes if upvotes > downvotes else upvotes / downvotes
+    return (upvotes + downvotes) ** balance
+
+
+class PostColumns:
+    """Vote and time columns of a batch of posts, extracted once for several rankings."""
+
+    def __init__(self, posts: Sequence[RedditPost], use_numpy: Optional[bool] = None):
+        """
+        Extract the columns.
+
+        Args:
+            posts: Posts to rank
+            use_numpy: Whether to use numpy arrays (defaults to whether numpy is installed)
+
+        Raises:
+            ConfigurationError: If numpy is requested but not installed
+        """
+        if use_numpy and numpy is None:
+            raise ConfigurationError("Vectorized ranking requires numpy (pip install numpy)")
+        self.use_numpy = numpy is not None if use_numpy is None else use_numpy
+        self.posts = list(posts)
+        score = [float(post.score or 0) for post in self.posts]
+        votes = [estimated_votes(post) for post in self.posts]
+        upvotes = [float(ups) for ups, _ in votes]
+        downvotes = [float(downs) for _, downs in votes]
+        created_utc = [float(post.created_utc) for post in self.posts]
+        if self.use_numpy:
+            self.score = numpy.array(score)
+            self.upvotes = numpy.array(upvotes)
+            self.downvotes = numpy.array(downvotes)
+            self.created_utc = numpy.array(created_utc)
+        else:
+            self.score, self.upvotes, self.downvotes, self.created_utc = score, upvotes, downvotes, created_utc
+
+    def __len__(self) -> int:
+        return len(self.posts)
+
+    def hot(self) -> Sequence[float]:
+        """Get the hot score of every post."""
+        if not self.use_numpy:
+            return list(map(hot_score, self.score, self.created_utc))
+        order = numpy.log10(numpy.maximum(numpy.abs(self.score), 1.0))
+        return numpy.round(numpy.sign(self.score) * order + (self.created_utc - HOT_EPOCH) / HOT_DECAY, 7)
+
+    def controversy(self) -> Sequence[float]:
+        """Get the controversy score of every post."""
+        if not self.use_numpy:
+            return list(map(controversy_score, self.upvotes, self.downvotes))
+        ups, downs = self.upvotes, self.downvotes
+        voted = (ups > 0) & (downs > 0)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            balance = numpy.where(ups > downs, downs / ups, ups / downs)
+        return numpy.where(voted, (ups + downs) ** numpy.where(voted, balance, 0.0), 0.0)
+
+    def within(self, window: Optional[float], now: float) -> Sequence[bool]:
+        """
+        Get whether each post was created in the last window seconds.
+
+        Args:
+            window: Window length in seconds, or None for all posts
+            now: Current Unix time
+
+        Returns:
+            Sequence[bool]: Mask of the posts inside the window
+        """
+        if window is None:
+            return numpy.ones(len(self), dtype=bool) if self.use_numpy else [True] * len(self)
+        cutoff = now - window
+        if self.use_numpy:
+            return self.created_utc >= cutoff
+        return [created >= cutoff for created in self.created_utc]
+
+    def order_by(self, keys: Sequence[float], mask: Optional[Sequence[bool]] = None,
+                 limit: Optional[int] = None) -> List[int]:
+        """
+        Get the indices of the posts in descending key order.
+
+        Ties keep their input order.
+
+        Args:
+            keys: Sort key of every post
+            mask: Posts to include (all if omitted)
+            limit: Maximum number of indices returned
+
+        Returns:
+            List[int]: Post indices, highest key first
+        """
+        if self.use_numpy:
+            indices = numpy.flatnonzero(mask) if mask is not None else numpy.arange(len(self))
+            ranked = indices[numpy.argsort(-numpy.asarray(keys)[indices], kind="stable")]
+            return ranked[:limit].tolist()
+        indices = [i for i in range(len(self)) if mask[i]] if mask is not None else range(len(self))
+        ranked = sorted(indices, key=keys.__getitem__, reverse=True)
+        return ranked[:limit]
+
+
+class RankingEngine:
+    """Ranks a pool of posts in the orderings of Reddit listings."""
+
+    def __init__(self, posts: Iterable[RedditPost] = (), use_numpy: Optional[bool] = None):
+        """
+        Initialize the engine.
+
+        Args:
+            posts: Initial pool of posts
+            use_numpy: Whether to use numpy (defaults to whether numpy is installed)
+        """
+        self.use_numpy = use_numpy
+        self._posts: Dict[str, RedditPost] = {}
+        self._columns: Optional[PostColumns] = None
+        self._scores: Dict[str, Sequence[float]] = {}
+        self.add(posts)
+
+    def add(self, posts: Iterable[RedditPost]) -> None:
+        """
+        Add posts to the pool; a post with a known id replaces the older version.
+
+        Args:
+            posts: Posts to add
+        """
+        before = len(self._posts)
+        for post in posts:
+            self._posts[post.id] = post
+        # Scores depend on every post's votes, so recompute them on the next rank
+        self._columns = None
+        self._scores = {}
+        logger.debug(f"Ranking pool grew from {before} to {len(self._posts)} posts")
+
+    def __len__(self) -> int:
+        return len(self._posts)
+
+    def _keys(self, order: str) -> Sequence[float]:
+        """Get the sort keys of an order, computing them once per pool version."""
+        if self._columns is None:
+            self._columns = PostColumns(list(self._posts.values()), self.use_numpy)
+        keys = self._scores.get(order)
+        if keys is None:
+            columns = self._columns
+            if order == "hot":
+                keys = columns.hot()
+            elif order == "top":
+                keys = columns.score
+            elif order == "controversial":
+                keys = columns.controversy()
+            else:
+                keys = columns.created_utc
+            self._scores[order] = keys
+        return keys
+
+    def rank(self, order: str = "hot", limit: Optional[int] = None,
+             time_filter: str = "all", now: Optional[float] = None) -> List[RedditPost]:
+        """
+        Rank the pool.
+
+        Args:
+            order: hot, top, controversial or new
+            limit: Maximum number of posts returned
+            time_filter: Window of top and controversial rankings
+                (hour, day, week, month, year, all)
+            now: Current Unix time for the window (defaults to time.time())
+
+        Returns:
+            List[RedditPost]: Ranked posts
+
+        Raises:
+            ConfigurationError: If the order or time filter is unknown
+        """
+        if order not in ORDERS:
+            raise ConfigurationError(f"Unsupported ranking: {order}")
+        if time_filter not in TIME_WINDOWS:
+            raise ConfigurationError(f"Unsupported time filter: {time_filter}")
+        if not self._posts:
+            return []
+
+        keys = self._keys(order)
+        columns = self._columns
+        mask = None
+        if order in ("top", "controversial") and TIME_WINDOWS[time_filter] is not None:
+            mask = columns.within(TIME_WINDOWS[time_filter], time.time() if now is None else now)
+        return [columns.posts[i] for i in columns.order_by(keys, mask, limit)]
+
+    def rank_all(self, orders: Iterable[str] = ORDERS, limit: Optional[int] = None,
+                 time_filter: str = "all", now: Optional[float] = None) -> Dict[str, List[RedditPost]]:
+        """
+        Rank the pool in several orders.
+
+        Args:
+            orders: Orders to compute
+            limit: Maximum number of posts per order
+            time_filter: Window of top and controversial rankings
+            now: Current Unix time for the window (defaults to time.time())
+
+        Returns:
+            Dict[str, List[RedditPost]]: Ranked posts by order
+        """
+        now = time.time() if now is None else now
+        return {order: self.rank(order, limit, time_filter, now) for order in orders}
+
+def rank_posts(posts: Iterable[RedditPost], order: str = "hot", limit: Optional[int] = None,
+               time_filter: str = "all", now: Optional[float] = None) -> List[RedditPost]:
+    """
+    Rank posts in one of the orderings of Reddit listings.
+
+    Args:
+        posts: Posts to rank
+        order: hot, top, controversial or new
+        limit: Maximum number of posts returned
+        time_filter: Window of top and controversial rankings
+        now: Current Unix time for the window (defaults to time.time())
+
+    Returns:
+        List[RedditPost]: Ranked posts
+    """
+    return RankingEngine(posts).rank(order, limit, time_filter, now)
@@ -4,49 +4,202 @@ Reddit Service module for the Reddit Fetcher application.
 This module provides high-level services for interacting with the Reddit API.
 """
 
-from typing import List
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import praw
 
 from core.api_client import RedditClient
 from core.data_models import RedditPost
+from core.pipeline import Stage
+from services.ranking import ORDERS, RankingEngine
+from utils.bloom_filter import SeenIdFilter
+from utils.error_handler import RateLimitError, RedditAPIError
 from utils.logger import get_logger
+from utils.profiler import StageTimer
 
 logger = get_logger(__name__)
 
 class RedditService:
     """High-level service for interacting with the Reddit API."""
     
-    def __init__(self, reddit_instance: praw.Reddit):
+    def __init__(self, reddit_instance: praw.Reddit, client: Optional[RedditClient] = None,
+                 timer: Optional[StageTimer] = None):
         """
         Initialize the Reddit service.
         
         Args:
             reddit_instance: Authenticated Reddit instance
+            client: Preconfigured API client (optional)
+            timer: Stage timer the fetch and convert times are added to (optional)
         """
-        self.client = RedditClient(reddit_instance)
+        self.client = client or RedditClient(reddit_instance)
+        self.timer = timer or StageTimer()
+        # Newest post (id, created_utc) seen per subreddit in new listings
+        self.cursors: Dict[str, Tuple[str, float]] = {}
         
-    def get_latest_posts(self, subreddit_name: str, limit: int = 5) -> List[RedditPost]:
+    def get_posts(self, subreddit_name: str, sort: str = "new", limit: int = 5,
+                  time_filter: str = "all") -> List[RedditPost]:
         """
-        Get the latest posts from a subreddit.
+        Get posts from a subreddit in the given sort order.
         
         Args:
             subreddit_name: Name of the subreddit
+            sort: Listing sort (new, hot, rising, top, controversial)
             limit: Maximum number of posts to retrieve
+            time_filter: Time filter for top/controversial listings
             
         Returns:
             List[RedditPost]: List of post data models
         """
-        logger.info(f"Getting latest {limit} posts from r/{subreddit_name}")
+        logger.info(f"Getting {limit} {sort} posts from r/{subreddit_name}")
         
         # Get raw submissions from API client
-        raw_posts = self.client.get_latest_posts(subreddit_name, limit)
+        with self.timer.stage("fetch"):
+            raw_posts = self.client.fetch_listing(subreddit_name, sort, time_filter, limit)
         
         # Convert to our data model
-        posts = [RedditPost.from_praw_submission(post) for post in raw_posts]
+        with self.timer.stage("convert"):
+            posts = [RedditPost.from_praw_submission(post) for post in raw_posts]
         
+        if sort == "new":
+            self._advance_cursor(subreddit_name, posts)
         logger.info(f"Retrieved and processed {len(posts)} posts")
         return posts
+        
+    def get_posts_for_each(self, subreddit_names: List[str], sort: str = "new",
+                           limit: int = 5, time_filter: str = "all"
+                           ) -> Tuple[Dict[str, List[RedditPost]], Dict[str, Exception]]:
+        """
+        Get posts from several subreddits, isolating failures per subreddit.
+        
+        A failing subreddit does not abort the batch; its error is returned
+        instead. Rate limit errors still abort, since they affect every request.
+        
+        Args:
+            subreddit_names: Names of the subreddits
+            sort: Listing sort (new, hot, rising, top, controversial)
+            limit: Maximum number of posts to retrieve per subreddit
+            time_filter: Time filter for top/controversial listings
+            
+        Returns:
+            Tuple[Dict[str, List[RedditPost]], Dict[str, Exception]]: Posts of the
+                subreddits that succeeded and errors of those that failed
+        """
+        results: Dict[str, List[RedditPost]] = {}
+        failures: Dict[str, Exception] = {}
+        
+        for name in subreddit_names:
+            try:
+                results[name] = self.get_posts(name, sort, limit, time_filter)
+            except RateLimitError:
+                raise
+            except RedditAPIError as e:
+                logger.warning(f"Skipping r/{name}: {str(e)}")
+                failures[name] = e
+                
+        return results, failures
+        
+    def pipeline_stages(self, sort: str = "new", limit: int = 5, time_filter: str = "all",
+                        workers: int = 1,
+                        failures: Optional[Dict[str, Exception]] = None,
+                        new_only: bool = False,
+                        seen: Optional[SeenIdFilter] = None) -> List[Stage]:
+        """
+        Build the fetch and convert stages of a pipeline fed with subreddit names.
+        
+        Like get_posts_for_each(), a failing subreddit is recorded in failures
+        instead of stopping the other ones, while rate limit errors abort the
+        pipeline.
+        
+        Args:
+            sort: Listing sort (new, hot, rising, top, controversial)
+            limit: Maximum number of posts to retrieve per subreddit
+            time_filter: Time filter for top/controversial listings
+            workers: Number of subreddits fetched concurrently
+            failures: Dict the errors of failed subreddits are added to (optional)
+            new_only: Whether new listings resume from the subreddit cursors, and
+                posts already in seen are dropped
+            seen: Filter the ids of the emitted posts are added to (optional)
+            
+        Returns:
+            List[Stage]: Fetch stage emitting submissions and convert stage emitting posts
+        """
+        failures = {} if failures is None else failures
+        
+        def fetch(name: str) -> List[Tuple[str, object]]:
+            logger.info(f"Getting {limit} {sort} posts from r/{name}")
+            with self.timer.stage("fetch"):
+                if new_only and sort == "new":
+                    raw_posts = self._fetch_since_cursor(name, limit)
+                else:
+                    raw_posts = self.client.fetch_listing(name, sort, time_filter, limit)
+            return [(name, submission) for submission in raw_posts]
+        
+        def skip_failed(name: str, error: Exception) -> None:
+            if isinstance(error, RateLimitError) or not isinstance(error, RedditAPIError):
+                raise error
+            logger.warning(f"Skipping r/{name}: {str(error)}")
+            failures[name] = error
+        
+        def convert(item: Tuple[str, object]) -> RedditPost:
+            name, submission = item
+            with self.timer.stage("convert"):
+                post = RedditPost.from_praw_submission(submission)
+            if sort == "new":
+                self._advance_cursor(name, [post])
+            if seen is not None and seen.add(post.id) and new_only:
+                return None
+            return post
+        
+        return [
+            Stage("fetch", fetch, workers=workers, flatten=True, on_error=skip_failed),
+            Stage("convert", convert),
+        ]
+        
+    def get_posts_for_subreddits(self, subreddit_names: List[str], sort: str = "new",
+                                 limit: int = 5,
+                                 time_filter: str = "all") -> Dict[str, List[RedditPost]]:
+        """
+        Get posts from many low-traffic subreddits using combined requests.
+        
+        Args:
+            subreddit_names: Names of the subreddits
+            sort: Listing sort (new, hot, rising, top, controversial)
+            limit: Maximum number of posts to retrieve per subreddit
+            time_filter: Time filter for top/controversial listings
+            
+        Returns:
+            Dict[str, List[RedditPost]]: Posts keyed by subreddit name
+        """
+        logger.info(f"Getting {limit} {sort} posts from {len(subreddit_names)} subreddits")
+        
+        raw_posts = self.client.fetch_multireddit_listing(subreddit_names, sort, time_filter, limit)
+        
+        results = {
+            name: [RedditPost.from_praw_submission(post) for post in submissions]
+            for name, submissions in raw_posts.items()
+        }
+        if sort == "new":
+            for name, posts in results.items():
+                self._advance_cursor(name, posts)
+        return results
+        
+    def get_latest_posts(self, subreddit_name: str, limit: int = 5,
+                         seen: Optional[SeenIdFilter] = None) -> List[RedditPost]:
+        """
+        Get the latest posts from a subreddit.
+        
+        Args:
+            subreddit_name: Name of the subreddit
+            limit: Maximum number of posts to retrieve
+            seen: Filter of post ids returned by earlier polls; when given,
+                only posts not seen before are returned (optional)
+            
+        Returns:
+            List[RedditPost]: List of post data models
+        """
+        posts = self.get_posts(subreddit_name, "new", limit)
+        return posts if seen is None else seen.unseen(posts)
     
     def get_top_posts(self, subreddit_name: str, limit: int = 5, time_filter: str = "day") -> List[RedditPost]:
         """
@@ -60,18 +213,166 @@ class RedditService:
         Returns:
             List[RedditPost]: List of post data models
         """
-        logger.info(f"Getting top {limit} posts from r/{subreddit_name} for time period: {time_filter}")
+        return self.get_posts(subreddit_name, "top", limit, time_filter)
+    
+    def get_hot_posts(self, subreddit_name: str, limit: int = 5) -> List[RedditPost]:
+        """
+        Get the hot posts from a subreddit.
         
-        try:
-            subreddit = self.client.get_subreddit(subreddit_name)
-            raw_posts = list(subreddit.top(time_filter=time_filter, limit=limit))
+        Args:
+            subreddit_name: Name of the subreddit
+            limit: Maximum number of posts to retrieve
             
-            # Convert to our data model
-            posts = [RedditPost.from_praw_submission(post) for post in raw_posts]
+        Returns:
+            List[RedditPost]: List of post data models
+        """
+        return self.get_posts(subreddit_name, "hot", limit)
+    
+    def get_rising_posts(self, subreddit_name: str, limit: int = 5) -> List[RedditPost]:
+        """
+        Get the rising posts from a subreddit.
+        
+        Args:
+            subreddit_name: Name of the subreddit
+            limit: Maximum number of posts to retrieve
             
-            logger.info(f"Retrieved and processed {len(posts)} posts")
-            return posts
+        Returns:
+            List[RedditPost]: List of post data models
+        """
+        return self.get_posts(subreddit_name, "rising", limit)
+    
+    def get_controversial_posts(self, subreddit_name: str, limit: int = 5,
+                                time_filter: str = "day") -> List[RedditPost]:
+        """
+        Get the controversial posts from a subreddit.
+        
+        Args:
+            subreddit_name: Name of the subreddit
+            limit: Maximum number of posts to retrieve
+            time_filter: Time filter (hour, day, week, month, year, all)
+            
+        Returns:
+            List[RedditPost]: List of post data models
+        """
+        return self.get_posts(subreddit_name, "controversial", limit, time_filter)
+    
+    def get_rankings(self, subreddit_name: str, orders: Iterable[str] = ORDERS, limit: int = 5,
+                     time_filter: str = "day", pool_size: int = 100) -> Dict[str, List[RedditPost]]:
+        """
+        Get several orderings of a subreddit from a single listing.
+        
+        The pool_size newest posts are fetched once and ranked locally, so
+        each ordering covers recent posts only rather than the whole
+        subreddit history.
+        
+        Args:
+            subreddit_name: Name of the subreddit
+            orders: Orders to compute (hot, top, controversial, new)
+            limit: Maximum number of posts per order
+            time_filter: Window of top and controversial rankings
+            pool_size: Number of new posts fetched as the ranking pool
+            
+        Returns:
+            Dict[str, List[RedditPost]]: Ranked posts by order
+        """
+        pool = self.get_posts(subreddit_name, "new", max(pool_size, limit))
+        return RankingEngine(pool).rank_all(orders, limit, time_filter)
+    
+    def refresh_posts(self, post_ids: Iterable[str], max_workers: Optional[int] = None) -> List[RedditPost]:
+        """
+        Re-fetch known posts by id in batches of up to 100.
+        
+        Args:
+            post_ids: Ids of the posts to refresh
+            max_workers: Number of batches requested concurrently
+            
+        Returns:
+            List[RedditPost]: Fresh post data models; deleted or missing posts are omitted
+        """
+        post_ids = list(post_ids)
+        logger.info(f"Refreshing {len(post_ids)} posts")
+        
+        raw_posts = self.client.fetch_info(post_ids, max_workers)
+        posts = [RedditPost.from_praw_submission(post) for post in raw_posts]
+        
+        logger.info(f"Refreshed {len(posts)} posts")
+        return posts
+    
+    def _fetch_since_cursor(self, subreddit_name: str, limit: int) -> List[object]:
+        """
+        Fetch the new posts of a subreddit published after its cursor.
+        
+        A before= listing is empty both when nothing was posted and when the
+        cursor post was deleted, so an empty result is checked against a plain
+        listing filtered by the cursor's creation time.
+        
+        Args:
+            subreddit_name: Name of the subreddit
+            limit: Maximum number of posts to retrieve
+            
+        Returns:
+            List[praw.models.Submission]: Submissions newer than the cursor
+        """
+        cursor = self.cursors.get(subreddit_name.lower())
+        if cursor is None:
+            return self.client.fetch_listing(subreddit_name, "new", limit=limit)
+        
+        cursor_id, cursor_created = cursor
+        raw_posts = self.client.fetch_listing(subreddit_name, "new", limit=limit, before=cursor_id)
+        if not raw_posts:
+            raw_posts = [
+                submission for submission in self.client.fetch_listing(subreddit_name, "new", limit=limit)
+                if submission.created_utc > cursor_created
+            ]
+        logger.debug(f"{len(raw_posts)} posts in r/{subreddit_name} since the last run")
+        return raw_posts
+    
+    def _advance_cursor(self, subreddit_name: str, posts: List[RedditPost]) -> None:
+        """Remember the newest post seen in a subreddit."""
+        if not posts:
+            return
+        newest = max(posts, key=lambda post: post.created_utc)
+        key = subreddit_name.lower()
+        cursor = self.cursors.get(key)
+        if cursor is None or newest.created_utc > cursor[1]:
+            self.cursors[key] = (newest.id, newest.created_utc)
+    
+    def snapshot_state(self) -> Dict[str, Tuple[str, float]]:
+        """Get the per-subreddit cursors for a snapshot."""
+        return dict(self.cursors)
+    
+    def restore_state(self, state: Dict[str, Tuple[str, float]]) -> None:
+        """
+        Restore the per-subreddit cursors from a snapshot.
+        
+        Args:
+            state: State returned by snapshot_state()
+        """
+        self.cursors.update(state)
+    
+    def update_posts(self, posts: List[RedditPost], max_workers: Optional[int] = None) -> List[RedditPost]:
+        """
+        Refresh the scores and comment counts of posts in place.
+        
+        Args:
+            posts: Posts to update
+            max_workers: Number of batches requested concurrently
+            
+        Returns:
+            List[RedditPost]: The posts that were found and updated
+        """
+        by_id = {post.id: post for post in posts}
+        updated = []
+        
+        for fresh in self.refresh_posts(by_id, max_workers):
+            post = by_id.get(fresh.id)
+            if post is None:
+                continue
+            post.upvotes = fresh.upvotes
+            post.downvotes = fresh.downvotes
+            post.score = fresh.score
+            post.upvote_ratio = fresh.upvote_ratio
+            post.num_comments = fresh.num_comments
+            updated.append(post)
             
-        except Exception as e:
-            logger.error(f"Error getting top posts: {str(e)}")
-            raise
+        return updated
@@ -0,0 +1,3 @@
+"""
+Storage package for the Reddit Fetcher application.
+"""
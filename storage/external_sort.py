@@ -0,0 +1,254 @@
+"""
+External Sort module for the Reddit Fetcher application.
+
+This module sorts and groups post streams that do not fit in memory. Posts
+are buffered up to a memory budget, each full buffer is sorted and spilled
+to a temporary run file, and the runs are k-way merged back into a stream.
+"""
+
+import heapq
+import os
+import pickle
+import shutil
+import tempfile
+from contextlib import suppress
+from dataclasses import dataclass, fields
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from core.data_models import RedditPost
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+POST_FIELDS = tuple(field.name for field in fields(RedditPost))
+
+_first = itemgetter(0)
+
+def _estimate_size(values: Tuple[Any, ...]) -> int:
+    """Roughly estimate the memory held by one buffered record."""
+    # Object and tuple overhead plus the bytes of the string fields
+    return 400 + sum(len(value) for value in values if isinstance(value, str))
+
+
+class ExternalSorter:
+    """Sorts a stream of posts under a memory budget by spilling sorted runs to disk."""
+
+    DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024  # bytes
+    # Maximum number of runs merged at once; more runs are merged in passes
+    DEFAULT_MAX_FAN_IN = 64
+    # Records per pickled block in a run file
+    BLOCK_SIZE = 1000
+
+    def __init__(self, key: Optional[Callable[[RedditPost], Any]] = None, reverse: bool = False,
+                 memory_budget: Optional[int] = None,
+                 max_fan_in: Optional[int] = None,
+                 temp_dir: Optional[str] = None):
+        """
+        Initialize the sorter.
+
+        Args:
+            key: Function that takes a post and returns a sort key (used by sort())
+            reverse: Whether to sort in reverse order
+            memory_budget: Approximate bytes of posts buffered before a run is spilled
+            max_fan_in: Maximum number of runs merged at once
+            temp_dir: Directory for run files (defaults to the system temp dir)
+        """
+        self.key = key
+        self.reverse = reverse
+        self.memory_budget = memory_budget or self.DEFAULT_MEMORY_BUDGET
+        self.max_fan_in = max(2, max_fan_in or self.DEFAULT_MAX_FAN_IN)
+        self.temp_dir = temp_dir
+        self.runs_spilled = 0
+        self.bytes_spilled = 0
+
+    def sort(self, posts: Iterable[RedditPost]) -> Iterator[RedditPost]:
+        """
+        Sort posts, yielding them in order.
+
+        Equal keys keep their input order, as with sorted(). Run files are
+        removed once the stream is exhausted or closed.
+
+        Args:
+            posts: Posts to sort (list or stream)
+
+        Yields:
+            RedditPost: Posts in key order
+        """
+        for _, values in self.sort_records((self.key(post), tuple(getattr(post, name) for name in POST_FIELDS))
+                                           for post in posts):
+            yield RedditPost(*values)
+
+    def sort_records(self, records: Iterable[Tuple[Any, Tuple[Any, ...]]]
+                     ) -> Iterator[Tuple[Any, Tuple[Any, ...]]]:
+        """
+        Sort (key, values) records, spilling runs to disk as needed.
+
+        Args:
+            records: Records to sort; values must be picklable
+
+        Yields:
+            Tuple[Any, Tuple[Any, ...]]: Records in key order
+        """
+        work_dir = None
+        runs: List[str] = []
+        buffer: List[Tuple[Any, Tuple[Any, ...]]] = []
+        buffered = 0
+        try:
+            for record in records:
+                buffer.append(record)
+                buffered += _estimate_size(record[1])
+                if buffered >= self.memory_budget:
+                    if work_dir is None:
+                        work_dir = tempfile.mkdtemp(prefix="reddit_sort_", dir=self.temp_dir)
+                    runs.append(self._spill(buffer, work_dir))
+                    buffer = []
+                    buffered = 0
+
+            buffer.sort(key=_first, reverse=self.reverse)
+            if not runs:
+                # Everything fit in memory
+                yield from buffer
+                return
+
+            if buffer:
+                runs.append(self._spill(buffer, work_dir))
+                buffer = []
+            while len(runs) > self.max_fan_in:
+                runs = self._merge_pass(runs, work_dir)
+            yield from self._merge(runs)
+        finally:
+            if work_dir is not None:
+                shutil.rmtree(work_dir, ignore_errors=True)
+
+    def _spill(self, buffer: List[Tuple[Any, Tuple[Any, ...]]], work_dir: str) -> str:
+        """Sort a buffer and write it as a run file."""
+        buffer.sort(key=_first, reverse=self.reverse)
+        return self._write_run(buffer, work_dir)
+
+    def _write_run(self, records: Iterable[Tuple[Any, Tuple[Any, ...]]], work_dir: str) -> str:
+        """Write already sorted records to a new run file in pickled blocks."""
+        descriptor, path = tempfile.mkstemp(suffix=".run", dir=work_dir)
+        block = []
+        with os.fdopen(descriptor, 'wb') as f:
+            for record in records:
+                block.append(record)
+                if len(block) >= self.BLOCK_SIZE:
+                    pickle.dump(block, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    block = []
+            if block:
+                pickle.dump(block, f, protocol=pickle.HIGHEST_PROTOCOL)
+            size = f.tell()
+        self.runs_spilled += 1
+        self.bytes_spilled += size
+        logger.debug(f"Spilled sort run {path} ({size} bytes)")
+        return path
+
+    @staticmethod
+    def _read_run(path: str) -> Iterator[Tuple[Any, Tuple[Any, ...]]]:
+        """Stream the records of a run file and delete it when done."""
+        try:
+            with open(path, 'rb') as f:
+                while True:
+                    try:
+                        block = pickle.load(f)
+                    except EOFError:
+                        return
+                    yield from block
+        finally:
+            with suppress(FileNotFoundError):
+                os.remove(path)
+
+    def _merge(self, runs: List[str]) -> Iterator[Tuple[Any, Tuple[Any, ...]]]:
+        """K-way merge run files; ties go to the earlier run, keeping the sort stable."""
+        return heapq.merge(*(self._read_run(path) for path in runs), key=_first, reverse=self.reverse)
+
+    def _merge_pass(self, runs: List[str], work_dir: str) -> List[str]:
+        """Merge consecutive groups of runs into fewer, longer runs."""
+        logger.debug(f"Merging {len(runs)} sort runs in groups of {self.max_fan_in}")
+        return [self._write_run(self._merge(runs[start:start + self.max_fan_in]), work_dir)
+                for start in range(0, len(runs), self.max_fan_in)]
+
+
+def external_sort(posts: Iterable[RedditPost], key: Callable[[RedditPost], Any],
+                  reverse: bool = False, memory_budget: Optional[int] = None,
+                  temp_dir: Optional[str] = None) -> Iterator[RedditPost]:
+    """
+    Sort posts under a memory budget, yielding them in order.
+
+    Args:
+        posts: Posts to sort (list or stream)
+        key: Function that takes a post and returns a sort key
+        reverse: Whether to sort in reverse order
+        memory_budget: Approximate bytes of posts held in memory at once
+        temp_dir: Directory for run files (defaults to the system temp dir)
+
+    Returns:
+        Iterator[RedditPost]: Posts in key order
+    """
+    return ExternalSorter(key, reverse, memory_budget, temp_dir=temp_dir).sort(posts)
+
+
+@dataclass
+class GroupSummary:
+    """Aggregated statistics of the posts sharing a group key."""
+
+    key: Any
+    count: int = 0
+    total_score: int = 0
+    total_comments: int = 0
+    max_score: Optional[int] = None
+    first_created: Optional[float] = None
+    last_created: Optional[float] = None
+
+    @property
+    def mean_score(self) -> float:
+        """Get the mean score of the group."""
+        return self.total_score / self.count if self.count else 0.0
+
+    def add(self, score: int, num_comments: int, created_utc: float) -> None:
+        """Add one post to the group."""
+        self.count += 1
+        self.total_score += score
+        self.total_comments += num_comments
+        self.max_score = score if self.max_score is None else max(self.max_score, score)
+        self.first_created = created_utc if self.first_created is None else min(self.first_created, created_utc)
+        self.last_created = created_utc if self.last_created is None else max(self.last_created, created_utc)
+
+
+def _group_key(value: Any) -> Any:
+    """Map a missing group value (e.g. no subreddit) to the empty-string group."""
+    return "" if value is None else value
+
+def group_posts(posts: Iterable[RedditPost], by: str = "subreddit",
+                memory_budget: Optional[int] = None,
+                temp_dir: Optional[str] = None) -> Iterator[GroupSummary]:
+    """
+    Aggregate posts per subreddit, author or other field under a memory budget.
+
+    Posts are reduced to the aggregated fields, externally sorted by the
+    group field and summarized one group at a time, so neither the posts nor
+    the set of groups has to fit in memory.
+
+    Args:
+        posts: Posts to group (list or stream)
+        by: RedditPost field to group by
+        memory_budget: Approximate bytes of records held in memory at once
+        temp_dir: Directory for run files (defaults to the system temp dir)
+
+    Yields:
+        GroupSummary: One summary per group, in ascending key order
+    """
+    sorter = ExternalSorter(memory_budget=memory_budget, temp_dir=temp_dir)
+    records = ((_group_key(getattr(post, by)), (post.score, post.num_comments, post.created_utc))
+               for post in posts)
+
+    summary: Optional[GroupSummary] = None
+    for key, values in sorter.sort_records(records):
+        if summary is None or key != summary.key:
+            if summary is not None:
+                yield summary
+            summary = GroupSummary(key)
+        summary.add(*values)
+    if summary is not None:
+        yield summary
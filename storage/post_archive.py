@@ -0,0 +1,399 @@
+"""
+Post Archive module for the Reddit Fetcher application.
+
+This module provides a compact, memory-mapped binary archive of Reddit posts.
+
+Layout (little endian):
+    header      magic, version, post count and section offsets
+    columns     one fixed-width array per numeric field, sorted by created_utc
+    string refs (offset, length) arrays pointing into the string heap
+    id index    post ids padded to a fixed width, sorted, with record numbers
+    heap        UTF-8 encoded strings
+"""
+
+import array
+import bisect
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from core.data_models import RedditPost
+from utils.error_handler import RedditFetcherError
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MAGIC = b"RFPOSTS\x00"
+VERSION = 2
+
+# magic, version, reserved, count, index offset, heap offset, heap size
+HEADER = struct.Struct("<8sIIQQQQ")
+HEADER_SIZE = 64
+
+NUMERIC_COLUMNS = (
+    ('created_utc', 'd'),
+    ('upvotes', 'q'),
+    ('downvotes', 'q'),
+    ('score', 'q'),
+    ('num_comments', 'q'),
+    ('upvote_ratio', 'd'),
+    ('flags', 'B'),
+)
+STRING_FIELDS = ('id', 'title', 'author', 'url', 'selftext', 'subreddit')
+ID_WIDTH = 16
+
+# Bits of the flags column
+FLAG_IS_SELF = 1
+FLAG_HAS_DOWNVOTES = 2
+FLAG_HAS_SELFTEXT = 4
+FLAG_HAS_SUBREDDIT = 8
+FLAG_HAS_UPVOTE_RATIO = 16
+
+
+class ArchiveFormatError(RedditFetcherError):
+    """Exception raised when a file is not a valid post archive."""
+    pass
+
+
+def _align(offset: int) -> int:
+    """Round an offset up to the next multiple of 8."""
+    return (offset + 7) & ~7
+
+def _column_layout(count: int) -> List[Tuple[str, str, int]]:
+    """
+    Compute the (name, format, offset) of every fixed-width column.
+
+    Args:
+        count: Number of posts in the archive
+
+    Returns:
+        List[Tuple[str, str, int]]: Column layout in file order
+    """
+    layout = []
+    offset = HEADER_SIZE
+    columns = list(NUMERIC_COLUMNS)
+    for field in STRING_FIELDS:
+        columns.append((f"{field}_offset", 'Q'))
+        columns.append((f"{field}_length", 'I'))
+
+    for name, fmt in columns:
+        layout.append((name, fmt, offset))
+        offset = _align(offset + struct.calcsize(fmt) * count)
+
+    # The id index follows the columns: padded ids, then record numbers
+    layout.append(('index_ids', f"{ID_WIDTH}s", offset))
+    offset = _align(offset + ID_WIDTH * count)
+    layout.append(('index_records', 'Q', offset))
+    return layout
+
+
+class PostArchiveWriter:
+    """Builds a post archive file."""
+
+    def __init__(self, path: str):
+        """
+        Initialize the archive writer.
+
+        Strings are spooled to a temporary heap file as posts are added, so
+        only the fixed-width fields of each post are held in memory.
+
+        Args:
+            path: Path of the archive to create
+        """
+        self.path = path
+        self._heap = tempfile.TemporaryFile()
+        self._heap_size = 0
+        self._rows: List[tuple] = []
+
+    def _add_string(self, value: Optional[str]) -> Tuple[int, int]:
+        """Append a string to the heap and return its (offset, length)."""
+        if not value:
+            return (self._heap_size, 0)
+        data = value.encode('utf-8')
+        offset = self._heap_size
+        self._heap.write(data)
+        self._heap_size += len(data)
+        return (offset, len(data))
+
+    def add(self, post: RedditPost) -> None:
+        """
+        Add a post to the archive.
+
+        Args:
+            post: The post to add
+
+        Raises:
+            ValueError: If the post id is too long for the index
+        """
+        if len(post.id.encode('utf-8')) > ID_WIDTH:
+            raise ValueError(f"Post id too long for archive index: {post.id}")
+
+        flags = 0
+        if post.is_self:
+            flags |= FLAG_IS_SELF
+        if post.downvotes is not None:
+            flags |= FLAG_HAS_DOWNVOTES
+        if post.selftext is not None:
+            flags |= FLAG_HAS_SELFTEXT
+        if post.subreddit is not None:
+            flags |= FLAG_HAS_SUBREDDIT
+        if post.upvote_ratio is not None:
+            flags |= FLAG_HAS_UPVOTE_RATIO
+
+        refs = tuple(self._add_string(getattr(post, field)) for field in STRING_FIELDS)
+        self._rows.append((
+            post.created_utc, post.upvotes, post.downvotes or 0, post.score,
+            post.num_comments, post.upvote_ratio or 0.0, flags, post.id, refs
+        ))
+
+    def add_many(self, posts: Iterable[RedditPost]) -> None:
+        """
+        Add several posts to the archive.
+
+        Args:
+            posts: Posts to add
+        """
+        for post in posts:
+            self.add(post)
+
+    def close(self) -> None:
+        """Sort the posts and write the archive file."""
+        rows = sorted(self._rows, key=lambda row: (row[0], row[7]))
+        count = len(rows)
+        layout = _column_layout(count)
+        index_end = layout[-1][2] + 8 * count
+        heap_offset = _align(index_end)
+
+        order = sorted(range(count), key=lambda i: rows[i][7])
+        columns = {name: [row[i] for row in rows] for i, (name, _) in enumerate(NUMERIC_COLUMNS)}
+        for i, field in enumerate(STRING_FIELDS):
+            columns[f"{field}_offset"] = [row[8][i][0] for row in rows]
+            columns[f"{field}_length"] = [row[8][i][1] for row in rows]
+        columns['index_records'] = order
+
+        with open(self.path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, 0, count, layout[-2][2], heap_offset, self._heap_size))
+
+            for name, fmt, offset in layout:
+                f.seek(offset)
+                if name == 'index_ids':
+                    f.write(b"".join(rows[i][7].encode('utf-8').ljust(ID_WIDTH, b"\x00") for i in order))
+                    continue
+
+                values = array.array(fmt, columns.pop(name))
+                if sys.byteorder != 'little':
+                    values.byteswap()
+                f.write(values.tobytes())
+
+            f.seek(heap_offset)
+            self._heap.seek(0)
+            shutil.copyfileobj(self._heap, f)
+            # Seeking past the end does not extend the file: pad an empty archive to its full header
+            f.truncate(heap_offset + self._heap_size)
+
+        self._heap.close()
+        self._rows = []
+        logger.info(f"Wrote {count} posts to archive {self.path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._heap.close()
+        return False
+
+
+class PostArchive:
+    """Read-only, memory-mapped view of a post archive."""
+
+    def __init__(self, path: str):
+        """
+        Open an archive.
+
+        Opening only maps the file; no post data is read until accessed.
+
+        Args:
+            path: Path of the archive
+
+        Raises:
+            ArchiveFormatError: If the file is not a valid archive
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            if os.fstat(self._file.fileno()).st_size < HEADER_SIZE:
+                raise ArchiveFormatError(f"File too small to be a post archive: {path}")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        magic, version, _, count, _, heap_offset, heap_size = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ArchiveFormatError(f"Not a post archive: {path}")
+        if version != VERSION:
+            self.close()
+            raise ArchiveFormatError(f"Unsupported archive version {version}: {path}")
+
+        self._count = count
+        self._heap_offset = heap_offset
+        self._buffer = memoryview(self._mmap)
+        self._columns = {}
+        for name, fmt, offset in _column_layout(count):
+            size = struct.calcsize(fmt) * count
+            view = self._buffer[offset:offset + size]
+            if len(fmt) > 1:
+                self._columns[name] = view
+            elif sys.byteorder == 'little':
+                self._columns[name] = view.cast(fmt)
+            else:
+                # Columns are stored little endian; big-endian hosts read a swapped copy
+                values = array.array(fmt, view.tobytes())
+                values.byteswap()
+                view.release()
+                self._columns[name] = memoryview(values)
+
+    def __len__(self) -> int:
+        """Get the number of posts in the archive."""
+        return self._count
+
+    def column(self, name: str) -> memoryview:
+        """
+        Get a zero-copy view of a numeric column, ordered by created_utc.
+
+        On big-endian hosts the view is of a byte-swapped copy instead. The
+        view is released when the archive is closed.
+
+        Args:
+            name: Column name (created_utc, upvotes, downvotes, score, num_comments,
+                upvote_ratio, flags)
+
+        Returns:
+            memoryview: Typed view backed by the mapped file
+        """
+        if name not in dict(NUMERIC_COLUMNS):
+            raise KeyError(f"Unknown numeric column: {name}")
+        return self._columns[name]
+
+    def _string(self, field: str, record: int) -> str:
+        """Decode one string field of a record from the heap."""
+        offset = self._heap_offset + self._columns[f"{field}_offset"][record]
+        length = self._columns[f"{field}_length"][record]
+        return str(self._buffer[offset:offset + length], 'utf-8')
+
+    def post_at(self, record: int) -> RedditPost:
+        """
+        Materialize the post stored at a record number.
+
+        Args:
+            record: Record number, in created_utc order
+
+        Returns:
+            RedditPost: The stored post
+        """
+        if not 0 <= record < self._count:
+            raise IndexError(f"Record {record} out of range")
+
+        columns = self._columns
+        flags = columns['flags'][record]
+        return RedditPost(
+            id=self._string('id', record),
+            title=self._string('title', record),
+            author=self._string('author', record),
+            upvotes=columns['upvotes'][record],
+            downvotes=columns['downvotes'][record] if flags & FLAG_HAS_DOWNVOTES else None,
+            score=columns['score'][record],
+            url=self._string('url', record),
+            created_utc=columns['created_utc'][record],
+            num_comments=columns['num_comments'][record],
+            is_self=bool(flags & FLAG_IS_SELF),
+            selftext=self._string('selftext', record) if flags & FLAG_HAS_SELFTEXT else None,
+            subreddit=self._string('subreddit', record) if flags & FLAG_HAS_SUBREDDIT else None,
+            upvote_ratio=columns['upvote_ratio'][record] if flags & FLAG_HAS_UPVOTE_RATIO else None
+        )
+
+    def find_record(self, post_id: str) -> Optional[int]:
+        """
+        Find the record number of a post by id using the sorted index.
+
+        Args:
+            post_id: Post id
+
+        Returns:
+            Optional[int]: Record number, or None if the post is not archived
+        """
+        key = post_id.encode('utf-8').ljust(ID_WIDTH, b"\x00")
+        ids = self._columns['index_ids']
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if bytes(ids[middle * ID_WIDTH:(middle + 1) * ID_WIDTH]) < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < self._count and ids[low * ID_WIDTH:(low + 1) * ID_WIDTH] == key:
+            return self._columns['index_records'][low]
+        return None
+
+    def get(self, post_id: str) -> Optional[RedditPost]:
+        """
+        Get a post by id.
+
+        Args:
+            post_id: Post id
+
+        Returns:
+            Optional[RedditPost]: The post, or None if it is not archived
+        """
+        record = self.find_record(post_id)
+        return None if record is None else self.post_at(record)
+
+    def time_range(self, start_utc: float, end_utc: float) -> Iterator[RedditPost]:
+        """
+        Iterate over the posts created in [start_utc, end_utc).
+
+        Args:
+            start_utc: Inclusive start timestamp
+            end_utc: Exclusive end timestamp
+
+        Returns:
+            Iterator[RedditPost]: Posts in creation order
+        """
+        created = self._columns['created_utc']
+        first = bisect.bisect_left(created, start_utc)
+        last = bisect.bisect_left(created, end_utc)
+        for record in range(first, last):
+            yield self.post_at(record)
+
+    def __iter__(self) -> Iterator[RedditPost]:
+        """Iterate over all posts in creation order."""
+        for record in range(self._count):
+            yield self.post_at(record)
+
+    def close(self) -> None:
+        """Release the views and unmap the file."""
+        for view in getattr(self, '_columns', {}).values():
+            view.release()
+        self._columns = {}
+        if getattr(self, '_buffer', None) is not None:
+            self._buffer.release()
+            self._buffer = None
+        if hasattr(self, '_mmap'):
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
@@ -0,0 +1,458 @@
+"""
+Post Importer module for the Reddit Fetcher application.
+
+This module loads exported posts back into RedditPost objects. It reads the
+JSON arrays written by OutputManager.export_to_json as well as NDJSON dumps
+(optionally gzip, bz2, xz or zstd compressed), parsing incrementally so
+files never have to fit in memory. Large uncompressed NDJSON files are split
+into byte ranges parsed in parallel by a process pool.
+"""
+
+import bz2
+import gzip
+import io
+import json
+import lzma
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard is an optional dependency
+    zstandard = None
+
+from core.data_models import RedditPost
+from utils.error_handler import ConfigurationError
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+FORMAT_JSON = "json"
+FORMAT_NDJSON = "ndjson"
+
+# Leading bytes of the supported compressed formats
+COMPRESSION_MAGIC = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+)
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Columns produced by row_values(), a prefix of the RedditPost fields
+POST_FIELDS = ('id', 'title', 'author', 'upvotes', 'downvotes', 'score', 'url',
+               'created_utc', 'num_comments', 'is_self', 'selftext', 'subreddit', 'upvote_ratio')
+
+Batch = Dict[str, List[Any]]
+
+def detect_compression(path: str) -> Optional[str]:
+    """
+    Detect the compression of a file from its leading bytes.
+
+    Args:
+        path: File path
+
+    Returns:
+        Optional[str]: gzip, bz2, xz, zstd, or None for uncompressed files
+    """
+    with open(path, 'rb') as f:
+        head = f.read(6)
+    for magic, name in COMPRESSION_MAGIC:
+        if head.startswith(magic):
+            return name
+    return None
+
+def open_source(path: str) -> BinaryIO:
+    """
+    Open a file for reading, decompressing it transparently.
+
+    Args:
+        path: File path
+
+    Returns:
+        BinaryIO: Binary stream of the decompressed contents
+
+    Raises:
+        ConfigurationError: If the file is zstd compressed and zstandard is missing
+    """
+    compression = detect_compression(path)
+    if compression == "gzip":
+        return gzip.open(path, 'rb')
+    if compression == "bz2":
+        return bz2.open(path, 'rb')
+    if compression == "xz":
+        return lzma.open(path, 'rb')
+    if compression == "zstd":
+        if zstandard is None:
+            raise ConfigurationError(f"Reading {path} requires zstandard (pip install zstandard)")
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True))
+    return open(path, 'rb')
+
+def detect_format(stream: BinaryIO) -> str:
+    """
+    Detect whether a buffered stream holds a JSON array or NDJSON.
+
+    Args:
+        stream: Stream positioned at the start (must support peek())
+
+    Returns:
+        str: json or ndjson
+    """
+    head = stream.peek(64).lstrip(b"\xef\xbb\xbf \t\r\n")
+    return FORMAT_JSON if head.startswith(b"[") else FORMAT_NDJSON
+
+def row_values(row: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Convert an exported or third-party JSON row to RedditPost field values.
+
+    Accepts both the export format and Reddit API field names (ups, downs,
+    name), and tolerates missing optional fields and string timestamps.
+
+    Args:
+        row: Decoded JSON object
+
+    Returns:
+        Tuple[Any, ...]: Values in RedditPost field order
+
+    Raises:
+        KeyError: If the row has no post id
+    """
+    post_id = row.get('id') or row['name'].split('_', 1)[-1]
+    score = int(row.get('score') or 0)
+    upvotes = row.get('upvotes', row.get('ups'))
+    downvotes = row.get('downvotes', row.get('downs'))
+    is_self = bool(row.get('is_self', False))
+    upvote_ratio = row.get('upvote_ratio')
+    return (
+        str(post_id),
+        row.get('title') or "",
+        row.get('author') or "[deleted]",
+        score if upvotes is None else int(upvotes),
+        None if downvotes is None else int(downvotes),
+        score,
+        row.get('url') or "",
+        float(row.get('created_utc') or 0),
+        int(row.get('num_comments') or 0),
+        is_self,
+        row.get('selftext') if is_self else None,
+        row.get('subreddit'),
+        None if upvote_ratio is None else float(upvote_ratio),
+    )
+
+def _new_batch() -> Batch:
+    """Create an empty columnar batch."""
+    return {name: [] for name in POST_FIELDS}
+
+def batch_to_posts(batch: Batch) -> List[RedditPost]:
+    """
+    Convert a columnar batch to posts.
+
+    Args:
+        batch: Column name to values
+
+    Returns:
+        List[RedditPost]: One post per row
+    """
+    return [RedditPost(*values) for values in zip(*(batch[name] for name in POST_FIELDS))]
+
+
+class _BatchBuilder:
+    """Accumulates rows into columnar batches."""
+
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+        self.errors = 0
+        self._batch = _new_batch()
+        self._rows = 0
+        self._columns = [self._batch[name] for name in POST_FIELDS]
+
+    def add(self, row: Any) -> Optional[Batch]:
+        """Add a decoded row and return a batch once it is full."""
+        try:
+            values = row_values(row)
+        except (KeyError, TypeError, ValueError, AttributeError):
+            self.errors += 1
+            return None
+        for column, value in zip(self._columns, values):
+            column.append(value)
+        self._rows += 1
+        return self.flush() if self._rows >= self.batch_size else None
+
+    def flush(self) -> Optional[Batch]:
+        """Return the pending rows as a batch, if any."""
+        if not self._rows:
+            return None
+        batch = self._batch
+        self._batch = _new_batch()
+        self._rows = 0
+        self._columns = [self._batch[name] for name in POST_FIELDS]
+        return batch
+
+
+def iter_ndjson_rows(stream: BinaryIO, builder: _BatchBuilder,
+                     end: Optional[int] = None) -> Iterator[Batch]:
+    """Parse NDJSON lines into batches, stopping at a byte offset if given."""
+    for line in iter(stream.readline, b""):
+        if line.strip():
+            try:
+                row = _loads(line)
+            except ValueError:
+                builder.errors += 1
+                row = None
+            if row is not None:
+                batch = builder.add(row)
+                if batch is not None:
+                    yield batch
+        if end is not None and stream.tell() >= end:
+            break
+    batch = builder.flush()
+    if batch is not None:
+        yield batch
+
+def _skip_element(buffer: str, position: int, state: List[Any]) -> Tuple[int, Optional[str]]:
+    """
+    Scan past the rest of a malformed array element.
+
+    state holds [depth, in_string, escaped] and carries the scan across
+    chunks. Returns the position reached and what ended the element: "," for
+    the next element, "]" for the end of the array, or None when the buffer
+    ran out first.
+    """
+    depth, in_string, escaped = state
+    for index in range(position, len(buffer)):
+        char = buffer[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+            if depth < 0:
+                return index, "]"
+        elif char == "," and depth == 0:
+            return index + 1, ","
+    state[:] = [depth, in_string, escaped]
+    return len(buffer), None
+
+def iter_json_array_rows(stream: BinaryIO, builder: _BatchBuilder,
+                         read_size: int = 1 << 20) -> Iterator[Batch]:
+    """
+    Parse a JSON array incrementally, one element at a time, into batches.
+
+    An element that still fails to decode with more than read_size characters
+    buffered after it is malformed rather than incomplete: it is counted in
+    builder.errors and skipped up to the next top-level comma. Only an array
+    cut off before its closing bracket raises.
+    """
+    decoder = json.JSONDecoder()
+    reader = io.TextIOWrapper(stream, encoding='utf-8-sig')
+    buffer = ""
+    position = 0
+    started = False
+    exhausted = False
+    skip_state: Optional[List[Any]] = None
+
+    while True:
+        if skip_state is not None:
+            position, ended_by = _skip_element(buffer, position, skip_state)
+            if ended_by == "]":
+                break
+            if ended_by is None:
+                if exhausted:
+                    raise ValueError("truncated JSON array")
+                # The skipped text is dropped, so the buffer stays bounded
+                buffer = reader.read(read_size)
+                exhausted = not buffer
+                position = 0
+                continue
+            skip_state = None
+
+        # Skip separators between elements
+        while position < len(buffer) and buffer[position] in " \t\r\n,[":
+            started = started or buffer[position] == "["
+            position += 1
+        if position < len(buffer) and buffer[position] == "]" and started:
+            break
+
+        try:
+            if position >= len(buffer):
+                raise ValueError("need more data")
+            row, end = decoder.raw_decode(buffer, position)
+        except ValueError:
+            remainder = buffer[position:]
+            if exhausted and not remainder.strip():
+                if started:
+                    raise ValueError("truncated JSON array")
+                break
+            if exhausted or len(remainder) > read_size:
+                builder.errors += 1
+                skip_state = [0, False, False]
+                continue
+            chunk = reader.read(read_size)
+            exhausted = not chunk
+            buffer = remainder + chunk
+            position = 0
+            continue
+
+        position = end
+        batch = builder.add(row)
+        if batch is not None:
+            yield batch
+
+    batch = builder.flush()
+    if batch is not None:
+        yield batch
+
+def _parse_range(path: str, start: int, end: int, batch_size: int) -> Tuple[List[Batch], int]:
+    """
+    Parse the NDJSON lines starting in [start, end) of an uncompressed file.
+
+    Runs in a worker process.
+
+    Returns:
+        Tuple[List[Batch], int]: Batches and the number of rows skipped as invalid
+    """
+    builder = _BatchBuilder(batch_size)
+    with open(path, 'rb') as f:
+        if start:
+            # The line containing byte start - 1 belongs to the previous range
+            f.seek(start - 1)
+            f.readline()
+        if f.tell() >= end:
+            return [], 0
+        batches = list(iter_ndjson_rows(f, builder, end))
+    return batches, builder.errors
+
+
+class PostImporter:
+    """Loads JSON and NDJSON post files into RedditPost objects or columnar batches."""
+
+    DEFAULT_BATCH_SIZE = 10000  # rows per batch
+    DEFAULT_RANGE_SIZE = 32 * 1024 * 1024  # bytes of NDJSON per worker task
+    RANGES_IN_FLIGHT_PER_WORKER = 2  # parsed ranges buffered ahead of the consumer
+
+    def __init__(self, workers: Optional[int] = None,
+                 batch_size: Optional[int] = None,
+                 range_size: Optional[int] = None):
+        """
+        Initialize the importer.
+
+        Args:
+            workers: Worker processes for splitting NDJSON files (defaults to the
+                CPU count; 1 parses in the calling process)
+            batch_size: Rows per columnar batch
+            range_size: Bytes of NDJSON per worker task
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size or self.DEFAULT_BATCH_SIZE
+        self.range_size = range_size or self.DEFAULT_RANGE_SIZE
+        self.errors = 0
+
+    def iter_batches(self, paths: Union[str, Iterable[str]]) -> Iterator[Batch]:
+        """
+        Stream the rows of one or more files as columnar batches.
+
+        Rows come out in file order. Rows that are not valid JSON objects
+        with a post id are skipped and counted in self.errors.
+
+        Args:
+            paths: File path or paths
+
+        Yields:
+            Batch: Column name to values, in RedditPost field order
+        """
+        for path in [paths] if isinstance(paths, str) else paths:
+            logger.info(f"Importing posts from {path}")
+            compressed = detect_compression(path) is not None
+            with open_source(path) as stream:
+                file_format = detect_format(stream)
+                size = os.path.getsize(path)
+
+                # Compressed streams cannot be entered at a byte offset, so only
+                # plain NDJSON is split across processes
+                if file_format == FORMAT_NDJSON and not compressed and self.workers > 1 and size > self.range_size:
+                    stream.close()
+                    yield from self._iter_parallel(path, size)
+                    continue
+
+                builder = _BatchBuilder(self.batch_size)
+                if file_format == FORMAT_JSON:
+                    yield from iter_json_array_rows(stream, builder)
+                else:
+                    yield from iter_ndjson_rows(stream, builder)
+                self._count_errors(path, builder.errors)
+
+    def _iter_parallel(self, path: str, size: int) -> Iterator[Batch]:
+        """
+        Parse an uncompressed NDJSON file in byte ranges across worker processes.
+
+        Only a bounded window of ranges is submitted ahead of the consumer, so
+        memory stays flat however large the file is; batches come out in file
+        order.
+        """
+        starts = iter(range(0, size, self.range_size))
+        window = self.workers * self.RANGES_IN_FLIGHT_PER_WORKER
+        errors = 0
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+
+            def submit_next() -> None:
+                start = next(starts, None)
+                if start is not None:
+                    pending.append(executor.submit(_parse_range, path, start,
+                                                   min(size, start + self.range_size), self.batch_size))
+
+            for _ in range(window):
+                submit_next()
+            while pending:
+                batches, range_errors = pending.popleft().result()
+                submit_next()
+                errors += range_errors
+                yield from batches
+        self._count_errors(path, errors)
+
+    def _count_errors(self, path: str, errors: int) -> None:
+        """Record skipped rows."""
+        if errors:
+            self.errors += errors
+            logger.warning(f"Skipped {errors} invalid rows in {path}")
+
+    def iter_posts(self, paths: Union[str, Iterable[str]]) -> Iterator[RedditPost]:
+        """
+        Stream the posts of one or more files.
+
+        Args:
+            paths: File path or paths
+
+        Yields:
+            RedditPost: Imported posts, in file order
+        """
+        for batch in self.iter_batches(paths):
+            yield from batch_to_posts(batch)
+
+    def load(self, paths: Union[str, Iterable[str]]) -> List[RedditPost]:
+        """
+        Load all posts of one or more files.
+
+        Args:
+            paths: File path or paths
+
+        Returns:
+            List[RedditPost]: Imported posts, in file order
+        """
+        return list(self.iter_posts(paths))
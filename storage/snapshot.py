@@ -0,0 +1,315 @@
+"""
+Snapshot module for the Reddit Fetcher application.
+
+This module saves the in-memory state of long-running components (seen
+posts, caches, indexes, cursors) to a versioned binary file and restores it
+on startup, so a restarted fetcher resumes warm instead of re-crawling.
+
+Layout (little endian):
+    header      magic, version, section count, creation time
+    table       one entry per section: name, encoding, CRC-32, offset, length
+    sections    section payloads, each aligned to 8 bytes
+
+The file is memory-mapped when opened and a section is only decoded when
+the component owning it is restored.
+"""
+
+import mmap
+import os
+import pickle
+import struct
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.error_handler import RedditFetcherError
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MAGIC = b"RFSNAP\x00\x00"
+VERSION = 1
+
+# magic, version, section count, created (Unix time)
+HEADER = struct.Struct("<8sIId")
+# name, encoding, CRC-32, offset, length
+SECTION = struct.Struct("<32sIIQQ")
+
+ENCODING_RAW = 0
+ENCODING_PICKLE = 1
+
+
+class SnapshotFormatError(RedditFetcherError):
+    """Exception raised when a file is not a valid snapshot."""
+    pass
+
+
+def _align(offset: int) -> int:
+    """Round an offset up to the next multiple of 8."""
+    return (offset + 7) & ~7
+
+
+class SnapshotWriter:
+    """Builds a snapshot file, replacing any previous one atomically on close."""
+
+    def __init__(self, path: str):
+        """
+        Initialize the snapshot writer.
+
+        Args:
+            path: Path of the snapshot to create
+        """
+        self.path = path
+        self._sections: List[Tuple[str, int, bytes]] = []
+
+    def add(self, name: str, payload: bytes) -> None:
+        """
+        Add a raw binary section.
+
+        Raw sections can be viewed in place (e.g. packed arrays or filters).
+
+        Args:
+            name: Section name (at most 32 UTF-8 bytes)
+            payload: Section contents
+        """
+        self._add(name, ENCODING_RAW, bytes(payload))
+
+    def add_object(self, name: str, state: Any) -> None:
+        """
+        Add a section holding a picklable object.
+
+        Args:
+            name: Section name (at most 32 UTF-8 bytes)
+            state: Object to store
+        """
+        self._add(name, ENCODING_PICKLE, pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def _add(self, name: str, encoding: int, payload: bytes) -> None:
+        """Queue a section for writing."""
+        if len(name.encode('utf-8')) > 32:
+            raise ValueError(f"Snapshot section name too long: {name}")
+        self._sections.append((name, encoding, payload))
+
+    def close(self) -> None:
+        """Write the snapshot file."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        offset = _align(HEADER.size + SECTION.size * len(self._sections))
+        table = []
+        for name, encoding, payload in self._sections:
+            table.append(SECTION.pack(name.encode('utf-8'), encoding, zlib.crc32(payload), offset, len(payload)))
+            offset = _align(offset + len(payload))
+
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(self._sections), time.time()))
+            f.write(b"".join(table))
+            for (_, _, payload), entry in zip(self._sections, table):
+                f.seek(SECTION.unpack(entry)[3])
+                f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+        size = offset
+        self._sections = []
+        logger.debug(f"Wrote snapshot {self.path} ({size} bytes)")
+
+
+class Snapshot:
+    """Read-only, memory-mapped view of a snapshot file."""
+
+    def __init__(self, path: str):
+        """
+        Open a snapshot.
+
+        Opening only maps the file and reads the section table.
+
+        Args:
+            path: Path of the snapshot
+
+        Raises:
+            SnapshotFormatError: If the file is not a valid snapshot
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            if os.fstat(self._file.fileno()).st_size < HEADER.size:
+                raise SnapshotFormatError(f"File too small to be a snapshot: {path}")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        magic, version, count, self.created = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self.close()
+            raise SnapshotFormatError(f"Not a snapshot: {path}")
+        if version != VERSION:
+            self.close()
+            raise SnapshotFormatError(f"Unsupported snapshot version {version}: {path}")
+        if HEADER.size + SECTION.size * count > len(self._mmap):
+            self.close()
+            raise SnapshotFormatError(f"Truncated snapshot: {path}")
+
+        self._sections: Dict[str, Tuple[int, int, int, int]] = OrderedDict()
+        for index in range(count):
+            name, encoding, crc, offset, length = SECTION.unpack_from(self._mmap, HEADER.size + SECTION.size * index)
+            if offset + length > len(self._mmap):
+                self.close()
+                raise SnapshotFormatError(f"Truncated snapshot: {path}")
+            self._sections[name.rstrip(b"\x00").decode('utf-8')] = (encoding, crc, offset, length)
+
+    def names(self) -> List[str]:
+        """Get the section names in file order."""
+        return list(self._sections)
+
+    def __contains__(self, name: str) -> bool:
+        """Check whether a section exists."""
+        return name in self._sections
+
+    def section(self, name: str) -> memoryview:
+        """
+        Get a zero-copy view of a section's payload, verifying its checksum.
+
+        Args:
+            name: Section name
+
+        Returns:
+            memoryview: View backed by the mapped file
+
+        Raises:
+            KeyError: If the section does not exist
+            SnapshotFormatError: If the section is corrupt
+        """
+        _, crc, offset, length = self._sections[name]
+        view = memoryview(self._mmap)[offset:offset + length]
+        if zlib.crc32(view) != crc:
+            view.release()
+            raise SnapshotFormatError(f"Corrupt snapshot section {name}: {self.path}")
+        return view
+
+    def load(self, name: str) -> Any:
+        """
+        Decode a section.
+
+        Args:
+            name: Section name
+
+        Returns:
+            Any: The stored object, or the raw bytes of a raw section
+        """
+        encoding = self._sections[name][0]
+        view = self.section(name)
+        try:
+            return pickle.loads(view) if encoding == ENCODING_PICKLE else bytes(view)
+        finally:
+            view.release()
+
+    def close(self) -> None:
+        """Unmap the file."""
+        if hasattr(self, '_mmap'):
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+class SnapshotManager:
+    """
+    Saves and restores the state of registered components.
+
+    A component implements snapshot_state(), returning a picklable object,
+    and restore_state(state), which rebuilds the component from it.
+    """
+
+    DEFAULT_INTERVAL = 300  # seconds
+
+    def __init__(self, path: str, interval: Optional[float] = None):
+        """
+        Initialize the snapshot manager.
+
+        Args:
+            path: Snapshot file path
+            interval: Minimum seconds between two periodic saves
+        """
+        self.path = path
+        self.interval = interval or self.DEFAULT_INTERVAL
+        self._components: "OrderedDict[str, Any]" = OrderedDict()
+        self._snapshot: Optional[Snapshot] = None
+        self._opened = False
+        self._last_save = time.monotonic()
+
+    def _open(self) -> Optional[Snapshot]:
+        """Map the existing snapshot on first use, ignoring a missing or invalid file."""
+        if not self._opened:
+            self._opened = True
+            if os.path.exists(self.path):
+                try:
+                    self._snapshot = Snapshot(self.path)
+                    age = time.time() - self._snapshot.created
+                    logger.info(f"Loaded snapshot {self.path} from {age:.0f}s ago")
+                except (OSError, SnapshotFormatError) as e:
+                    logger.warning(f"Ignoring unreadable snapshot {self.path}: {str(e)}")
+        return self._snapshot
+
+    def register(self, name: str, component: Any, restore: bool = True) -> bool:
+        """
+        Register a component and restore its saved state, if any.
+
+        Args:
+            name: Section name of the component
+            component: Object implementing snapshot_state() and restore_state()
+            restore: Whether to restore the component from the snapshot
+
+        Returns:
+            bool: True if the component was restored
+        """
+        self._components[name] = component
+        snapshot = self._open() if restore else None
+        if snapshot is None or name not in snapshot:
+            return False
+
+        try:
+            component.restore_state(snapshot.load(name))
+        except (SnapshotFormatError, ValueError, TypeError, KeyError,
+                pickle.UnpicklingError, AttributeError) as e:
+            logger.warning(f"Starting {name} cold, snapshot state not usable: {str(e)}")
+            return False
+        logger.debug(f"Restored {name} from snapshot")
+        return True
+
+    def save(self) -> None:
+        """Write the state of all registered components."""
+        writer = SnapshotWriter(self.path)
+        for name, component in self._components.items():
+            writer.add_object(name, component.snapshot_state())
+        self.close()
+        writer.close()
+        self._last_save = time.monotonic()
+
+    def maybe_save(self) -> bool:
+        """
+        Save if the interval has passed since the last save.
+
+        Returns:
+            bool: True if a snapshot was written
+        """
+        if time.monotonic() - self._last_save < self.interval:
+            return False
+        self.save()
+        return True
+
+    def close(self) -> None:
+        """Unmap the snapshot that state was restored from."""
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
@@ -0,0 +1,101 @@
+"""
+Tests for the aggregators module.
+"""
+
+import unittest
+
+from core.data_models import RedditPost
+from services.aggregators import (
+    LiveAggregator, SlidingWindowCounter, TimeBucketHistogram, TopKAggregator
+)
+
+NOW = 1619440000
+
+def make_post(post_id, score, created_utc, num_comments=0, subreddit="python"):
+    """Create a post with the fields used by the aggregators."""
+    return RedditPost(
+        id=post_id,
+        title=post_id,
+        author="user",
+        upvotes=score,
+        downvotes=None,
+        score=score,
+        url="https://reddit.com",
+        created_utc=created_utc,
+        num_comments=num_comments,
+        is_self=False,
+        subreddit=subreddit
+    )
+
+class TestTopKAggregator(unittest.TestCase):
+    """Test cases for the TopKAggregator class."""
+    
+    def test_top_k_with_updates(self):
+        """Test that only the latest version of each post is ranked."""
+        aggregator = TopKAggregator(k=2)
+        aggregator.update(make_post("a", 10, NOW), NOW)
+        aggregator.update(make_post("b", 20, NOW), NOW)
+        aggregator.update(make_post("c", 5, NOW), NOW)
+        aggregator.update(make_post("c", 50, NOW), NOW)
+        
+        self.assertEqual([post.id for post in aggregator.top(NOW)], ["c", "b"])
+        # Snapshots must not consume the state
+        self.assertEqual([post.id for post in aggregator.top(NOW)], ["c", "b"])
+        self.assertEqual(len(aggregator), 3)
+        
+    def test_window_expiry(self):
+        """Test that posts older than the window are dropped."""
+        aggregator = TopKAggregator(k=3, window_seconds=3600)
+        aggregator.update(make_post("old", 100, NOW - 3000, num_comments=4), NOW)
+        aggregator.update(make_post("new", 1, NOW, num_comments=2), NOW)
+        
+        self.assertEqual(aggregator.mean("num_comments"), 3)
+        self.assertEqual([post.id for post in aggregator.top(NOW + 1000)], ["new"])
+        self.assertEqual(aggregator.total("num_comments"), 2)
+
+class TestWindowCounters(unittest.TestCase):
+    """Test cases for the sliding window counter and histogram."""
+    
+    def test_sliding_window_counter(self):
+        """Test counting events in a sliding window."""
+        counter = SlidingWindowCounter(window_seconds=60, bucket_seconds=10)
+        for offset in range(0, 120, 5):
+            counter.add(NOW + offset, value=2)
+            
+        self.assertEqual(counter.count(NOW + 119), 14)
+        self.assertEqual(counter.sum(NOW + 119), 28)
+        self.assertEqual(counter.count(NOW + 1000), 0)
+        
+    def test_histogram_keeps_recent_buckets(self):
+        """Test that the histogram keeps only the newest buckets."""
+        histogram = TimeBucketHistogram(bucket_seconds=60, max_buckets=2)
+        for minute in range(3):
+            histogram.add(NOW - NOW % 60 + minute * 60 + 1)
+            
+        self.assertEqual([count for _, count in histogram.snapshot()], [1, 1])
+        self.assertEqual(len(histogram.snapshot()), 2)
+
+class TestLiveAggregator(unittest.TestCase):
+    """Test cases for the LiveAggregator class."""
+    
+    def test_per_subreddit_snapshot(self):
+        """Test rolling statistics per subreddit."""
+        aggregator = LiveAggregator(window_seconds=3600, top_k=1)
+        aggregator.update([
+            make_post("a", 5, NOW - 60, 10),
+            make_post("b", 9, NOW - 30, 20),
+            make_post("c", 1, NOW, 3, subreddit="rust"),
+        ], NOW)
+        # Re-polled version of "a" must not count as a new post
+        aggregator.update([make_post("a", 15, NOW - 60, 30)], NOW)
+        
+        snapshot = aggregator.snapshot(NOW)
+        
+        self.assertEqual([post.id for post in snapshot["python"]["top_posts"]], ["a"])
+        self.assertEqual(snapshot["python"]["posts_in_window"], 2)
+        self.assertEqual(snapshot["python"]["average_comments"], 25)
+        self.assertAlmostEqual(snapshot["python"]["posts_per_minute"], 2 / 60)
+        self.assertEqual(snapshot["rust"]["posts_in_window"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -73,6 +73,117 @@ class TestRedditClient(unittest.TestCase):
         # Assert
         self.assertEqual(result, mock_posts)
         mock_subreddit.new.assert_called_once_with(limit=2)
+        
+    def test_fetch_listing_top_uses_time_filter(self):
+        """Test that time-filtered sorts pass the time filter through."""
+        # Arrange
+        mock_subreddit = MagicMock()
+        self.mock_reddit.subreddit.return_value = mock_subreddit
+        mock_subreddit.top.return_value = [MagicMock()]
+        
+        # Act
+        result = self.client.fetch_listing("python", "top", "week", 1)
+        
+        # Assert
+        self.assertEqual(len(result), 1)
+        mock_subreddit.top.assert_called_once_with(time_filter="week", limit=1)
+        
+    def test_fetch_listing_invalid_sort(self):
+        """Test that unsupported sorts are rejected."""
+        with self.assertRaises(ValueError):
+            self.client.fetch_listing("python", "best")
+            
+    def test_fetch_listing_uses_cache(self):
+        """Test that repeated listings are served from the cache."""
+        # Arrange
+        mock_subreddit = MagicMock()
+        self.mock_reddit.subreddit.return_value = mock_subreddit
+        mock_subreddit.hot.return_value = [MagicMock()]
+        
+        # Act
+        self.client.fetch_listing("python", "hot", limit=1)
+        result = self.client.fetch_listing("Python", "hot", limit=1)
+        
+        # Assert
+        self.assertEqual(len(result), 1)
+        mock_subreddit.hot.assert_called_once_with(limit=1)
+        self.assertEqual(self.client.metrics.counter("listing.cache_hits"), 1)
+        
+    def test_fetch_listing_before(self):
+        """Test that a before cursor is passed as a fullname and kept apart in the cache."""
+        # Arrange
+        mock_subreddit = MagicMock()
+        self.mock_reddit.subreddit.return_value = mock_subreddit
+        mock_subreddit.new.return_value = [MagicMock()]
+        
+        # Act
+        self.client.fetch_listing("python", "new", limit=5, before="abc")
+        self.client.fetch_listing("python", "new", limit=5)
+        
+        # Assert
+        self.assertEqual(mock_subreddit.new.call_args_list[0].kwargs,
+                         {'limit': 5, 'params': {'before': 't3_abc'}})
+        self.assertEqual(mock_subreddit.new.call_args_list[1].kwargs, {'limit': 5})
+        
+    @patch('time.sleep')
+    def test_fetch_listing_rate_limit_exhausted(self, mock_sleep):
+        """Test that a persistent rate limit raises RateLimitError."""
+        # Arrange
+        mock_subreddit = MagicMock()
+        self.mock_reddit.subreddit.return_value = mock_subreddit
+        mock_subreddit.rising.side_effect = Exception("rate limit exceeded")
+        
+        # Act & Assert
+        with self.assertRaises(RateLimitError):
+            self.client.fetch_listing("python", "rising")
+        self.assertEqual(mock_sleep.call_count, RedditClient.MAX_RETRIES - 1)
+        
+    def test_fetch_multireddit_listing_demultiplexes(self):
+        """Test that combined listings are split back per subreddit."""
+        # Arrange
+        mock_subreddit = MagicMock()
+        self.mock_reddit.subreddit.return_value = mock_subreddit
+        posts = []
+        for name in ["Alpha", "beta", "alpha", "gamma"]:
+            post = MagicMock()
+            post.subreddit.display_name = name
+            posts.append(post)
+        mock_subreddit.new.return_value = posts
+        
+        # Act
+        result = self.client.fetch_multireddit_listing(["alpha", "beta"], limit_per_subreddit=1)
+        
+        # Assert
+        self.mock_reddit.subreddit.assert_called_once_with("alpha+beta")
+        self.assertEqual(result["alpha"], [posts[0]])
+        self.assertEqual(result["beta"], [posts[1]])
+        
+    def test_pack_multireddits_respects_length_limit(self):
+        """Test that batches never exceed the multireddit name length."""
+        names = [f"subreddit{i:04d}" for i in range(500)]
+        
+        batches = self.client.pack_multireddits(names)
+        
+        self.assertEqual(sum(len(batch) for batch in batches), 500)
+        for batch in batches:
+            self.assertLessEqual(len("+".join(batch)), RedditClient.MAX_MULTIREDDIT_NAME_LENGTH)
+            self.assertLessEqual(len(batch), RedditClient.MAX_SUBREDDITS_PER_REQUEST)
+        
+    def test_fetch_info_batches_ids(self):
+        """Test that ids are batched into /api/info requests of at most 100."""
+        # Arrange
+        self.mock_reddit.info.side_effect = lambda fullnames: [MagicMock() for _ in fullnames]
+        post_ids = [f"id{i}" for i in range(250)]
+        
+        # Act
+        result = self.client.fetch_info(post_ids + ["t3_id0"], max_workers=2)
+        
+        # Assert
+        self.assertEqual(len(result), 250)
+        batch_sizes = sorted(len(call.kwargs["fullnames"]) for call in self.mock_reddit.info.call_args_list)
+        self.assertEqual(batch_sizes, [50, 100, 100])
+        first_batch = self.mock_reddit.info.call_args_list[0].kwargs["fullnames"]
+        self.assertTrue(all(name.startswith("t3_") for name in first_batch))
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,101 @@
+"""
+Tests for the bloom filter module.
+"""
+
+import unittest
+
+from utils.bloom_filter import BloomFilter, ScalableBloomFilter, SeenIdFilter
+
+class TestBloomFilter(unittest.TestCase):
+    """Test cases for the BloomFilter and ScalableBloomFilter classes."""
+    
+    def test_no_false_negatives_and_bounded_false_positives(self):
+        """Test that added keys are found and the error rate holds at capacity."""
+        # Arrange
+        bloom = BloomFilter(10000, 0.01)
+        
+        # Act
+        for i in range(10000):
+            bloom.add(f"post{i}")
+        false_positives = sum(f"other{i}" in bloom for i in range(10000))
+        
+        # Assert
+        self.assertTrue(all(f"post{i}" in bloom for i in range(10000)))
+        self.assertLess(false_positives, 200)
+        self.assertLess(bloom.size_bytes, 10000 * 2)
+        
+    def test_scalable_filter_grows(self):
+        """Test that the scalable filter adds slices instead of saturating."""
+        # Arrange
+        bloom = ScalableBloomFilter(1000, 0.01)
+        
+        # Act
+        repeats = sum(bloom.add(f"post{i}") for i in range(5000))
+        
+        # Assert
+        self.assertLess(repeats, 50)
+        self.assertGreater(len(bloom.filters), 2)
+        self.assertTrue(bloom.add("post42"))
+
+class TestSeenIdFilter(unittest.TestCase):
+    """Test cases for the SeenIdFilter class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.seen = SeenIdFilter(capacity=1000, generation_seconds=60, generations=2)
+        
+    def test_rotation_forgets_old_generations(self):
+        """Test that ids are remembered for the retention period, then dropped."""
+        # Act / Assert
+        self.assertFalse(self.seen.add("abc", now=0))
+        self.assertTrue(self.seen.add("abc", now=30))
+        self.assertIn("abc", self.seen)
+        self.seen.rotate(now=70)
+        self.assertIn("abc", self.seen)
+        self.seen.rotate(now=140)
+        self.assertNotIn("abc", self.seen)
+        
+    def test_serialization_round_trip(self):
+        """Test that a restored filter remembers the same ids and generations."""
+        # Arrange
+        for i in range(3000):
+            self.seen.add(f"post{i}", now=i // 100)
+        
+        # Act
+        restored = SeenIdFilter.from_bytes(self.seen.to_bytes())
+        
+        # Assert
+        self.assertTrue(all(f"post{i}" in restored for i in range(3000)))
+        self.assertEqual(len(restored), len(self.seen))
+        self.assertEqual(restored.generation_seconds, 60)
+        
+    def test_truncated_data_raises_value_error(self):
+        """Test that data cut off inside any header raises ValueError."""
+        # Arrange
+        for i in range(300):
+            self.seen.add(f"post{i}", now=i)
+        data = self.seen.to_bytes()
+        
+        # Act / Assert
+        for size in (0, 10, 30, 40, 60, 100, len(data) - 1):
+            with self.subTest(size=size), self.assertRaises(ValueError):
+                SeenIdFilter.from_bytes(data[:size])
+        
+    def test_unseen(self):
+        """Test that only posts not seen before pass through."""
+        # Arrange
+        class Post:
+            def __init__(self, post_id):
+                self.id = post_id
+        posts = [Post("a"), Post("b")]
+        
+        # Act
+        first = self.seen.unseen(posts, now=0)
+        second = self.seen.unseen(posts + [Post("c")], now=1)
+        
+        # Assert
+        self.assertEqual(len(first), 2)
+        self.assertEqual([post.id for post in second], ["c"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Tests for the change tracker module.
+"""
+
+import unittest
+from dataclasses import replace
+
+from core.data_models import RedditPost
+from services.change_tracker import ChangeTracker
+
+class TestChangeTracker(unittest.TestCase):
+    """Test cases for the ChangeTracker class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tracker = ChangeTracker(min_score_delta=5)
+        self.post = RedditPost(
+            id="abc123",
+            title="Test Post",
+            author="testuser",
+            upvotes=100,
+            downvotes=None,
+            score=100,
+            url="https://reddit.com/r/test/comments/abc123",
+            created_utc=1619430000,
+            num_comments=10,
+            is_self=False
+        )
+        
+    def test_new_post_is_emitted(self):
+        """Test that a post seen for the first time is reported as new."""
+        deltas = self.tracker.track([self.post], now=1000)
+        
+        self.assertEqual(len(deltas), 1)
+        self.assertTrue(deltas[0].is_new)
+        
+    def test_unchanged_post_is_suppressed(self):
+        """Test that re-fetched unchanged posts are not reported."""
+        self.tracker.track([self.post], now=1000)
+        
+        self.assertEqual(self.tracker.changed_posts([self.post], now=1060), [])
+        self.assertEqual(self.tracker.suppressed, 1)
+        
+    def test_small_changes_accumulate(self):
+        """Test that changes below the threshold accumulate until reported."""
+        self.tracker.track([self.post], now=0)
+        
+        self.assertEqual(self.tracker.track([replace(self.post, score=103)], now=1800), [])
+        deltas = self.tracker.track([replace(self.post, score=106, num_comments=12)], now=3600)
+        
+        self.assertEqual(len(deltas), 1)
+        self.assertEqual(deltas[0].score_delta, 6)
+        self.assertEqual(deltas[0].comments_delta, 2)
+        self.assertAlmostEqual(deltas[0].score_velocity, 6.0)
+        
+    def test_forget(self):
+        """Test dropping posts that have not changed recently."""
+        self.tracker.track([self.post], now=1000)
+        
+        self.assertEqual(self.tracker.forget(older_than=2000), 1)
+        self.assertNotIn(self.post.id, self.tracker)
+
+if __name__ == '__main__':
+    unittest.main()
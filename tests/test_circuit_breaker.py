@@ -0,0 +1,200 @@
+"""
+Tests for the circuit breaker module.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import prawcore
+
+from core.api_client import RedditClient
+from core.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreakerRegistry
+from utils.error_handler import (CircuitOpenError, PartialFetchError, RateLimitError, RedditAPIError,
+                                 handle_application_error)
+
+class TestCircuitBreakerRegistry(unittest.TestCase):
+    """Test cases for the CircuitBreakerRegistry class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = os.path.join(self.tmp_dir.name, "circuits.json")
+        self.registry = CircuitBreakerRegistry(self.path, failure_threshold=2, base_cooldown=60)
+        
+    def test_opens_after_threshold(self):
+        """Test that consecutive failures open the circuit."""
+        self.registry.record_failure("python", "boom", now=0)
+        self.assertEqual(self.registry.state("python"), CLOSED)
+        self.registry.record_failure("python", "boom", now=0)
+        
+        self.assertEqual(self.registry.state("Python"), OPEN)
+        self.assertFalse(self.registry.allow("python", now=30))
+        
+    def test_half_open_trial_and_backoff(self):
+        """Test the half-open trial and the doubled cool-down when it fails."""
+        self.registry.record_failure("python", "banned", permanent=True, now=0)
+        
+        self.assertTrue(self.registry.allow("python", now=61))
+        self.assertEqual(self.registry.state("python"), HALF_OPEN)
+        self.assertFalse(self.registry.allow("python", now=61))
+        
+        self.registry.record_failure("python", "banned", now=61)
+        self.assertFalse(self.registry.allow("python", now=61 + 100))
+        self.assertTrue(self.registry.allow("python", now=61 + 121))
+        
+        self.registry.record_success("python")
+        self.assertEqual(self.registry.state("python"), CLOSED)
+        
+    def test_interrupted_trial_reopens(self):
+        """Test that a trial ended by a rate limit reopens the circuit with the same cool-down."""
+        self.registry.record_failure("python", "banned", permanent=True, now=0)
+        self.assertTrue(self.registry.allow("python", now=61))
+        
+        self.registry.release_trial("python", now=61)
+        
+        self.assertEqual(self.registry.state("python"), OPEN)
+        self.assertFalse(self.registry.allow("python", now=100))
+        self.assertTrue(self.registry.allow("python", now=122))
+        
+    def test_state_persists_across_runs(self):
+        """Test that open circuits are restored from disk."""
+        self.registry.record_failure("python", "private", permanent=True, now=0)
+        
+        restored = CircuitBreakerRegistry(self.path)
+
+        self.assertEqual(restored.state("python"), OPEN)
+
+    def test_ignores_state_file_that_is_not_an_object(self):
+        """Test that valid JSON of the wrong shape is treated as a corrupt file."""
+        for content in ("[]", "1"):
+            with self.subTest(content=content):
+                with open(self.path, "w") as f:
+                    f.write(content)
+                
+                restored = CircuitBreakerRegistry(self.path)
+                
+                self.assertEqual(restored.state("python"), CLOSED)
+
+    def test_unwritable_state_file_does_not_raise(self):
+        """Test that a failure to persist is logged instead of raised."""
+        registry = CircuitBreakerRegistry(os.path.join(self.path, "circuits.json"), failure_threshold=1)
+        with open(self.path, "w") as f:
+            f.write("{}")
+        
+        registry.record_failure("python", "boom", now=0)
+        
+        self.assertEqual(registry.state("python"), OPEN)
+
+    def test_trial_persisted_mid_flight_reopens_on_load(self):
+        """Test that a half-open circuit saved by another circuit's write is reopened on restart."""
+        self.registry.record_failure("a", "banned", permanent=True, now=0)
+        self.assertTrue(self.registry.allow("a", now=61))
+        self.registry.record_failure("b", "boom", now=61)
+
+        restored = CircuitBreakerRegistry(self.path, base_cooldown=60)
+        restored.load(now=1000)
+
+        self.assertEqual(restored.state("a"), OPEN)
+        self.assertFalse(restored.allow("a", now=1030))
+        self.assertTrue(restored.allow("a", now=1061))
+        self.assertEqual(restored.state("a"), HALF_OPEN)
+
+    def test_stale_trial_times_out(self):
+        """Test that a trial which never reports back reopens the circuit after the trial timeout."""
+        registry = CircuitBreakerRegistry(failure_threshold=1, base_cooldown=60, trial_timeout=30)
+        registry.record_failure("python", "boom", now=0)
+        self.assertTrue(registry.allow("python", now=61))
+
+        self.assertFalse(registry.allow("python", now=80))
+        self.assertFalse(registry.allow("python", now=91))
+        self.assertEqual(registry.state("python"), OPEN)
+        self.assertTrue(registry.allow("python", now=151))
+
+class TestClientCircuitBreaker(unittest.TestCase):
+    """Test cases for circuit breaking in the Reddit client."""
+    
+    def test_forbidden_subreddit_is_skipped(self):
+        """Test that a forbidden subreddit is not requested again."""
+        mock_reddit = MagicMock()
+        mock_subreddit = MagicMock()
+        mock_reddit.subreddit.return_value = mock_subreddit
+        mock_subreddit.new.side_effect = prawcore.exceptions.Forbidden(MagicMock(status_code=403))
+        client = RedditClient(mock_reddit)
+        
+        with self.assertRaises(RedditAPIError):
+            client.fetch_listing("private_sub", "new")
+        with self.assertRaises(CircuitOpenError):
+            client.fetch_listing("private_sub", "new")
+            
+        self.assertEqual(mock_subreddit.new.call_count, 1)
+        
+    def make_client(self, listing):
+        """Create a client whose listings come from listing(name)."""
+        mock_reddit = MagicMock()
+        
+        def subreddit(name):
+            mock_subreddit = MagicMock()
+            mock_subreddit.new.side_effect = lambda limit: listing(name)
+            return mock_subreddit
+        
+        mock_reddit.subreddit.side_effect = subreddit
+        return RedditClient(mock_reddit, circuit_breakers=CircuitBreakerRegistry(base_cooldown=60))
+        
+    def open_circuit(self, client, name):
+        """Open a circuit whose cool-down has already passed."""
+        client.circuit_breakers.record_failure(name, "banned", permanent=True, now=0)
+        
+    @patch('time.sleep')
+    def test_rate_limited_trial_is_not_stuck(self, mock_sleep):
+        """Test that a half-open circuit whose trial is rate limited can be tried again later."""
+        def listing(name):
+            raise Exception("rate limit exceeded")
+        
+        client = self.make_client(listing)
+        self.open_circuit(client, "python")
+        
+        with self.assertRaises(RateLimitError):
+            client.fetch_listing("python", "new")
+            
+        self.assertEqual(client.circuit_breakers.state("python"), OPEN)
+        self.assertTrue(client.circuit_breakers.allow("python", now=time.time() + 61))
+        
+    def test_multireddit_success_closes_member_circuits(self):
+        """Test that a successful combined request closes its half-open members."""
+        client = self.make_client(lambda name: [])
+        self.open_circuit(client, "alpha")
+        
+        client.fetch_multireddit_listing(["alpha", "beta"])
+        
+        self.assertEqual(client.circuit_breakers.state("alpha"), CLOSED)
+        
+    def test_multireddit_failure_falls_back_per_member(self):
+        """Test that a failing combined request is retried per subreddit, isolating the bad one."""
+        def listing(name):
+            if "private_sub" in name.split("+"):
+                raise prawcore.exceptions.Forbidden(MagicMock(status_code=403))
+            post = MagicMock()
+            post.subreddit.display_name = name
+            return [post]
+        
+        client = self.make_client(listing)
+        
+        result = client.fetch_multireddit_listing(["alpha", "private_sub", "beta"])
+        
+        self.assertEqual(sorted(result), ["alpha", "beta"])
+        self.assertEqual(len(result["alpha"]), 1)
+        self.assertEqual(client.circuit_breakers.state("private_sub"), OPEN)
+        
+    def test_partial_fetch_exit_code(self):
+        """Test the exit code and summary for partially successful batches."""
+        error = PartialFetchError(["python"], {"private_sub": CircuitOpenError("open")})
+        
+        self.assertEqual(handle_application_error(error), 5)
+        self.assertIn("r/private_sub: skipped, circuit open", error.summary())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+Tests for the concurrency module.
+"""
+
+import unittest
+
+from core.concurrency import AdaptiveConcurrencyController
+
+class TestAdaptiveConcurrencyController(unittest.TestCase):
+    """Test cases for the AdaptiveConcurrencyController class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.controller = AdaptiveConcurrencyController(initial_limit=4, max_limit=8)
+        
+    def complete(self, count, latency=0.1, overloaded=False):
+        """Run requests through the controller."""
+        for _ in range(count):
+            self.assertTrue(self.controller.acquire(timeout=0))
+            self.controller.release(latency=latency, overloaded=overloaded)
+            
+    def test_additive_increase(self):
+        """Test that healthy requests grow the limit one step per window."""
+        self.complete(4)
+        self.assertEqual(self.controller.limit, 5)
+        self.complete(5)
+        self.assertEqual(self.controller.limit, 6)
+        self.assertEqual(self.controller.metrics.gauge("concurrency.limit"), 6)
+        
+    def test_multiplicative_decrease_on_overload(self):
+        """Test that rate limits and server errors halve the limit once per burst."""
+        self.complete(2, overloaded=True)
+        self.assertEqual(self.controller.limit, 2)
+        
+    def test_slots_are_bounded_by_limit(self):
+        """Test that no more than limit requests are in flight."""
+        for _ in range(4):
+            self.assertTrue(self.controller.acquire(timeout=0))
+        self.assertFalse(self.controller.acquire(timeout=0))
+        self.assertEqual(self.controller.in_flight, 4)
+        
+    def test_latency_spike_decreases_limit(self):
+        """Test that a rising p95 latency backs the limit off."""
+        window = AdaptiveConcurrencyController.LATENCY_WINDOW
+        self.complete(window, latency=0.1)
+        limit = self.controller.limit
+        self.complete(window, latency=1.0)
+        self.assertLess(self.controller.limit, limit)
+        
+    def test_low_quota_blocks_increase(self):
+        """Test that the limit does not grow while the quota is low."""
+        self.controller.observe_quota(10)
+        self.complete(8)
+        self.assertEqual(self.controller.limit, 4)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Tests for the console formatter module.
+"""
+
+import datetime
+import io
+import unittest
+
+from core.data_models import RedditPost
+from presentation.console_formatter import ConsoleFormatter
+
+class TestConsoleFormatter(unittest.TestCase):
+    """Test cases for the ConsoleFormatter class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.stream = io.StringIO()
+        self.formatter = ConsoleFormatter(stream=self.stream)
+        self.posts = [
+            RedditPost(
+                id=f"post{i}",
+                title=f"Post {i}",
+                author="user1",
+                upvotes=10 * i,
+                downvotes=None,
+                score=10 * i,
+                url=f"https://reddit.com/r/test/post{i}",
+                created_utc=1619430000 + i * 61,
+                num_comments=i,
+                is_self=True,
+                selftext="x" * 300
+            )
+            for i in range(1, 4)
+        ]
+        
+    def test_format_date_matches_strftime(self):
+        """Test that cached date formatting matches datetime formatting."""
+        for timestamp in (1619430000, 1619430059.9, 1619430060, 1619433599):
+            expected = datetime.datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+            self.assertEqual(self.formatter.format_date(timestamp), expected)
+            
+    def test_no_ansi_codes_when_not_a_tty(self):
+        """Test that ANSI codes are skipped for non-TTY streams."""
+        self.formatter.display_posts(self.posts)
+        
+        output = self.stream.getvalue()
+        self.assertNotIn("\033[", output)
+        self.assertIn("1. Post 1\nAuthor: u/user1", output)
+        self.assertIn("x" * 197 + "...", output)
+        self.assertTrue(output.endswith("Retrieved 3 posts from Reddit\n"))
+        
+    def test_forced_color(self):
+        """Test that color can be forced on."""
+        formatter = ConsoleFormatter(stream=self.stream, color=True)
+        self.assertTrue(formatter.format_post(self.posts[0]).startswith("\033[1mPost 1\033[0m"))
+        
+    def test_chunked_output_matches_single_render(self):
+        """Test that chunked display writes the same text as render_posts."""
+        self.formatter.CHUNK_SIZE = 2
+        self.formatter.display_posts(self.posts)
+        self.assertEqual(self.stream.getvalue(), self.formatter.render_posts(self.posts))
+        
+    def test_compact_format(self):
+        """Test the one-line-per-post table format."""
+        output = self.formatter.render_posts(self.posts, compact=True)
+        
+        lines = output.splitlines()
+        self.assertIn("TITLE", lines[0])
+        self.assertTrue(lines[1].rstrip().endswith("Post 1"))
+        self.assertEqual(len(lines), 1 + len(self.posts) + 3)
+        
+    def test_no_posts(self):
+        """Test the message shown for an empty result."""
+        self.formatter.display_posts([])
+        self.assertEqual(self.stream.getvalue(), "No posts found.\n")
+
+if __name__ == '__main__':
+    unittest.main()
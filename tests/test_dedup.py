@@ -0,0 +1,130 @@
+"""
+Tests for the dedup module.
+"""
+
+import unittest
+
+from core.data_models import RedditPost
+from services.dedup import DuplicateIndex, deduplicate, normalize_url
+
+def make_post(post_id, title, url, created_utc=1619430000, is_self=False):
+    """Create a post with the fields dedup looks at."""
+    return RedditPost(
+        id=post_id,
+        title=title,
+        author="testuser",
+        upvotes=10,
+        downvotes=None,
+        score=10,
+        url=url,
+        created_utc=created_utc,
+        num_comments=0,
+        is_self=is_self
+    )
+
+class TestNormalizeUrl(unittest.TestCase):
+    """Test cases for normalize_url."""
+    
+    def test_variants_compare_equal(self):
+        """Test that host prefixes, tracking parameters and fragments are ignored."""
+        self.assertEqual(
+            normalize_url("https://www.Example.com/a/b/?utm_source=x&id=2&fbclid=y#top"),
+            normalize_url("http://example.com/a/b?id=2")
+        )
+        
+    def test_canonical_ids(self):
+        """Test that Reddit and YouTube links reduce to their ids."""
+        self.assertEqual(normalize_url("https://old.reddit.com/r/a/comments/Abc12/title/"), "reddit:abc12")
+        self.assertEqual(normalize_url("https://redd.it/abc12"), "reddit:abc12")
+        self.assertEqual(normalize_url("https://youtu.be/xyz?si=1"), "youtube:xyz")
+        self.assertEqual(normalize_url("https://m.youtube.com/watch?v=xyz&feature=share"), "youtube:xyz")
+
+class TestDuplicateIndex(unittest.TestCase):
+    """Test cases for the DuplicateIndex class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = DuplicateIndex()
+        self.original = make_post("a1", "Scientists discover new species of deep sea octopus",
+                                  "https://example.com/octopus")
+        self.index.add(self.original)
+        
+    def test_url_repost(self):
+        """Test that a repost of the same link matches by URL."""
+        # Act
+        match = self.index.add(make_post("b2", "Look at this", "https://www.example.com/octopus/?utm_medium=x"))
+        
+        # Assert
+        self.assertEqual(match.reason, "url")
+        self.assertIs(match.original, self.original)
+        
+    def test_crosspost_of_self_post(self):
+        """Test that a crosspost linking to a self post's permalink matches it."""
+        # Arrange
+        self_post = make_post("c3", "My story", "https://www.reddit.com/r/a/comments/c3/my_story/", is_self=True)
+        self.index.add(self_post)
+        
+        # Act
+        match = self.index.add(make_post("d4", "My story", "https://www.reddit.com/r/a/comments/c3/my_story/"))
+        
+        # Assert
+        self.assertIs(match.original, self_post)
+        
+    def test_near_duplicate_title(self):
+        """Test that a lightly edited title matches through the MinHash index."""
+        # Act
+        match = self.index.add(make_post("e5", "[OC] Scientists discover a new species of deep sea octopus!",
+                                         "https://other.org/story"))
+        
+        # Assert
+        self.assertEqual(match.reason, "title")
+        self.assertGreaterEqual(match.similarity, self.index.threshold)
+        
+    def test_unrelated_post_is_indexed(self):
+        """Test that an unrelated post is not a duplicate and gets indexed."""
+        # Act
+        match = self.index.add(make_post("f6", "Python 3.13 released with a new JIT compiler",
+                                         "https://python.org/news"))
+        
+        # Assert
+        self.assertIsNone(match)
+        self.assertIn("f6", self.index)
+        self.assertIsNone(self.index.add(self.original))
+        self.assertEqual(len(self.index), 2)
+
+class TestDeduplicate(unittest.TestCase):
+    """Test cases for batch deduplication."""
+    
+    def test_earliest_post_is_kept(self):
+        """Test that the oldest post of a group survives, in input order."""
+        # Arrange
+        repost = make_post("r1", "Huge fire breaks out at the city harbour tonight", "https://news.com/fire", 200)
+        original = make_post("o1", "Huge fire breaks out at city harbour tonight", "https://other.com/fire", 100)
+        other = make_post("x1", "Weekly discussion thread", "https://reddit.com/r/a/comments/x1", 150)
+        
+        # Act
+        originals, duplicates = deduplicate([repost, other, original])
+        
+        # Assert
+        self.assertEqual([post.id for post in originals], ["x1", "o1"])
+        self.assertEqual(len(duplicates), 1)
+        self.assertIs(duplicates[0].original, original)
+    
+    def test_empty_index_is_reused_across_batches(self):
+        """Test that an empty index passed in collects the first batch."""
+        # Arrange
+        index = DuplicateIndex()
+        first = make_post("a1", "Release notes for the new version", "https://example.com/release", 100)
+        repost = make_post("a2", "Check this out", "https://www.example.com/release?utm_source=x", 200)
+        
+        # Act
+        deduplicate([first], index)
+        originals, duplicates = deduplicate([repost], index)
+        
+        # Assert
+        self.assertEqual(len(index), 1)
+        self.assertEqual(originals, [])
+        self.assertIs(duplicates[0].original, first)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Tests for the external sort module.
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+from core.data_models import RedditPost
+from storage.external_sort import ExternalSorter, external_sort, group_posts
+
+def make_post(index, score, subreddit):
+    """Create a post with the given score and subreddit."""
+    return RedditPost(
+        id=f"id{index}",
+        title=f"Post {index}",
+        author=f"user{index % 7}",
+        upvotes=score,
+        downvotes=None,
+        score=score,
+        url="https://example.com",
+        created_utc=1619430000 + index,
+        num_comments=index % 5,
+        is_self=False,
+        subreddit=subreddit
+    )
+
+class TestExternalSorter(unittest.TestCase):
+    """Test cases for the ExternalSorter class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        rng = random.Random(7)
+        self.posts = [make_post(i, rng.randrange(50), rng.choice(["a", "b", None])) for i in range(2000)]
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        
+    def test_matches_sorted_when_spilling(self):
+        """Test that spilled runs merge into the same stable order as sorted()."""
+        for reverse in (False, True):
+            with self.subTest(reverse=reverse):
+                # Arrange
+                sorter = ExternalSorter(lambda post: post.score, reverse, memory_budget=20000,
+                                        max_fan_in=4, temp_dir=self.temp_dir.name)
+                
+                # Act
+                result = list(sorter.sort(self.posts))
+                
+                # Assert
+                expected = sorted(self.posts, key=lambda post: post.score, reverse=reverse)
+                self.assertEqual([post.id for post in result], [post.id for post in expected])
+                self.assertEqual(result[0], expected[0])
+                self.assertGreater(sorter.runs_spilled, 4)
+                self.assertEqual(os.listdir(self.temp_dir.name), [])
+                
+    def test_in_memory_path(self):
+        """Test that small inputs are sorted without spilling."""
+        # Act
+        result = list(external_sort(self.posts[:10], key=lambda post: post.id, reverse=True))
+        
+        # Assert
+        self.assertEqual(result, sorted(self.posts[:10], key=lambda post: post.id, reverse=True))
+        
+    def test_group_by_subreddit(self):
+        """Test that grouping aggregates every post once per key."""
+        # Act
+        groups = list(group_posts(self.posts, by="subreddit", memory_budget=20000,
+                                  temp_dir=self.temp_dir.name))
+        
+        # Assert
+        self.assertEqual([group.key for group in groups], ["", "a", "b"])
+        self.assertEqual(sum(group.count for group in groups), len(self.posts))
+        group_a = groups[1]
+        posts_a = [post for post in self.posts if post.subreddit == "a"]
+        self.assertEqual(group_a.total_score, sum(post.score for post in posts_a))
+        self.assertEqual(group_a.max_score, max(post.score for post in posts_a))
+        self.assertEqual(group_a.first_created, min(post.created_utc for post in posts_a))
+
+if __name__ == "__main__":
+    unittest.main()
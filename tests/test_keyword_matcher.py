@@ -0,0 +1,112 @@
+"""
+Tests for the keyword matcher module.
+"""
+
+import os
+import tempfile
+import unittest
+
+from core.data_models import RedditPost
+from services.keyword_matcher import KeywordMatcher
+
+def make_post(title, selftext=None):
+    """Create a post with the given text."""
+    return RedditPost(
+        id="abc123",
+        title=title,
+        author="testuser",
+        upvotes=10,
+        downvotes=None,
+        score=10,
+        url="https://example.com",
+        created_utc=1619430000,
+        num_comments=0,
+        is_self=selftext is not None,
+        selftext=selftext
+    )
+
+class TestKeywordMatcher(unittest.TestCase):
+    """Test cases for the KeywordMatcher class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.matcher = KeywordMatcher(["Python", "py", "rust", "C++", "he", "she", "hers"])
+        
+    def test_single_pass_over_title_and_selftext(self):
+        """Test that all keywords of a post are found, in order of first occurrence."""
+        # Act
+        keywords = self.matcher.match(make_post("Rust vs PYTHON", "She likes c++ more"))
+        
+        # Assert
+        self.assertEqual(keywords, ["rust", "Python", "she", "C++"])
+        
+    def test_word_boundaries(self):
+        """Test that keywords inside longer words only match without boundaries."""
+        # Arrange
+        text = "pythonic trusty ushers"
+        loose = KeywordMatcher(["python", "rust", "she", "he", "hers"], whole_words=False)
+        
+        # Act / Assert
+        self.assertEqual(self.matcher.find(text), [])
+        self.assertEqual(loose.find(text), ["python", "rust", "she", "he", "hers"])
+        
+    def test_case_sensitive(self):
+        """Test that case folding can be disabled."""
+        matcher = KeywordMatcher(["Go"], case_sensitive=True)
+        self.assertEqual(matcher.find("go Go"), ["Go"])
+        self.assertEqual(matcher.find("GO go"), [])
+        
+    def test_alerts(self):
+        """Test that only matching posts produce alerts."""
+        # Arrange
+        posts = [make_post("Learning rust"), make_post("Nothing here")]
+        
+        # Act
+        alerts = list(self.matcher.alerts(posts))
+        
+        # Assert
+        self.assertEqual(len(alerts), 1)
+        self.assertIs(alerts[0].post, posts[0])
+        self.assertEqual(alerts[0].keywords, ["rust"])
+        
+    def test_reload_applies_only_changes(self):
+        """Test that a reload adds and removes keywords without losing the rest."""
+        # Act
+        added, removed = self.matcher.reload(["python", "rust", "golang"])
+        
+        # Assert
+        self.assertEqual((added, removed), (1, 5))
+        self.assertEqual(self.matcher.find("golang, rust, py and python"), ["golang", "rust", "Python"])
+        self.assertNotIn("py", self.matcher)
+        self.matcher.add(["py"])
+        self.assertEqual(self.matcher.find("py"), ["py"])
+        
+    def test_compaction_keeps_results(self):
+        """Test that folding many changes into the main automaton keeps matches intact."""
+        # Arrange
+        words = [f"word{i}" for i in range(500)]
+        
+        # Act
+        self.matcher.add(words)
+        self.matcher.remove(words[:400])
+        
+        # Assert
+        self.assertEqual(len(self.matcher), 107)
+        self.assertEqual(self.matcher.find("word1 word450 python"), ["word450", "Python"])
+        
+    def test_reload_file(self):
+        """Test that the keyword file is read again only after it changes."""
+        # Arrange
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "keywords.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("# brands\nacme\n\nglobex\n")
+            
+            # Act / Assert
+            self.assertTrue(self.matcher.reload_file(path))
+            self.assertFalse(self.matcher.reload_file(path))
+            self.assertEqual(len(self.matcher), 2)
+            self.assertEqual(self.matcher.find("Globex buys ACME"), ["globex", "acme"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,271 @@
+"""
+Tests for the link enricher module.
+"""
+
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from core.data_models import RedditPost
+from core.pipeline import Pipeline
+from services.link_enricher import LinkEnricher, is_enrichable, parse_metadata
+
+ARTICLE = (
+    b"<html><head><title>Plain title</title>"
+    b'<meta property="og:title" content="Article title">'
+    b'<meta property="og:description" content="What it is about">'
+    b'<meta property="og:image" content="/thumb.png">'
+    b"</head><body>" + b"x" * 100000 + b"</body></html>"
+)
+THUMBNAIL = b"\x89PNG\r\n\x1a\nthumbnail"
+UTF8_TITLE = "Café — naïve"
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    """Serves a few fixed pages and records the requests it gets."""
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits[self.path] = server.hits.get(self.path, 0) + 1
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+        try:
+            path = self.path.split("?")[0]
+            if path == "/article":
+                self.respond(200, "text/html; charset=utf-8", ARTICLE)
+            elif path == "/thumb.png":
+                self.respond(200, "image/png", THUMBNAIL)
+            elif path == "/moved":
+                self.send_response(301)
+                self.send_header("Location", "/article")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+            elif path == "/utf8":
+                self.respond(200, "text/html", f"<title>{UTF8_TITLE}</title>".encode("utf-8"))
+            elif path == "/latin1":
+                self.respond(200, "text/html",
+                             b'<head><meta charset="iso-8859-1"><title>Caf\xe9</title></head>')
+            elif path == "/bogus":
+                self.respond(200, "text/html; charset=bogus", b"<title>Bogus</title>")
+            elif path == "/slow":
+                time.sleep(0.2)
+                self.respond(200, "text/html", b"<title>Slow</title>")
+            else:
+                self.respond(404, "text/html", b"not found")
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def respond(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_post(post_id, url, is_self=False):
+    """Create a link post."""
+    return RedditPost(id=post_id, title=post_id, author="author", upvotes=1, downvotes=0,
+                      score=1, url=url, created_utc=0.0, num_comments=0, is_self=is_self)
+
+
+class TestLinkEnricher(unittest.TestCase):
+    """Test cases for the LinkEnricher class against a local HTTP server."""
+    
+    def setUp(self):
+        """Start the page server and create a cache directory."""
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _PageHandler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.hits = {}
+        self.server.active = 0
+        self.server.peak = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir, True)
+    
+    def enricher(self, **options):
+        """Create an enricher closed at the end of the test."""
+        enricher = LinkEnricher(cache_dir=self.cache_dir, **options)
+        self.addCleanup(enricher.close)
+        return enricher
+    
+    def test_resolve_page_metadata(self):
+        """Test that redirects are followed and Open Graph tags are extracted."""
+        # Arrange
+        enricher = self.enricher(fetch_thumbnails=True)
+        
+        # Act
+        link = enricher.resolve(f"{self.base}/moved")
+        
+        # Assert
+        self.assertIsNone(link.error)
+        self.assertEqual(link.final_url, f"{self.base}/article")
+        self.assertEqual(link.status, 200)
+        self.assertEqual(link.content_type, "text/html")
+        self.assertEqual(link.title, "Article title")
+        self.assertEqual(link.description, "What it is about")
+        self.assertEqual(link.thumbnail_url, f"{self.base}/thumb.png")
+        self.assertEqual(enricher.cache.get_blob(link.thumbnail_sha256), THUMBNAIL)
+    
+    def test_thumbnail_on_same_host_with_one_slot(self):
+        """Test that a thumbnail on the page's own host is fetched with a per-domain limit of 1."""
+        # Arrange
+        enricher = self.enricher(per_domain_limit=1, fetch_thumbnails=True)
+        results = []
+        
+        # Act
+        worker = threading.Thread(target=lambda: results.append(enricher.resolve(f"{self.base}/article")),
+                                  daemon=True)
+        worker.start()
+        worker.join(timeout=5)
+        
+        # Assert
+        self.assertFalse(worker.is_alive(), "resolve() deadlocked on the domain slot")
+        self.assertEqual(enricher.cache.get_blob(results[0].thumbnail_sha256), THUMBNAIL)
+    
+    def test_enrich_deduplicates_urls(self):
+        """Test that URL variants are fetched once and self posts are skipped."""
+        # Arrange
+        enricher = self.enricher()
+        posts = [
+            make_post("a", f"{self.base}/article"),
+            make_post("b", f"{self.base}/article?utm_source=reddit"),
+            make_post("c", f"{self.base}/article/"),
+            make_post("d", "https://www.reddit.com/r/python/comments/d/", is_self=True),
+        ]
+        
+        # Act
+        enricher.enrich(posts)
+        
+        # Assert
+        self.assertEqual(self.server.hits, {"/article": 1})
+        self.assertEqual({post.link.title for post in posts[:3]}, {"Article title"})
+        self.assertIsNone(posts[3].link)
+    
+    def test_results_are_cached_on_disk(self):
+        """Test that a second enricher is served from the cache."""
+        # Arrange
+        url = f"{self.base}/article"
+        self.enricher().resolve(url)
+        
+        # Act
+        enricher = self.enricher()
+        link = enricher.resolve(url)
+        
+        # Assert
+        self.assertEqual(link.title, "Article title")
+        self.assertEqual(self.server.hits["/article"], 1)
+        self.assertEqual(enricher.stats["cached"], 1)
+    
+    def test_failures_are_not_cached(self):
+        """Test that HTTP errors and timeouts are reported and retried later."""
+        # Arrange
+        enricher = self.enricher(timeout=0.05)
+        
+        # Act
+        missing = enricher.resolve(f"{self.base}/missing")
+        slow = enricher.resolve(f"{self.base}/slow")
+        enricher.resolve(f"{self.base}/missing")
+        
+        # Assert
+        self.assertEqual(missing.error, "HTTP 404")
+        self.assertIn("Timeout", slow.error)
+        self.assertEqual(self.server.hits["/missing"], 2)
+        self.assertEqual(enricher.stats["failed"], 3)
+    
+    def test_concurrent_resolves_share_one_request(self):
+        """Test that pipeline workers enriching the same link at once fetch it once."""
+        # Arrange
+        enricher = self.enricher()
+        posts = [make_post(str(index), f"{self.base}/slow?utm_source={index}") for index in range(6)]
+        
+        # Act
+        output = list(Pipeline([enricher.pipeline_stage()]).run(posts))
+        
+        # Assert
+        self.assertEqual(len(output), 6)
+        self.assertEqual({post.link.title for post in posts}, {"Slow"})
+        self.assertEqual(sum(self.server.hits.values()), 1)
+        self.assertEqual(enricher.stats["fetched"], 1)
+    
+    def test_page_encoding(self):
+        """Test that pages without a header charset are decoded from their meta tag or as UTF-8."""
+        # Arrange
+        enricher = self.enricher()
+        
+        # Act
+        utf8 = enricher.resolve(f"{self.base}/utf8")
+        latin1 = enricher.resolve(f"{self.base}/latin1")
+        bogus = enricher.resolve(f"{self.base}/bogus")
+        
+        # Assert
+        self.assertEqual(utf8.title, UTF8_TITLE)
+        self.assertEqual(latin1.title, "Café")
+        self.assertIn("LookupError", bogus.error)
+    
+    def test_pipeline_stage_keeps_failed_posts(self):
+        """Test that the enrich stage passes on a post whose enrichment raised."""
+        # Arrange
+        enricher = self.enricher()
+        enricher.resolve = lambda url: 1 / 0
+        post = make_post("a", f"{self.base}/article")
+        
+        # Act
+        output = list(Pipeline([enricher.pipeline_stage()]).run([post]))
+        
+        # Assert
+        self.assertEqual(output, [post])
+        self.assertIsNone(post.link)
+    
+    def test_per_domain_limit(self):
+        """Test that concurrent requests to one host stay within the limit."""
+        # Arrange
+        enricher = self.enricher(max_workers=8, per_domain_limit=2)
+        urls = [f"{self.base}/slow?page={index}" for index in range(6)]
+        
+        # Act
+        results = enricher.resolve_many(urls)
+        
+        # Assert
+        self.assertEqual({link.title for link in results.values()}, {"Slow"})
+        self.assertLessEqual(self.server.peak, 2)
+        self.assertEqual(sum(self.server.hits.values()), 6)
+
+
+class TestLinkHelpers(unittest.TestCase):
+    """Test cases for the metadata parser and link filter."""
+    
+    def test_parse_metadata_falls_back_to_title(self):
+        """Test that the title element is used when there are no Open Graph tags."""
+        # Arrange
+        html = '<head><title>\n  Only   a title </title><meta name="description" content="Desc"></head>'
+        
+        # Act
+        metadata = parse_metadata(html, "https://example.com/page")
+        
+        # Assert
+        self.assertEqual(metadata, {'title': "Only a title", 'description': "Desc", 'thumbnail_url': None})
+    
+    def test_is_enrichable(self):
+        """Test that only external http(s) link posts are enriched."""
+        # Assert
+        self.assertTrue(is_enrichable(make_post("a", "https://example.com/x")))
+        self.assertFalse(is_enrichable(make_post("b", "https://i.redd.it/abc.png")))
+        self.assertFalse(is_enrichable(make_post("c", "https://old.reddit.com/r/x/comments/c/")))
+        self.assertFalse(is_enrichable(make_post("d", "ftp://example.com/file")))
+        self.assertFalse(is_enrichable(make_post("e", "https://example.com/x", is_self=True)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Tests for the Parquet exporter module.
+"""
+
+import glob
+import os
+import tempfile
+import unittest
+
+from core.data_models import RedditPost
+from presentation.parquet_exporter import ParquetExporter, pa, pq
+
+@unittest.skipIf(pa is None, "pyarrow is not installed")
+class TestParquetExporter(unittest.TestCase):
+    """Test cases for the ParquetExporter class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        
+        self.posts = [
+            RedditPost(
+                id=f"post{i}",
+                title=f"Post {i}",
+                author="user1" if i % 2 else "user2",
+                upvotes=i,
+                downvotes=None,
+                score=i,
+                url=f"https://reddit.com/r/test/post{i}",
+                created_utc=1619430000 + i * 43200,  # two posts per day
+                num_comments=i,
+                is_self=False,
+                subreddit="python" if i < 4 else "rust",
+                upvote_ratio=None if i == 0 else 0.9
+            )
+            for i in range(6)
+        ]
+        
+    def test_partitions_by_subreddit_and_date(self):
+        """Test that posts land in subreddit/date partitions."""
+        # Act
+        with ParquetExporter(self.tmp_dir.name, row_group_size=1) as exporter:
+            exporter.write(self.posts)
+            
+        # Assert
+        partitions = sorted(
+            os.path.relpath(os.path.dirname(path), self.tmp_dir.name)
+            for path in glob.glob(os.path.join(self.tmp_dir.name, "*", "*", "*.parquet"))
+        )
+        self.assertEqual(partitions, [
+            os.path.join("subreddit=python", "date=2021-04-26"),
+            os.path.join("subreddit=python", "date=2021-04-27"),
+            os.path.join("subreddit=rust", "date=2021-04-28"),
+        ])
+        
+    def test_streams_row_groups(self):
+        """Test that each full buffer is written as its own row group."""
+        # Act
+        with ParquetExporter(self.tmp_dir.name, row_group_size=1) as exporter:
+            exporter.write(self.posts[:2])
+            
+        # Assert
+        path = glob.glob(os.path.join(self.tmp_dir.name, "*", "*", "*.parquet"))[0]
+        metadata = pq.ParquetFile(path).metadata
+        self.assertEqual(metadata.num_row_groups, 2)
+        
+        table = pq.read_table(path)
+        self.assertTrue(pa.types.is_dictionary(table.schema.field("author").type))
+        self.assertEqual(table.column("id").to_pylist(), ["post0", "post1"])
+        self.assertEqual(table.column("upvote_ratio").to_pylist(), [None, 0.9])
+        
+    def test_buffer_bounded_across_many_partitions(self):
+        """Test that many small partitions are flushed before the total buffer cap is exceeded."""
+        # Arrange
+        posts = [
+            RedditPost(id=f"post{i}", title=f"Post {i}", author="user1", upvotes=i, downvotes=0,
+                       score=i, url=None, created_utc=1619430000 + i * 43200, num_comments=0,
+                       is_self=True, subreddit=f"sub{i % 3}")
+            for i in range(300)
+        ]
+        peak = 0
+        
+        # Act
+        with ParquetExporter(self.tmp_dir.name, max_buffered_rows=10) as exporter:
+            for post in posts:
+                exporter.write([post])
+                peak = max(peak, sum(len(buffer) for buffer in exporter._buffers.values()))
+            
+        # Assert
+        self.assertLessEqual(peak, 10)
+        self.assertEqual(exporter.rows_written, 300)
+        table = pq.read_table(self.tmp_dir.name)
+        self.assertEqual(sorted(table.column("id").to_pylist()), sorted(post.id for post in posts))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,219 @@
+"""
+Tests for the pipeline module.
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from core.pipeline import Pipeline, Stage
+from services.reddit_service import RedditService
+from utils.bloom_filter import SeenIdFilter
+from utils.error_handler import RateLimitError, RedditAPIError
+
+class TestPipeline(unittest.TestCase):
+    """Test cases for the Pipeline class."""
+    
+    def test_stages_in_order(self):
+        """Test that single-worker stages keep the input order, drop None and flatten."""
+        # Arrange
+        pipeline = Pipeline([
+            Stage("split", lambda n: range(n), flatten=True),
+            Stage("odd", lambda n: n if n % 2 else None),
+            Stage("square", lambda n: n * n),
+        ])
+        
+        # Act
+        output = list(pipeline.run([3, 4]))
+        
+        # Assert
+        self.assertEqual(output, [1, 1, 9])
+        self.assertEqual([(stats.items_in, stats.items_out) for stats in pipeline.stats],
+                         [(2, 7), (7, 3), (3, 3)])
+    
+    def test_workers_run_concurrently(self):
+        """Test that a stage with several workers processes items in parallel."""
+        # Arrange
+        pipeline = Pipeline([Stage("sleep", lambda n: time.sleep(0.1) or n, workers=8)])
+        
+        # Act
+        start = time.perf_counter()
+        output = list(pipeline.run(range(8)))
+        elapsed = time.perf_counter() - start
+        
+        # Assert
+        self.assertEqual(sorted(output), list(range(8)))
+        self.assertLess(elapsed, 0.5)
+    
+    def test_backpressure(self):
+        """Test that a slow consumer bounds how far the producer runs ahead."""
+        # Arrange
+        produced = []
+        
+        def source():
+            for n in range(1000):
+                produced.append(n)
+                yield n
+        
+        pipeline = Pipeline([Stage("copy", lambda n: n)], queue_size=2)
+        
+        # Act
+        output = pipeline.run(source())
+        for _ in range(5):
+            next(output)
+            time.sleep(0.02)
+        ahead = len(produced) - 5
+        output.close()
+        
+        # Assert
+        # Two queues of two items, one item in the worker and one in the feeder
+        self.assertLessEqual(ahead, 6)
+        self.assertGreater(pipeline.stats[0].blocked_seconds, 0)
+    
+    def test_error_aborts(self):
+        """Test that an unhandled stage error stops the pipeline and is re-raised."""
+        # Arrange
+        def fail(n):
+            if n == 3:
+                raise ValueError("bad item")
+            return n
+        
+        pipeline = Pipeline([Stage("fail", fail)])
+        
+        # Act / Assert
+        with self.assertRaises(ValueError):
+            list(pipeline.run(range(1000000)))
+        self.assertEqual(pipeline.stats[0].errors, 1)
+    
+    def test_on_error_drops_item(self):
+        """Test that errors handled by on_error only drop the failing item."""
+        # Arrange
+        errors = []
+        pipeline = Pipeline([Stage("invert", lambda n: 1 / n, workers=2,
+                                   on_error=lambda item, e: errors.append(item))])
+        
+        # Act
+        output = list(pipeline.run([1, 0, 2]))
+        
+        # Assert
+        self.assertEqual(sorted(output), [0.5, 1.0])
+        self.assertEqual(errors, [0])
+        self.assertEqual(pipeline.stats[0].errors, 1)
+    
+    def test_on_error_replaces_item(self):
+        """Test that a value returned by on_error is passed downstream instead of the result."""
+        # Arrange
+        pipeline = Pipeline([Stage("invert", lambda n: 1 / n, on_error=lambda item, e: item)])
+        
+        # Act
+        output = list(pipeline.run([1, 0, 2]))
+        
+        # Assert
+        self.assertEqual(output, [1.0, 0, 0.5])
+        self.assertEqual(pipeline.stats[0].items_out, 3)
+    
+    def test_early_close_stops_workers(self):
+        """Test that closing the output iterator shuts the workers down."""
+        # Arrange
+        pipeline = Pipeline([Stage("copy", lambda n: n, workers=3)], queue_size=1)
+        before = threading.active_count()
+        
+        # Act
+        output = pipeline.run(iter(int, 1))  # endless input
+        next(output)
+        output.close()
+        
+        # Assert
+        self.assertEqual(threading.active_count(), before)
+    
+    def test_report(self):
+        """Test that the report lists every stage."""
+        # Arrange
+        pipeline = Pipeline([Stage("fetch", lambda n: n), Stage("render", lambda n: n)])
+        list(pipeline.run(range(10)))
+        
+        # Act
+        report = pipeline.report()
+        
+        # Assert
+        self.assertEqual([line.split()[0] for line in report.splitlines()], ["stage", "fetch", "render"])
+
+
+class TestRedditServicePipeline(unittest.TestCase):
+    """Test cases for the fetch and convert stages of RedditService."""
+    
+    def setUp(self):
+        """Set up a service with a mocked API client."""
+        self.client = MagicMock()
+        self.service = RedditService(MagicMock(), client=self.client)
+    
+    @patch('services.reddit_service.RedditPost.from_praw_submission', side_effect=lambda submission: submission)
+    def test_failed_subreddit_is_skipped(self, _):
+        """Test that a failing subreddit is recorded while the others continue."""
+        # Arrange
+        def fetch_listing(name, sort, time_filter, limit):
+            if name == "private":
+                raise RedditAPIError("forbidden")
+            return [MagicMock(id=f"{name}{n}", created_utc=n) for n in range(2)]
+        
+        self.client.fetch_listing.side_effect = fetch_listing
+        failures = {}
+        pipeline = Pipeline(self.service.pipeline_stages("new", 2, failures=failures))
+        
+        # Act
+        posts = list(pipeline.run(["python", "private", "science"]))
+        
+        # Assert
+        self.assertEqual([post.id for post in posts], ["python0", "python1", "science0", "science1"])
+        self.assertEqual(list(failures), ["private"])
+        self.assertEqual(self.service.cursors["science"], ("science1", 1))
+    
+    @patch('services.reddit_service.RedditPost.from_praw_submission', side_effect=lambda submission: submission)
+    def test_new_only_resumes_from_cursor(self, _):
+        """Test that new-only listings start after the cursor and advance it."""
+        # Arrange
+        self.service.cursors["python"] = ("old", 10)
+        self.client.fetch_listing.return_value = [MagicMock(id="fresh", created_utc=20)]
+        pipeline = Pipeline(self.service.pipeline_stages("new", 5, new_only=True))
+        
+        # Act
+        posts = list(pipeline.run(["python"]))
+        
+        # Assert
+        self.client.fetch_listing.assert_called_once_with("python", "new", limit=5, before="old")
+        self.assertEqual([post.id for post in posts], ["fresh"])
+        self.assertEqual(self.service.cursors["python"], ("fresh", 20))
+    
+    @patch('services.reddit_service.RedditPost.from_praw_submission', side_effect=lambda submission: submission)
+    def test_new_only_without_cursor_post(self, _):
+        """Test that an empty before listing falls back to filtering by the cursor time and seen ids."""
+        # Arrange
+        self.service.cursors["python"] = ("deleted", 10)
+        seen = SeenIdFilter(capacity=100)
+        seen.add("shown")
+        listing = [MagicMock(id=post_id, created_utc=created)
+                   for post_id, created in (("new", 30), ("shown", 20), ("old", 5))]
+        self.client.fetch_listing.side_effect = lambda *args, before=None, **kwargs: [] if before else listing
+        pipeline = Pipeline(self.service.pipeline_stages("new", 5, new_only=True, seen=seen))
+        
+        # Act
+        posts = list(pipeline.run(["python"]))
+        
+        # Assert
+        self.assertEqual([post.id for post in posts], ["new"])
+        self.assertIn("new", seen)
+        self.assertEqual(self.client.fetch_listing.call_count, 2)
+    
+    def test_rate_limit_aborts(self):
+        """Test that a rate limit error stops the whole pipeline."""
+        # Arrange
+        self.client.fetch_listing.side_effect = RateLimitError("slow down")
+        pipeline = Pipeline(self.service.pipeline_stages("new", 2))
+        
+        # Act / Assert
+        with self.assertRaises(RateLimitError):
+            list(pipeline.run(["python", "science"]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Tests for the post archive module.
+"""
+
+import os
+import tempfile
+import unittest
+
+from core.data_models import RedditPost
+from storage.post_archive import ArchiveFormatError, PostArchive, PostArchiveWriter
+
+class TestPostArchive(unittest.TestCase):
+    """Test cases for the PostArchiveWriter and PostArchive classes."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = os.path.join(self.tmp_dir.name, "posts.rfa")
+        
+        self.posts = [
+            RedditPost(
+                id=f"p{9 - i}",
+                title=f"Título {i}",
+                author=f"user{i}",
+                upvotes=i * 10,
+                downvotes=None if i % 2 else i,
+                score=i * 10,
+                url=f"https://reddit.com/r/test/p{i}",
+                created_utc=1619430000 + i * 60,
+                num_comments=i,
+                is_self=bool(i % 2),
+                selftext="body" if i % 2 else None,
+                subreddit="python",
+                upvote_ratio=None if i % 3 == 0 else 0.5 + i / 100
+            )
+            for i in range(10)
+        ]
+        
+        with PostArchiveWriter(self.path) as writer:
+            writer.add_many(reversed(self.posts))
+            
+    def test_get_by_id(self):
+        """Test random access to posts by id."""
+        with PostArchive(self.path) as archive:
+            self.assertEqual(len(archive), 10)
+            for post in self.posts:
+                self.assertEqual(archive.get(post.id), post)
+            self.assertIsNone(archive.get("missing"))
+            
+    def test_time_range(self):
+        """Test fetching posts by creation time range."""
+        with PostArchive(self.path) as archive:
+            result = list(archive.time_range(1619430000 + 120, 1619430000 + 300))
+            
+        self.assertEqual([post.id for post in result], ["p7", "p6", "p5"])
+        
+    def test_numeric_columns_are_views(self):
+        """Test zero-copy access to numeric columns."""
+        with PostArchive(self.path) as archive:
+            scores = archive.column("score")
+            self.assertIsInstance(scores, memoryview)
+            self.assertEqual(list(scores), [post.score for post in self.posts])
+            
+    def test_empty_archive_round_trip(self):
+        """Test that an archive without posts can be reopened."""
+        # Arrange
+        path = os.path.join(self.tmp_dir.name, "empty.rfa")
+        with PostArchiveWriter(path):
+            pass
+            
+        # Act / Assert
+        with PostArchive(path) as archive:
+            self.assertEqual(len(archive), 0)
+            self.assertEqual(list(archive), [])
+            self.assertIsNone(archive.get("p1"))
+            
+    def test_rejects_other_files(self):
+        """Test that files without the archive header are rejected."""
+        other = os.path.join(self.tmp_dir.name, "other.bin")
+        with open(other, 'wb') as f:
+            f.write(b"x" * 128)
+            
+        with self.assertRaises(ArchiveFormatError):
+            PostArchive(other)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+"""
+Tests for the post importer module.
+"""
+
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from core.data_models import RedditPost
+from presentation.output_manager import OutputManager
+from storage.post_importer import PostImporter, _BatchBuilder, iter_json_array_rows, row_values
+
+def make_posts(count):
+    """Create posts with a mix of link and self posts."""
+    return [
+        RedditPost(
+            id=f"id{i}",
+            title=f'Post {i} with "quotes" and ünïcode',
+            author=f"user{i % 7}",
+            upvotes=i,
+            downvotes=None,
+            score=i,
+            url=f"https://example.com/{i}",
+            created_utc=1619430000.0 + i,
+            num_comments=i % 5,
+            is_self=i % 2 == 0,
+            selftext=f"Body {i}" if i % 2 == 0 else None,
+            subreddit="python",
+            upvote_ratio=0.5 + i % 50 / 100 if i % 3 else None
+        )
+        for i in range(count)
+    ]
+
+class TestPostImporter(unittest.TestCase):
+    """Test cases for the PostImporter class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.posts = make_posts(500)
+        
+    def path(self, name):
+        """Get a path in the temporary directory."""
+        return os.path.join(self.temp_dir.name, name)
+        
+    def write_ndjson(self, name, rows, opener=open):
+        """Write rows as NDJSON."""
+        with opener(self.path(name), "wt", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row) + "\n")
+        return self.path(name)
+        
+    def test_round_trip_of_json_export(self):
+        """Test that an export_to_json file loads back into equal posts."""
+        # Arrange
+        path = self.path("export.json")
+        OutputManager().export_to_json(self.posts, path)
+        
+        # Act
+        posts = PostImporter(workers=1, batch_size=64).load(path)
+        
+        # Assert
+        self.assertEqual(posts, self.posts)
+        
+    def test_compressed_ndjson_with_reddit_field_names(self):
+        """Test that gzip NDJSON with API field names and bad lines is imported."""
+        # Arrange
+        rows = [{"name": "t3_abc", "title": "From a dump", "ups": 7, "downs": 1, "score": 6,
+                 "created_utc": "1619430000", "is_self": False, "selftext": "", "subreddit": "news"}]
+        path = self.write_ndjson("dump.ndjson.gz", rows + [{"title": "no id"}], gzip.open)
+        with gzip.open(path, "at", encoding="utf-8") as f:
+            f.write("{not json\n")
+        importer = PostImporter(workers=1)
+        
+        # Act
+        posts = importer.load(path)
+        
+        # Assert
+        self.assertEqual(len(posts), 1)
+        self.assertEqual((posts[0].id, posts[0].upvotes, posts[0].downvotes), ("abc", 7, 1))
+        self.assertEqual(posts[0].created_utc, 1619430000.0)
+        self.assertIsNone(posts[0].selftext)
+        self.assertEqual(importer.errors, 2)
+        
+    def test_parallel_byte_ranges(self):
+        """Test that splitting a file across processes keeps every row once, in order."""
+        # Arrange
+        rows = [dict(zip(("id", "title", "score", "is_self", "selftext"),
+                         (post.id, post.title, post.score, post.is_self, post.selftext)))
+                for post in self.posts]
+        path = self.write_ndjson("big.ndjson", rows)
+        
+        # Act
+        importer = PostImporter(workers=2, batch_size=50, range_size=997)
+        batches = list(importer.iter_batches(path))
+        
+        # Assert
+        ids = [post_id for batch in batches for post_id in batch["id"]]
+        self.assertEqual(ids, [post.id for post in self.posts])
+        self.assertEqual(importer.errors, 0)
+        
+    def test_parallel_ranges_are_submitted_in_a_window(self):
+        """Test that only a bounded number of byte ranges is submitted ahead of the consumer."""
+        # Arrange
+        rows = [{"id": post.id, "title": post.title} for post in self.posts]
+        path = self.write_ndjson("big.ndjson", rows)
+        submitted = []
+        
+        class CountingExecutor(ThreadPoolExecutor):
+            def submit(self, *args, **kwargs):
+                submitted.append(args[2])
+                return super().submit(*args, **kwargs)
+        
+        importer = PostImporter(workers=2, batch_size=50, range_size=500)
+        
+        # Act
+        with patch("storage.post_importer.ProcessPoolExecutor", CountingExecutor):
+            batches = importer.iter_batches(path)
+            next(batches)
+            in_flight = len(submitted)
+            remaining = list(batches)
+        
+        # Assert
+        self.assertEqual(in_flight, 2 * PostImporter.RANGES_IN_FLIGHT_PER_WORKER + 1)
+        self.assertGreater(len(submitted), in_flight)
+        self.assertEqual(submitted, sorted(submitted))
+        self.assertTrue(remaining)
+        
+    def test_malformed_json_array_element_is_skipped(self):
+        """Test that a bad element in a JSON array is counted and parsing resumes after it."""
+        # Arrange
+        rows = [json.dumps({"id": f"id{i}", "title": "x" * 40}) for i in range(50)]
+        rows[10] = '{"id": "bad", "title": nope, "nested": {"id": "inner"}}'
+        data = ("[\n" + ",\n".join(rows) + "\n]").encode("utf-8")
+        builder = _BatchBuilder(16)
+        
+        # Act
+        batches = list(iter_json_array_rows(io.BytesIO(data), builder, read_size=256))
+        
+        # Assert
+        ids = [post_id for batch in batches for post_id in batch["id"]]
+        self.assertEqual(ids, [f"id{i}" for i in range(50) if i != 10])
+        self.assertEqual(builder.errors, 1)
+        
+    def test_truncated_json_array_raises(self):
+        """Test that a JSON array cut off before its closing bracket is reported."""
+        # Act / Assert
+        for data in (b'[{"id": "a"}, {"id": "b"}, {"id": "c", "tit', b'[{"id": "a"}, {"id": "b"}'):
+            with self.subTest(data=data), self.assertRaises(ValueError):
+                list(iter_json_array_rows(io.BytesIO(data), _BatchBuilder(16), read_size=8))
+        
+    def test_row_values_requires_an_id(self):
+        """Test that rows without id or name are rejected."""
+        with self.assertRaises(KeyError):
+            row_values({"title": "x"})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,7 +6,11 @@ import unittest
 from datetime import datetime
 
 from core.data_models import RedditPost
+from core.pipeline import Pipeline
 from services.post_service import PostService
+from services.query import F, Query
+from utils.error_handler import ConfigurationError
+from utils.profiler import StageTimer
 
 class TestPostService(unittest.TestCase):
     """Test cases for the PostService class."""
@@ -117,6 +121,25 @@ class TestPostService(unittest.TestCase):
         self.assertEqual(len(result), 2)
         self.assertIn("post1", [post.id for post in result])
         self.assertIn("post3", [post.id for post in result])
+        
+    def test_pipeline_stage(self):
+        """Test that the process stage drops posts failing the filter or query and honours the limit."""
+        # Arrange
+        timer = StageTimer()
+        query = Query().where(F.upvotes >= 100).text("post").limit(1)
+        stage = self.service.pipeline_stage(lambda post: post.id != "post1", query, timer)
+        
+        # Act
+        result = list(Pipeline([stage]).run(self.posts))
+        
+        # Assert
+        self.assertEqual([post.id for post in result], ["post3"])
+        self.assertIn("process", timer.totals())
+        
+    def test_pipeline_stage_rejects_ordered_query(self):
+        """Test that an ordered query cannot be streamed through a stage."""
+        with self.assertRaises(ConfigurationError):
+            self.service.pipeline_stage(query=Query().order_by("-score"))
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,100 @@
+"""
+Tests for the profiler module.
+"""
+
+import json
+import os
+import pstats
+import tempfile
+import threading
+import time
+import unittest
+
+from utils.profiler import ProfileSession, StageTimer
+
+def busy_in_worker(seconds):
+    """Spin in a separate thread, like a pipeline worker."""
+    busy(seconds)
+
+def run_worker(seconds):
+    """Run busy_in_worker() in a new thread and wait for it."""
+    thread = threading.Thread(target=busy_in_worker, args=(seconds,), name="worker")
+    thread.start()
+    thread.join()
+
+def busy(seconds):
+    """Spin for the given number of seconds."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+class TestProfiler(unittest.TestCase):
+    """Test cases for the profiler utilities."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        
+    def test_stage_timer_report(self):
+        """Test that stage times accumulate across calls."""
+        timer = StageTimer()
+        for _ in range(2):
+            with timer.stage("fetch"):
+                busy(0.01)
+        with timer.stage("render"):
+            pass
+            
+        totals = timer.totals()
+        self.assertEqual(list(totals), ["fetch", "render"])
+        self.assertGreaterEqual(totals["fetch"], 0.02)
+        report = timer.report()
+        self.assertIn("fetch", report)
+        self.assertIn("wall", report)
+        self.assertNotIn("share", report)
+        
+    def test_cprofile_session(self):
+        """Test that cProfile mode writes a loadable pstats file."""
+        path = os.path.join(self.tmp_dir.name, "run.pstats")
+        with ProfileSession(path, "cprofile"):
+            busy(0.01)
+            
+        stats = pstats.Stats(path)
+        self.assertTrue(any(func[2] == "busy" for func in stats.stats))
+        
+    def test_cprofile_session_covers_threads(self):
+        """Test that cProfile mode records the work of other threads."""
+        path = os.path.join(self.tmp_dir.name, "run.pstats")
+        with ProfileSession(path, "cprofile"):
+            run_worker(0.01)
+            
+        stats = pstats.Stats(path)
+        self.assertTrue(any(func[2] == "busy_in_worker" for func in stats.stats))
+        
+    def test_sampling_session(self):
+        """Test that sample mode writes a speedscope profile."""
+        path = os.path.join(self.tmp_dir.name, "run.speedscope.json")
+        with ProfileSession(path, "sample"):
+            busy(0.1)
+            
+        with open(path, encoding="utf-8") as f:
+            document = json.load(f)
+        frames = [frame["name"] for frame in document["shared"]["frames"]]
+        self.assertIn("busy", frames)
+        self.assertEqual(len(document["profiles"][0]["samples"]),
+                         len(document["profiles"][0]["weights"]))
+        
+    def test_sampling_session_covers_threads(self):
+        """Test that sample mode writes a profile for every sampled thread."""
+        path = os.path.join(self.tmp_dir.name, "run.speedscope.json")
+        with ProfileSession(path, "sample"):
+            run_worker(0.1)
+            
+        with open(path, encoding="utf-8") as f:
+            document = json.load(f)
+        frames = [frame["name"] for frame in document["shared"]["frames"]]
+        self.assertIn("busy_in_worker", frames)
+        self.assertIn("worker", [profile["name"] for profile in document["profiles"]])
+
+if __name__ == '__main__':
+    unittest.main()
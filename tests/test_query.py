@@ -0,0 +1,121 @@
+"""
+Tests for the query module.
+"""
+
+import sqlite3
+import unittest
+
+from core.data_models import RedditPost
+from services.query import F, Query
+
+class TestQuery(unittest.TestCase):
+    """Test cases for the Query class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.posts = [
+            RedditPost(
+                id=f"post{i}",
+                title=f"Post {i} about {'Python' if i % 2 else 'Rust'}",
+                author=f"user{i % 3}",
+                upvotes=i * 10,
+                downvotes=None,
+                score=(i * 37) % 100,
+                url=f"https://reddit.com/r/test/post{i}",
+                created_utc=1619430000 + i,
+                num_comments=i,
+                is_self=True,
+                selftext="generic body",
+                subreddit="test"
+            )
+            for i in range(20)
+        ]
+        self.query = (Query()
+                      .where(F.upvotes >= 50, F.comments >= 5)
+                      .text("python")
+                      .order_by("-score")
+                      .limit(3))
+        
+    def expected(self):
+        """Compute the expected result with plain list operations."""
+        matches = [
+            post for post in self.posts
+            if post.upvotes >= 50 and post.num_comments >= 5 and "python" in post.title.lower()
+        ]
+        return sorted(matches, key=lambda post: post.score, reverse=True)[:3]
+        
+    def test_run_on_list(self):
+        """Test running a query over a list."""
+        self.assertEqual(self.query.run(self.posts), self.expected())
+        
+    def test_run_on_generator(self):
+        """Test running a query over a single-use stream."""
+        self.assertEqual(self.query.run(post for post in self.posts), self.expected())
+        
+    def test_stream_unordered(self):
+        """Test lazily streaming matches of an unordered query."""
+        query = Query().where(author="user1").limit(2)
+        result = list(query.stream(iter(self.posts)))
+        self.assertEqual([post.id for post in result], ["post1", "post4"])
+        
+    def test_mixed_direction_ordering(self):
+        """Test ordering by several fields with mixed directions."""
+        result = Query().order_by("-author", "created_utc").run(self.posts)
+        expected = sorted(self.posts, key=lambda post: post.created_utc)
+        expected = sorted(expected, key=lambda post: post.author, reverse=True)
+        self.assertEqual(result, expected)
+        
+    def test_run_columns(self):
+        """Test running a query over a columnar batch."""
+        columns = {
+            name: [getattr(post, name) for post in self.posts]
+            for name in ("title", "selftext", "upvotes", "num_comments", "score")
+        }
+        indices = self.query.run_columns(columns)
+        self.assertEqual([self.posts[i] for i in indices], self.expected())
+        
+    def test_to_sql(self):
+        """Test running the translated query against SQLite."""
+        connection = sqlite3.connect(":memory:")
+        self.addCleanup(connection.close)
+        connection.execute(
+            "CREATE TABLE posts (id TEXT, title TEXT, selftext TEXT, upvotes INTEGER, "
+            "num_comments INTEGER, score INTEGER)"
+        )
+        connection.executemany(
+            "INSERT INTO posts VALUES (?, ?, ?, ?, ?, ?)",
+            [(p.id, p.title, p.selftext, p.upvotes, p.num_comments, p.score) for p in self.posts]
+        )
+        
+        sql, params = self.query.to_sql()
+        rows = connection.execute(sql, params).fetchall()
+        
+        self.assertEqual([row[0] for row in rows], [post.id for post in self.expected()])
+        
+    def test_to_sql_orders_nulls_like_run(self):
+        """Test that missing values sort last in both SQL and Python, in either direction."""
+        connection = sqlite3.connect(":memory:")
+        self.addCleanup(connection.close)
+        connection.execute("CREATE TABLE posts (id TEXT, downvotes INTEGER)")
+        for post in self.posts[::3]:
+            post.downvotes = post.upvotes
+        connection.executemany("INSERT INTO posts VALUES (?, ?)", [(p.id, p.downvotes) for p in self.posts])
+        with_values = len(self.posts[::3])
+        
+        for ordering in ("downvotes", "-downvotes"):
+            with self.subTest(ordering=ordering):
+                query = Query().order_by(ordering)
+                sql, params = query.to_sql()
+                rows = connection.execute(sql, params).fetchall()
+                
+                expected = [post.id for post in query.run(self.posts)[:with_values]]
+                self.assertEqual([row[0] for row in rows[:with_values]], expected)
+                self.assertTrue(all(row[1] is None for row in rows[with_values:]))
+        
+    def test_unknown_field(self):
+        """Test that unknown fields are rejected."""
+        with self.assertRaises(ValueError):
+            Query().order_by("-karma")
+
+if __name__ == '__main__':
+    unittest.main()
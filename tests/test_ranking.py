@@ -0,0 +1,203 @@
+"""
+Tests for the ranking module.
+"""
+
+import random
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from core.data_models import RedditPost
+from devtools.reddit_stub import post_data
+from services import ranking
+from services.ranking import (PostColumns, RankingEngine, controversy_score, estimated_downvotes,
+                              estimated_votes, hot_score, rank_posts)
+from services.reddit_service import RedditService
+from utils.error_handler import ConfigurationError
+
+NOW = 1700000000.0
+
+def make_post(post_id, score, age_hours, upvotes=None, downvotes=0):
+    """Create a post with the given votes and age."""
+    return RedditPost(id=post_id, title=post_id, author="author",
+                      upvotes=score if upvotes is None else upvotes, downvotes=downvotes,
+                      score=score, url="", created_utc=NOW - age_hours * 3600,
+                      num_comments=0, is_self=True)
+
+def listing_post(post_id, score, upvote_ratio):
+    """Create a post the way it arrives from a listing: ups equal to the score and no downs."""
+    data = post_data(post_id, "python", NOW)
+    data.update(ups=score, score=score, upvote_ratio=upvote_ratio, author=SimpleNamespace(name=data['author']),
+                subreddit=SimpleNamespace(display_name=data['subreddit']))
+    return RedditPost.from_praw_submission(SimpleNamespace(**data))
+
+
+class TestScores(unittest.TestCase):
+    """Test cases for the single-post score functions."""
+    
+    def test_hot_score(self):
+        """Test the hot formula against known values."""
+        # Assert
+        self.assertEqual(hot_score(0, 1134028003), 0.0)
+        self.assertEqual(hot_score(10, 1134028003 + 45000), 2.0)
+        self.assertEqual(hot_score(-100, 1134028003), -2.0)
+    
+    def test_newer_post_outranks_older_with_more_votes(self):
+        """Test that 12.5 hours of age are worth a tenfold score."""
+        # Assert
+        self.assertGreater(hot_score(10, NOW), hot_score(99, NOW - 12.5 * 3600))
+    
+    def test_controversy_score(self):
+        """Test that evenly split votes score highest and one-sided votes score zero."""
+        # Assert
+        self.assertEqual(controversy_score(100, 0), 0.0)
+        self.assertEqual(controversy_score(50, 50), 100.0)
+        self.assertGreater(controversy_score(50, 50), controversy_score(90, 10))
+        self.assertEqual(controversy_score(90, 10), controversy_score(10, 90))
+    
+    def test_estimated_downvotes(self):
+        """Test that missing downvotes are derived from upvotes and score."""
+        # Assert
+        self.assertEqual(estimated_downvotes(make_post("a", 60, 1, upvotes=100)), 40)
+        self.assertEqual(estimated_downvotes(make_post("b", 60, 1, upvotes=100, downvotes=5)), 5)
+        self.assertEqual(estimated_downvotes(make_post("c", 60, 1, downvotes=None)), 0)
+    
+    def test_votes_estimated_from_upvote_ratio(self):
+        """Test that listing posts get their votes back from the upvote ratio."""
+        # Arrange
+        post = listing_post("abc", 100, 0.75)
+        
+        # Assert
+        self.assertEqual((post.upvotes, post.downvotes), (100, 0))
+        self.assertEqual(post.upvote_ratio, 0.75)
+        self.assertEqual(estimated_votes(post), (150, 50))
+        post.upvote_ratio = 1.0
+        self.assertEqual(estimated_votes(post), (100, 0))
+        post.upvote_ratio = 0.5
+        self.assertEqual(estimated_votes(post), (100, 0))
+
+
+class TestRankingEngine(unittest.TestCase):
+    """Test cases for the RankingEngine class."""
+    
+    def setUp(self):
+        """Set up a pool of posts."""
+        self.posts = [
+            make_post("old_popular", 1000, 48),
+            make_post("fresh", 50, 1),
+            make_post("split", 10, 5, upvotes=500),
+            make_post("newest", 1, 0.1),
+            make_post("last_week", 5000, 24 * 6),
+        ]
+        self.engine = RankingEngine(self.posts)
+    
+    def ids(self, posts):
+        return [post.id for post in posts]
+    
+    def test_orders(self):
+        """Test the hot, top, controversial and new orderings."""
+        # Act
+        rankings = self.engine.rank_all(limit=3, now=NOW)
+        
+        # Assert
+        self.assertEqual(self.ids(rankings["hot"]), ["fresh", "split", "newest"])
+        self.assertEqual(self.ids(rankings["top"]), ["last_week", "old_popular", "fresh"])
+        self.assertEqual(self.ids(rankings["controversial"])[0], "split")
+        self.assertEqual(self.ids(rankings["new"]), ["newest", "fresh", "split"])
+    
+    def test_time_filter(self):
+        """Test that top rankings only include posts inside the window."""
+        # Act
+        day = self.engine.rank("top", time_filter="day", now=NOW)
+        week = self.engine.rank("top", time_filter="week", now=NOW)
+        
+        # Assert
+        self.assertEqual(self.ids(day), ["fresh", "split", "newest"])
+        self.assertEqual(self.ids(week)[0], "last_week")
+    
+    def test_add_replaces_and_rescores(self):
+        """Test that adding a newer version of a post updates the rankings."""
+        # Arrange
+        self.engine.rank("top", now=NOW)
+        
+        # Act
+        self.engine.add([make_post("newest", 9999, 0.1)])
+        
+        # Assert
+        self.assertEqual(len(self.engine), 5)
+        self.assertEqual(self.ids(self.engine.rank("top", limit=1, now=NOW)), ["newest"])
+    
+    def test_unknown_order(self):
+        """Test that unknown orders and time filters are rejected."""
+        # Assert
+        with self.assertRaises(ConfigurationError):
+            self.engine.rank("best")
+        with self.assertRaises(ConfigurationError):
+            self.engine.rank("top", time_filter="decade")
+    
+    def test_empty_pool(self):
+        """Test that an empty pool ranks to an empty list."""
+        # Assert
+        self.assertEqual(rank_posts([], "hot"), [])
+    
+    @unittest.skipIf(ranking.numpy is None, "numpy is not installed")
+    def test_numpy_matches_python(self):
+        """Test that the numpy and plain Python paths rank identically."""
+        # Arrange
+        rng = random.Random(7)
+        posts = [make_post(f"p{n}", rng.randint(-50, 5000), rng.uniform(0, 400),
+                           downvotes=rng.randint(0, 300)) for n in range(2000)]
+        
+        # Act / Assert
+        for order in ranking.ORDERS:
+            with self.subTest(order=order):
+                fast = RankingEngine(posts, use_numpy=True).rank(order, 100, "week", now=NOW)
+                slow = RankingEngine(posts, use_numpy=False).rank(order, 100, "week", now=NOW)
+                self.assertEqual(self.ids(fast), self.ids(slow))
+    
+    @unittest.skipIf(ranking.numpy is not None, "numpy is installed")
+    def test_numpy_required_when_requested(self):
+        """Test that requesting numpy without it installed is a configuration error."""
+        # Assert
+        with self.assertRaises(ConfigurationError):
+            PostColumns(self.posts, use_numpy=True)
+
+
+class TestListingRankings(unittest.TestCase):
+    """Test cases for ranking posts shaped like the stub API's listings."""
+    
+    def test_controversial_uses_upvote_ratio(self):
+        """Test that controversy is not zero for listing posts and favours split votes."""
+        # Arrange
+        posts = [listing_post("one_sided", 100, 0.99), listing_post("split", 100, 0.55),
+                 listing_post("mixed", 100, 0.8)]
+        
+        # Act
+        ranked = rank_posts(posts, "controversial", now=NOW)
+        
+        # Assert
+        self.assertEqual([post.id for post in ranked], ["split", "mixed", "one_sided"])
+        self.assertTrue(all(value > 0 for value in PostColumns(posts, use_numpy=False).controversy()))
+
+
+class TestRedditServiceRankings(unittest.TestCase):
+    """Test cases for deriving several orderings from one listing."""
+    
+    def test_get_rankings_fetches_once(self):
+        """Test that every ordering comes from a single new listing."""
+        # Arrange
+        client = MagicMock()
+        service = RedditService(MagicMock(), client=client)
+        pool = [make_post("a", 10, 1), make_post("b", 500, 30)]
+        service.get_posts = MagicMock(return_value=pool)
+        
+        # Act
+        rankings = service.get_rankings("python", limit=1, time_filter="all")
+        
+        # Assert
+        service.get_posts.assert_called_once_with("python", "new", 100)
+        self.assertEqual(rankings["top"][0].id, "b")
+        self.assertEqual(rankings["new"][0].id, "a")
+
+if __name__ == '__main__':
+    unittest.main()
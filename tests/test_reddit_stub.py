@@ -0,0 +1,82 @@
+"""
+Tests for the Reddit API stub server.
+"""
+
+import unittest
+from unittest.mock import patch
+
+import praw
+
+from core.api_client import RedditClient
+from devtools.reddit_stub import RedditStubServer
+from utils.error_handler import RedditAPIError
+
+class TestRedditStubServer(unittest.TestCase):
+    """Test cases for the RedditStubServer class, driven through PRAW."""
+    
+    def start_server(self, **options):
+        """Start a stub server and a client pointed at it."""
+        server = RedditStubServer(seed=1, **options).start()
+        self.addCleanup(server.stop)
+        reddit = praw.Reddit(
+            client_id="stub", client_secret="stub", user_agent="reddit-fetcher tests",
+            oauth_url=server.base_url, reddit_url=server.base_url
+        )
+        return server, RedditClient(reddit)
+    
+    def test_listing_pagination(self):
+        """Test that a listing spanning several pages returns distinct posts."""
+        # Arrange
+        server, client = self.start_server()
+        
+        # Act
+        posts = client.fetch_listing("python", "new", limit=150)
+        
+        # Assert
+        self.assertEqual(len({post.id for post in posts}), 150)
+        self.assertEqual(posts[0].subreddit.display_name, "python")
+        self.assertEqual(server.state.requests["new"], 2)
+        self.assertEqual(server.state.requests["access_token"], 1)
+    
+    def test_listing_before_cursor(self):
+        """Test that before= listings return only the posts newer than the cursor."""
+        # Arrange
+        server, client = self.start_server()
+        posts = client.fetch_listing("python", "new", limit=10)
+        
+        # Act
+        newer = client.fetch_listing("python", "new", limit=25, before=posts[5].id)
+        newest = client.fetch_listing("python", "new", limit=25, before=posts[0].id)
+        
+        # Assert
+        self.assertEqual([post.id for post in newer], [post.id for post in posts[:5]])
+        self.assertEqual(newest, [])
+    
+    def test_multireddit_and_info(self):
+        """Test that multireddit listings and /api/info batches are served."""
+        # Arrange
+        server, client = self.start_server()
+        
+        # Act
+        grouped = client.fetch_multireddit_listing(["python", "learnpython"], limit_per_subreddit=3)
+        ids = [post.id for post in grouped["python"]]
+        refreshed = client.fetch_info(ids)
+        
+        # Assert
+        self.assertEqual(len(grouped["learnpython"]), 3)
+        self.assertEqual([post.id for post in refreshed], ids)
+        self.assertEqual(server.state.requests["info"], 1)
+    
+    @patch("time.sleep")
+    def test_injected_errors_surface_as_api_errors(self, mock_sleep):
+        """Test that injected server errors go through the client's error handling."""
+        # Arrange
+        server, client = self.start_server(error_rate=1.0)
+        
+        # Act / Assert
+        with self.assertRaises(RedditAPIError):
+            client.fetch_listing("python", "hot", limit=5)
+        self.assertGreater(server.state.requests["5xx"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
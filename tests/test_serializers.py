@@ -0,0 +1,75 @@
+"""
+Tests for the serializers module.
+"""
+
+import io
+import json
+import unittest
+
+from core.data_models import RedditPost
+from presentation.serializers import (
+    JSONSerializer, available_backends, get_serializer, post_to_row
+)
+from utils.error_handler import ConfigurationError
+
+class TestSerializers(unittest.TestCase):
+    """Test cases for the JSON serializer backends."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.posts = [
+            RedditPost(
+                id=f"post{i}",
+                title=f"Post \"{i}\" – ünïcode",
+                author="user1",
+                upvotes=i,
+                downvotes=None,
+                score=i,
+                url="https://reddit.com/r/test",
+                created_utc=1619430000.5,
+                num_comments=i,
+                is_self=True,
+                selftext="line one\nline two",
+                subreddit="test"
+            )
+            for i in range(7)
+        ]
+        self.expected = [post_to_row(post) for post in self.posts]
+        
+    def test_backends_round_trip(self):
+        """Test that every backend writes valid JSON across chunk boundaries."""
+        for backend in available_backends():
+            for indent in (None, 2):
+                with self.subTest(backend=backend, indent=indent):
+                    serializer = get_serializer(backend)
+                    serializer.CHUNK_SIZE = 3
+                    buffer = io.BytesIO()
+                    
+                    written = serializer.write(self.posts, buffer, indent=indent)
+                    
+                    self.assertEqual(written, len(buffer.getvalue()))
+                    self.assertEqual(json.loads(buffer.getvalue()), self.expected)
+                    
+    def test_encode_lines(self):
+        """Test that every backend writes one JSON object per line."""
+        for backend in available_backends():
+            with self.subTest(backend=backend):
+                data = get_serializer(backend).encode_lines(self.expected)
+                
+                lines = data.decode('utf-8').splitlines()
+                
+                self.assertEqual([json.loads(line) for line in lines], self.expected)
+                
+    def test_empty_export(self):
+        """Test that an empty export is an empty array."""
+        buffer = io.BytesIO()
+        JSONSerializer().write([], buffer, indent=2)
+        self.assertEqual(buffer.getvalue(), b"[]")
+        
+    def test_unknown_backend(self):
+        """Test that unknown backends are rejected."""
+        with self.assertRaises(ConfigurationError):
+            get_serializer("yaml")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,346 @@
+"""
+Tests for the sinks module.
+"""
+
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from core.data_models import RedditPost
+from presentation.sinks import (_CLOSE, JSONLinesSink, SinkFanOut, SinkWriter, SQLiteSink,
+                                Sink, WebhookSink, create_sink)
+from storage.post_importer import PostImporter
+
+def make_posts(count, start=0):
+    """Create test posts."""
+    return [
+        RedditPost(id=f"p{n}", title=f"Post {n}", author="author", upvotes=n, downvotes=0,
+                   score=n, url=f"https://example.com/{n}", created_utc=1700000000.0 + n,
+                   num_comments=n, is_self=False, subreddit="python", upvote_ratio=0.75)
+        for n in range(start, start + count)
+    ]
+
+
+class RecordingSink(Sink):
+    """Sink keeping its batches in memory, optionally failing or slow."""
+
+    def __init__(self, name="memory", failures=0, delay=0.0):
+        super().__init__(name)
+        self.batches = []
+        self.failures = failures
+        self.delay = delay
+
+    def write_batch(self, posts):
+        time.sleep(self.delay)
+        if self.failures:
+            self.failures -= 1
+            raise IOError("sink unavailable")
+        self.batches.append([post.id for post in posts])
+
+
+class FailingFileSink(JSONLinesSink):
+    """File sink whose writes always fail."""
+
+    def write_batch(self, posts):
+        raise IOError("disk full")
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    """Collects POSTed JSON bodies."""
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.bodies.append(json.loads(body))
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestSinkWriter(unittest.TestCase):
+    """Test cases for the SinkWriter class."""
+    
+    def setUp(self):
+        """Create a dead-letter directory."""
+        self.dead_letter_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dead_letter_dir, True)
+    
+    def test_batches_by_count(self):
+        """Test that full batches are written as soon as they fill up."""
+        # Arrange
+        sink = RecordingSink()
+        writer = SinkWriter(sink, batch_size=4, flush_interval=60)
+        
+        # Act
+        writer.write_many(make_posts(10))
+        writer.close()
+        
+        # Assert
+        self.assertEqual([len(batch) for batch in sink.batches], [4, 4, 2])
+        self.assertEqual(writer.stats["written"], 10)
+    
+    def test_batches_by_time(self):
+        """Test that a partial batch is written after the flush interval."""
+        # Arrange
+        sink = RecordingSink()
+        writer = SinkWriter(sink, batch_size=100, flush_interval=0.05)
+        self.addCleanup(writer.close)
+        
+        # Act
+        writer.write_many(make_posts(3))
+        time.sleep(0.3)
+        
+        # Assert
+        self.assertEqual(sink.batches, [["p0", "p1", "p2"]])
+        self.assertEqual(writer.pending, 0)
+    
+    def test_flush_waits_for_sink(self):
+        """Test that flush() returns once the buffered posts were written."""
+        # Arrange
+        sink = RecordingSink(delay=0.05)
+        writer = SinkWriter(sink, batch_size=100, flush_interval=60)
+        self.addCleanup(writer.close)
+        writer.write_many(make_posts(5))
+        
+        # Act
+        caught_up = writer.flush(timeout=5)
+        
+        # Assert
+        self.assertTrue(caught_up)
+        self.assertEqual(len(sink.batches), 1)
+    
+    def test_retry_then_success(self):
+        """Test that a failing batch is retried."""
+        # Arrange
+        sink = RecordingSink(failures=2)
+        writer = SinkWriter(sink, self.dead_letter_dir, retry_delay=0.001)
+        
+        # Act
+        writer.write_many(make_posts(3))
+        writer.close()
+        
+        # Assert
+        self.assertEqual(sink.batches, [["p0", "p1", "p2"]])
+        self.assertEqual(writer.stats["retries"], 2)
+        self.assertEqual(os.listdir(self.dead_letter_dir), [])
+    
+    def test_dead_letter_spool_and_replay(self):
+        """Test that batches failing every retry are spooled and replayed by the next writer."""
+        # Arrange
+        writer = SinkWriter(RecordingSink(failures=100), self.dead_letter_dir,
+                            max_retries=1, retry_delay=0.001)
+        writer.write_many(make_posts(3))
+        writer.close()
+        sink = RecordingSink()
+        
+        # Act
+        replay = SinkWriter(sink, self.dead_letter_dir)
+        replayed = replay.replay_dead_letters()
+        replay.close()
+        
+        # Assert
+        self.assertEqual(writer.stats["spooled"], 3)
+        self.assertEqual(writer.stats["failed_batches"], 1)
+        self.assertEqual(replayed, 3)
+        self.assertEqual(sink.batches, [["p0", "p1", "p2"]])
+        self.assertEqual(os.listdir(self.dead_letter_dir), [])
+    
+    def test_replay_goes_to_the_sink_that_spooled(self):
+        """Test that spooled posts are replayed into their own sink, not another of the same kind."""
+        # Arrange
+        path_a = os.path.join(self.dead_letter_dir, "a.ndjson")
+        path_b = os.path.join(self.dead_letter_dir, "b.ndjson")
+        failing = SinkWriter(FailingFileSink(path_b), self.dead_letter_dir, max_retries=0)
+        failing.write_many(make_posts(2))
+        failing.close()
+        writers = [SinkWriter(create_sink(path), self.dead_letter_dir) for path in (path_a, path_b)]
+        
+        # Act
+        replayed = [writer.replay_dead_letters() for writer in writers]
+        for writer in writers:
+            writer.close()
+        
+        # Assert
+        self.assertNotEqual(writers[0].sink.name, writers[1].sink.name)
+        self.assertEqual(replayed, [0, 2])
+        self.assertEqual(os.path.getsize(path_a), 0)
+        self.assertEqual([post.id for post in PostImporter(workers=1).load(path_b)], ["p0", "p1"])
+    
+    def test_replay_keeps_posts_while_sink_fails(self):
+        """Test that posts replayed into a still failing sink stay spooled."""
+        # Arrange
+        spool = lambda: [name for name in os.listdir(self.dead_letter_dir) if name.startswith("memory-")]
+        writer = SinkWriter(RecordingSink(failures=100), self.dead_letter_dir, max_retries=0)
+        writer.write_many(make_posts(3))
+        writer.close()
+        first_spool = spool()
+        
+        # Act
+        replay = SinkWriter(RecordingSink(failures=100), self.dead_letter_dir, max_retries=0)
+        replay.replay_dead_letters()
+        replay.close()
+        
+        # Assert
+        self.assertEqual(len(first_spool), 1)
+        self.assertNotIn(first_spool[0], spool())
+        posts = PostImporter(workers=1).load([os.path.join(self.dead_letter_dir, name) for name in spool()])
+        self.assertEqual([post.id for post in posts], ["p0", "p1", "p2"])
+    
+    def test_overflow_spools_instead_of_blocking(self):
+        """Test that a full buffer spools posts rather than blocking the caller."""
+        # Arrange
+        sink = RecordingSink(delay=0.2)
+        writer = SinkWriter(sink, self.dead_letter_dir, batch_size=1, max_pending=2)
+        
+        # Act
+        start = time.perf_counter()
+        writer.write_many(make_posts(10))
+        elapsed = time.perf_counter() - start
+        writer.close()
+        
+        # Assert
+        self.assertLess(elapsed, 0.15)
+        self.assertGreater(writer.stats["spooled"], 0)
+        self.assertEqual(writer.stats["written"] + writer.stats["spooled"], 10)
+
+    
+    def test_spool_failure_keeps_writer_alive(self):
+        """Test that posts that cannot be spooled are dropped without stopping the writer."""
+        # Arrange
+        blocked_dir = os.path.join(self.dead_letter_dir, "not-a-directory")
+        with open(blocked_dir, "w") as f:
+            f.write("")
+        writer = SinkWriter(RecordingSink(failures=100), blocked_dir, batch_size=2, max_pending=2,
+                            max_retries=0)
+        
+        # Act
+        writer.write_many(make_posts(20))
+        flushed = writer.flush(timeout=5)
+        writer.close()
+        
+        # Assert
+        self.assertTrue(flushed)
+        self.assertEqual(writer.stats["dropped"], 20)
+        self.assertEqual(writer.stats["spooled"], 0)
+    
+    def test_close_returns_when_writer_thread_died(self):
+        """Test that close() and flush() do not hang on a full queue without a writer thread."""
+        # Arrange
+        writer = SinkWriter(RecordingSink(), self.dead_letter_dir, max_pending=1)
+        writer._queue.put(_CLOSE)
+        writer._thread.join()
+        writer._queue.put(make_posts(1)[0])
+        
+        # Act
+        flushed = writer.flush(timeout=5)
+        writer.close()
+        
+        # Assert
+        self.assertFalse(flushed)
+
+
+class TestSinks(unittest.TestCase):
+    """Test cases for the file, SQLite and webhook sinks."""
+    
+    def setUp(self):
+        """Create a working directory."""
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, True)
+    
+    def test_json_lines_sink(self):
+        """Test that the file sink appends NDJSON the importer can read back."""
+        # Arrange
+        path = os.path.join(self.directory, "posts.ndjson")
+        
+        # Act
+        for start in (0, 2):
+            sink = create_sink(path)
+            sink.write_batch(make_posts(2, start))
+            sink.close()
+        
+        # Assert
+        self.assertIsInstance(sink, JSONLinesSink)
+        posts = PostImporter(workers=1).load(path)
+        self.assertEqual([post.id for post in posts], ["p0", "p1", "p2", "p3"])
+        self.assertEqual({post.upvote_ratio for post in posts}, {0.75})
+    
+    def test_sqlite_sink_upserts(self):
+        """Test that the SQLite sink replaces rows with the same id."""
+        # Arrange
+        path = os.path.join(self.directory, "posts.db")
+        sink = create_sink(f"sqlite:{path}")
+        updated = make_posts(1)[0]
+        updated.score = 99
+        
+        # Act
+        sink.write_batch(make_posts(3))
+        sink.write_batch([updated])
+        sink.close()
+        
+        # Assert
+        self.assertIsInstance(sink, SQLiteSink)
+        with sqlite3.connect(path) as connection:
+            rows = connection.execute("SELECT id, score FROM posts ORDER BY id").fetchall()
+        self.assertEqual(rows, [("p0", 99), ("p1", 1), ("p2", 2)])
+    
+    def test_sqlite_sink_adds_missing_columns(self):
+        """Test that a table created before upvote_ratio was exported gets the column."""
+        # Arrange
+        path = os.path.join(self.directory, "posts.db")
+        with sqlite3.connect(path) as connection:
+            connection.execute("CREATE TABLE posts (id PRIMARY KEY, title, score)")
+        
+        # Act
+        sink = create_sink(f"sqlite:{path}")
+        sink.write_batch(make_posts(1))
+        sink.close()
+        
+        # Assert
+        with sqlite3.connect(path) as connection:
+            rows = connection.execute("SELECT id, upvote_ratio FROM posts").fetchall()
+        self.assertEqual(rows, [("p0", 0.75)])
+    
+    def test_webhook_sink(self):
+        """Test that the webhook sink POSTs each batch as a JSON array."""
+        # Arrange
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _WebhookHandler)
+        server.bodies = []
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        sink = create_sink(f"http://127.0.0.1:{server.server_address[1]}/hook")
+        
+        # Act
+        sink.write_batch(make_posts(2))
+        sink.close()
+        
+        # Assert
+        self.assertIsInstance(sink, WebhookSink)
+        self.assertEqual([[row["id"] for row in body] for body in server.bodies], [["p0", "p1"]])
+    
+    def test_fan_out_isolates_slow_sink(self):
+        """Test that every sink gets every post and a slow sink does not delay a fast one."""
+        # Arrange
+        fast = RecordingSink("fast")
+        slow = RecordingSink("slow", delay=0.3)
+        
+        # Act
+        with SinkFanOut([fast, slow], batch_size=5, flush_interval=60) as fan_out:
+            fan_out.write_many(make_posts(10))
+            time.sleep(0.1)
+            fast_batches = len(fast.batches)
+        
+        # Assert
+        self.assertEqual(fast_batches, 2)
+        self.assertEqual(sum(len(batch) for batch in slow.batches), 10)
+        self.assertEqual(fan_out.stats["fast"]["written"], 10)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+"""
+Tests for the snapshot module.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from core.data_models import RedditPost
+from services.change_tracker import ChangeTracker
+from services.dedup import DuplicateIndex
+from services.keyword_matcher import KeywordMatcher
+from storage.snapshot import Snapshot, SnapshotFormatError, SnapshotManager, SnapshotWriter
+from utils.cache import TTLCache
+
+def make_post(post_id, title, score=10):
+    """Create a post with the given id, title and score."""
+    return RedditPost(
+        id=post_id,
+        title=title,
+        author="testuser",
+        upvotes=score,
+        downvotes=None,
+        score=score,
+        url=f"https://example.com/{post_id}",
+        created_utc=1619430000,
+        num_comments=0,
+        is_self=False
+    )
+
+class TestSnapshotFile(unittest.TestCase):
+    """Test cases for the SnapshotWriter and Snapshot classes."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = os.path.join(self.temp_dir.name, "state", "state.snapshot")
+        
+    def test_round_trip(self):
+        """Test that raw and object sections are read back unchanged."""
+        # Arrange
+        writer = SnapshotWriter(self.path)
+        writer.add("bits", b"\x01\x02\x03")
+        writer.add_object("cursors", {"python": ("abc", 1.5)})
+        writer.close()
+        
+        # Act
+        with Snapshot(self.path) as snapshot:
+            names = snapshot.names()
+            raw = snapshot.load("bits")
+            cursors = snapshot.load("cursors")
+            
+        # Assert
+        self.assertEqual(names, ["bits", "cursors"])
+        self.assertEqual(raw, b"\x01\x02\x03")
+        self.assertEqual(cursors, {"python": ("abc", 1.5)})
+        
+    def test_corrupt_section_is_detected(self):
+        """Test that a damaged section fails its checksum."""
+        # Arrange
+        writer = SnapshotWriter(self.path)
+        writer.add("bits", b"abcdefgh")
+        writer.close()
+        with open(self.path, "r+b") as f:
+            f.seek(-1, os.SEEK_END)
+            f.write(b"X")
+            
+        # Act / Assert
+        with Snapshot(self.path) as snapshot:
+            with self.assertRaises(SnapshotFormatError):
+                snapshot.load("bits")
+                
+    def test_invalid_file(self):
+        """Test that a file without the snapshot header is rejected."""
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "wb") as f:
+            f.write(b"not a snapshot at all, really")
+        with self.assertRaises(SnapshotFormatError):
+            Snapshot(self.path)
+
+class TestSnapshotManager(unittest.TestCase):
+    """Test cases for the SnapshotManager class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = os.path.join(self.temp_dir.name, "state.snapshot")
+        
+    def test_components_resume_warm(self):
+        """Test that a new process restores tracker, index, cache and keywords."""
+        # Arrange
+        tracker, index, cache = ChangeTracker(), DuplicateIndex(), TTLCache(ttl=60)
+        matcher = KeywordMatcher(["python", "rust"])
+        tracker.track([make_post("a1", "First post here")], now=100)
+        index.add(make_post("a1", "Scientists discover new species of octopus"))
+        cache.set(("python", "new"), ["a1"])
+        manager = SnapshotManager(self.path)
+        for name, component in (("tracker", tracker), ("dedup", index), ("cache", cache), ("keywords", matcher)):
+            manager.register(name, component)
+        manager.save()
+        
+        # Act
+        restored = SnapshotManager(self.path)
+        new_tracker, new_index, new_cache = ChangeTracker(), DuplicateIndex(), TTLCache(ttl=60)
+        new_matcher = KeywordMatcher()
+        results = [restored.register("tracker", new_tracker), restored.register("dedup", new_index),
+                   restored.register("cache", new_cache), restored.register("keywords", new_matcher)]
+        restored.close()
+        
+        # Assert
+        self.assertEqual(results, [True, True, True, True])
+        self.assertIn("a1", new_tracker)
+        self.assertIsNone(new_tracker.observe(make_post("a1", "First post here"), now=200))
+        self.assertEqual(new_index.add(make_post("b2", "Scientists discover new species of octopus!")).reason, "title")
+        self.assertEqual(new_cache.get(("python", "new")), ["a1"])
+        self.assertEqual(new_matcher.find("Rust and Python"), ["rust", "python"])
+        
+    def test_incompatible_state_starts_cold(self):
+        """Test that state saved with other settings is skipped instead of misused."""
+        # Arrange
+        manager = SnapshotManager(self.path)
+        manager.register("dedup", DuplicateIndex(num_perm=32, bands=8))
+        manager.save()
+        
+        # Act
+        restored = SnapshotManager(self.path)
+        result = restored.register("dedup", DuplicateIndex())
+        restored.close()
+        
+        # Assert
+        self.assertFalse(result)
+        
+    def test_periodic_save(self):
+        """Test that maybe_save only writes once the interval has passed."""
+        with patch("storage.snapshot.time.monotonic", side_effect=[0.0, 10.0, 4000.0, 4000.0]):
+            manager = SnapshotManager(self.path, interval=3600)
+            manager.register("tracker", ChangeTracker())
+            self.assertFalse(manager.maybe_save())
+            self.assertFalse(os.path.exists(self.path))
+            self.assertTrue(manager.maybe_save())
+            self.assertTrue(os.path.exists(self.path))
+
+if __name__ == "__main__":
+    unittest.main()
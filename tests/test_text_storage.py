@@ -0,0 +1,100 @@
+"""
+Tests for the text storage module.
+"""
+
+import pickle
+import unittest
+
+from core.data_models import RedditPost
+from core.text_storage import (CompressedText, CompressedTextStorage, HeapText, TextHeap,
+                               create_text_storage, set_text_storage)
+from utils.error_handler import ConfigurationError
+
+BODY = "A long self post body that repeats itself. " * 40
+
+def make_post(selftext):
+    """Create a self post with the given body."""
+    return RedditPost(
+        id="abc123",
+        title="Test Post",
+        author="testuser",
+        upvotes=100,
+        downvotes=None,
+        score=100,
+        url="https://reddit.com/r/test/comments/abc123",
+        created_utc=1619430000,
+        num_comments=10,
+        is_self=True,
+        selftext=selftext
+    )
+
+class TestTextStorage(unittest.TestCase):
+    """Test cases for the selftext storage modes."""
+    
+    def tearDown(self):
+        """Reset the storage to plain strings."""
+        set_text_storage(None)
+        
+    def test_plain_by_default(self):
+        """Test that posts keep plain strings unless configured otherwise."""
+        post = make_post(BODY)
+        self.assertIsInstance(post.__dict__["_selftext"], str)
+        self.assertEqual(post.selftext_preview, BODY.strip()[:197] + "...")
+        self.assertIsNone(make_post(None).selftext)
+        
+    def test_compressed_selftext(self):
+        """Test that long bodies are compressed and decoded transparently."""
+        # Arrange
+        set_text_storage(CompressedTextStorage(min_length=100))
+        
+        # Act
+        post = make_post(BODY)
+        short = make_post("Short body")
+        
+        # Assert
+        self.assertIsInstance(post.__dict__["_selftext"], CompressedText)
+        self.assertEqual(post.selftext, BODY)
+        self.assertEqual(short.selftext, "Short body")
+        self.assertEqual(post.selftext_preview, make_post(BODY).selftext_preview)
+        self.assertEqual(post, make_post(BODY))
+        
+    def test_heap_selftext(self):
+        """Test that bodies in the text heap are read back on access."""
+        # Arrange
+        heap = TextHeap(min_length=0)
+        self.addCleanup(heap.close)
+        set_text_storage(heap)
+        
+        # Act
+        first, second = make_post(BODY), make_post("Second body")
+        
+        # Assert
+        self.assertIsInstance(first.__dict__["_selftext"], HeapText)
+        self.assertEqual(first.selftext, BODY)
+        self.assertEqual(second.selftext, "Second body")
+        self.assertEqual(heap.size, len(BODY) + len("Second body"))
+        
+    def test_pickled_posts_carry_their_text(self):
+        """Test that pickling stores the decoded text instead of a heap reference."""
+        # Arrange
+        heap = TextHeap(min_length=0)
+        self.addCleanup(heap.close)
+        set_text_storage(heap)
+        post = make_post(BODY)
+        set_text_storage(None)
+        
+        # Act
+        copy = pickle.loads(pickle.dumps(post))
+        
+        # Assert
+        self.assertEqual(copy.selftext, BODY)
+        self.assertIsInstance(copy.__dict__["_selftext"], str)
+        
+    def test_create_text_storage(self):
+        """Test that storages are created by name."""
+        self.assertIsInstance(create_text_storage("zlib"), CompressedTextStorage)
+        with self.assertRaises(ConfigurationError):
+            create_text_storage("brotli")
+
+if __name__ == "__main__":
+    unittest.main()
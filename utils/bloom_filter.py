@@ -0,0 +1,360 @@
+"""
+Bloom Filter module for the Reddit Fetcher application.
+
+This module provides compact probabilistic sets for "have we seen this post"
+checks: a fixed-size Bloom filter, a scalable variant that grows as items are
+added while bounding the false-positive rate, and a time-rotated filter of
+post ids that forgets old generations instead of growing forever.
+"""
+
+import hashlib
+import math
+import struct
+import time
+from typing import Iterable, List, Optional, Tuple
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MAGIC = b"RFBLOOM\x00"
+VERSION = 1
+
+# magic, version, generation count, generation seconds, error rate
+FILE_HEADER = struct.Struct("<8sIIdd")
+# started, filter count
+GENERATION_HEADER = struct.Struct("<dI")
+# capacity, count, hash count, bit count, error rate
+FILTER_HEADER = struct.Struct("<QQIQd")
+
+def _hash_pair(key: str) -> Tuple[int, int]:
+    """Derive two independent 64-bit hashes of a key."""
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+    return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+
+class BloomFilter:
+    """Fixed-capacity Bloom filter over strings."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        """
+        Initialize the filter.
+
+        Args:
+            capacity: Number of items the filter is sized for
+            error_rate: False-positive rate at full capacity
+
+        Raises:
+            ValueError: If the capacity or error rate is out of range
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: str) -> List[int]:
+        """Get the bit positions of a key (double hashing)."""
+        h1, h2 = _hash_pair(key)
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
+
+    def add(self, key: str) -> bool:
+        """
+        Add a key.
+
+        Args:
+            key: Key to add
+
+        Returns:
+            bool: True if the key was (probably) present already
+        """
+        bits = self._bits
+        present = True
+        for position in self._positions(key):
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                present = False
+                bits[position >> 3] |= mask
+        if not present:
+            self.count += 1
+        return present
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a key was (probably) added."""
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    @property
+    def full(self) -> bool:
+        """Check whether the filter reached its capacity."""
+        return self.count >= self.capacity
+
+    @property
+    def size_bytes(self) -> int:
+        """Get the size of the bit array in bytes."""
+        return len(self._bits)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the filter."""
+        return FILTER_HEADER.pack(self.capacity, self.count, self.num_hashes,
+                                  self.num_bits, self.error_rate) + bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, data: memoryview, offset: int = 0) -> Tuple["BloomFilter", int]:
+        """
+        Deserialize a filter.
+
+        Args:
+            data: Buffer holding a serialized filter
+            offset: Position of the filter in the buffer
+
+        Returns:
+            Tuple[BloomFilter, int]: The filter and the offset just past it
+
+        Raises:
+            ValueError: If the buffer is truncated
+        """
+        if offset + FILTER_HEADER.size > len(data):
+            raise ValueError("truncated Bloom filter")
+        capacity, count, num_hashes, num_bits, error_rate = FILTER_HEADER.unpack_from(data, offset)
+        offset += FILTER_HEADER.size
+        size = (num_bits + 7) // 8
+        if offset + size > len(data):
+            raise ValueError("truncated Bloom filter")
+
+        bloom = cls.__new__(cls)
+        bloom.capacity = capacity
+        bloom.error_rate = error_rate
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.count = count
+        bloom._bits = bytearray(data[offset:offset + size])
+        return bloom, offset + size
+
+
+class ScalableBloomFilter:
+    """Bloom filter that adds larger, stricter slices as it fills up."""
+
+    # Each new slice holds GROWTH times more items ...
+    GROWTH = 2
+    # ... at TIGHTENING times the false-positive rate; the first slice gets
+    # error_rate * (1 - TIGHTENING), so the total stays below error_rate
+    TIGHTENING = 0.5
+
+    def __init__(self, initial_capacity: int, error_rate: float):
+        """
+        Initialize the filter.
+
+        Args:
+            initial_capacity: Capacity of the first slice
+            error_rate: Upper bound of the overall false-positive rate
+        """
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.filters: List[BloomFilter] = []
+
+    def add(self, key: str) -> bool:
+        """
+        Add a key.
+
+        Args:
+            key: Key to add
+
+        Returns:
+            bool: True if the key was (probably) present already
+        """
+        if key in self:
+            return True
+        if not self.filters or self.filters[-1].full:
+            index = len(self.filters)
+            self.filters.append(BloomFilter(
+                self.initial_capacity * self.GROWTH ** index,
+                self.error_rate * (1 - self.TIGHTENING) * self.TIGHTENING ** index
+            ))
+        self.filters[-1].add(key)
+        return False
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a key was (probably) added."""
+        # Newest slices hold most items, so check them first
+        return any(key in bloom for bloom in reversed(self.filters))
+
+    def __len__(self) -> int:
+        """Get the approximate number of added keys."""
+        return sum(bloom.count for bloom in self.filters)
+
+    @property
+    def size_bytes(self) -> int:
+        """Get the size of all bit arrays in bytes."""
+        return sum(bloom.size_bytes for bloom in self.filters)
+
+
+class SeenIdFilter:
+    """Remembers seen post ids in a few bytes each, forgetting them after a retention period."""
+
+    DEFAULT_CAPACITY = 100_000  # ids per generation before a slice is added
+    DEFAULT_ERROR_RATE = 0.001
+    DEFAULT_GENERATION_SECONDS = 24 * 3600
+    DEFAULT_GENERATIONS = 7
+
+    def __init__(self, capacity: Optional[int] = None,
+                 error_rate: Optional[float] = None,
+                 generation_seconds: Optional[float] = None,
+                 generations: Optional[int] = None):
+        """
+        Initialize the filter.
+
+        Ids are added to the newest generation. A new generation starts every
+        generation_seconds and the oldest one is dropped, so an id is
+        remembered for at least (generations - 1) * generation_seconds.
+
+        Args:
+            capacity: Expected ids per generation
+            error_rate: Upper bound of the overall false-positive rate
+            generation_seconds: Length of a generation in seconds
+            generations: Number of generations kept
+        """
+        self.capacity = capacity or self.DEFAULT_CAPACITY
+        self.error_rate = error_rate or self.DEFAULT_ERROR_RATE
+        self.generation_seconds = generation_seconds or self.DEFAULT_GENERATION_SECONDS
+        self.max_generations = generations or self.DEFAULT_GENERATIONS
+        # (start time, filter), oldest first
+        self._generations: List[Tuple[float, ScalableBloomFilter]] = []
+
+    def _new_generation(self) -> ScalableBloomFilter:
+        """Create an empty generation; the error budget is split across generations."""
+        return ScalableBloomFilter(self.capacity, self.error_rate / self.max_generations)
+
+    def rotate(self, now: Optional[float] = None) -> None:
+        """
+        Start a new generation if the current one is old enough.
+
+        Args:
+            now: Current Unix time (defaults to time.time())
+        """
+        now = time.time() if now is None else now
+        if self._generations and now - self._generations[-1][0] < self.generation_seconds:
+            return
+        self._generations.append((now, self._new_generation()))
+        if len(self._generations) > self.max_generations:
+            self._generations.pop(0)
+            logger.debug("Dropped the oldest seen-id generation")
+
+    def add(self, post_id: str, now: Optional[float] = None) -> bool:
+        """
+        Mark a post id as seen.
+
+        Args:
+            post_id: Post id
+            now: Current Unix time (defaults to time.time())
+
+        Returns:
+            bool: True if the id was (probably) seen before
+        """
+        self.rotate(now)
+        if any(post_id in bloom for _, bloom in self._generations[:-1]):
+            return True
+        return self._generations[-1][1].add(post_id)
+
+    def __contains__(self, post_id: str) -> bool:
+        """Check whether a post id was (probably) seen."""
+        return any(post_id in bloom for _, bloom in reversed(self._generations))
+
+    def unseen(self, posts: Iterable, now: Optional[float] = None) -> List:
+        """
+        Filter posts down to the ones not seen before, marking them as seen.
+
+        Args:
+            posts: Fetched posts
+            now: Current Unix time (defaults to time.time())
+
+        Returns:
+            List: Posts whose ids were not seen yet, in input order
+        """
+        return [post for post in posts if not self.add(post.id, now)]
+
+    def __len__(self) -> int:
+        """Get the approximate number of remembered ids."""
+        return sum(len(bloom) for _, bloom in self._generations)
+
+    @property
+    def size_bytes(self) -> int:
+        """Get the size of all bit arrays in bytes."""
+        return sum(bloom.size_bytes for _, bloom in self._generations)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the filter.
+
+        Returns:
+            bytes: Versioned binary representation
+        """
+        # Copies keep the counts consistent if another thread adds ids meanwhile
+        generations = list(self._generations)
+        parts = [FILE_HEADER.pack(MAGIC, VERSION, len(generations),
+                                  self.generation_seconds, self.error_rate)]
+        for started, scalable in generations:
+            filters = list(scalable.filters)
+            parts.append(GENERATION_HEADER.pack(started, len(filters)))
+            parts.extend(bloom.to_bytes() for bloom in filters)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, capacity: Optional[int] = None,
+                   generations: Optional[int] = None) -> "SeenIdFilter":
+        """
+        Deserialize a filter.
+
+        Args:
+            data: Output of to_bytes()
+            capacity: Expected ids per generation for new generations
+            generations: Number of generations kept
+
+        Returns:
+            SeenIdFilter: The restored filter
+
+        Raises:
+            ValueError: If the data is not a serialized filter
+        """
+        data = memoryview(data)
+        if len(data) < FILE_HEADER.size:
+            raise ValueError("truncated seen-id filter")
+        magic, version, count, generation_seconds, error_rate = FILE_HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a seen-id filter or unsupported version")
+
+        seen = cls(capacity, error_rate, generation_seconds, generations)
+        offset = FILE_HEADER.size
+        for _ in range(count):
+            if offset + GENERATION_HEADER.size > len(data):
+                raise ValueError("truncated seen-id filter")
+            started, filter_count = GENERATION_HEADER.unpack_from(data, offset)
+            offset += GENERATION_HEADER.size
+            scalable = seen._new_generation()
+            for _ in range(filter_count):
+                bloom, offset = BloomFilter.from_bytes(data, offset)
+                scalable.filters.append(bloom)
+            seen._generations.append((started, scalable))
+        del seen._generations[:-seen.max_generations]
+        return seen
+
+    def snapshot_state(self) -> bytes:
+        """Get the serialized filter for a snapshot."""
+        return self.to_bytes()
+
+    def restore_state(self, state: bytes) -> None:
+        """
+        Restore the filter from a snapshot.
+
+        Args:
+            state: State returned by snapshot_state()
+        """
+        restored = self.from_bytes(state, self.capacity, self.max_generations)
+        self.generation_seconds = restored.generation_seconds
+        self._generations = restored._generations
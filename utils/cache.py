@@ -0,0 +1,118 @@
+"""
+Cache module for the Reddit Fetcher application.
+
+This module provides a small in-memory TTL cache with LRU eviction.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Tuple
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed time."""
+
+    DEFAULT_TTL = 30  # seconds
+    DEFAULT_MAX_SIZE = 256
+
+    def __init__(self, ttl: Optional[float] = None, max_size: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Time to live of each entry in seconds (0 disables caching)
+            max_size: Maximum number of entries kept
+        """
+        self.ttl = self.DEFAULT_TTL if ttl is None else ttl
+        self.max_size = max_size or self.DEFAULT_MAX_SIZE
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[Any]: Cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        if self.ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Remove one entry, or every entry if no key is given.
+
+        Args:
+            key: Cache key (optional)
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def snapshot_state(self) -> List[Tuple[Hashable, float, Any]]:
+        """
+        Get the live entries for a snapshot.
+
+        Returns:
+            List[Tuple[Hashable, float, Any]]: (key, wall-clock expiry, value)
+                in LRU order; values must be picklable
+        """
+        with self._lock:
+            offset = time.time() - time.monotonic()
+            return [(key, expires_at + offset, value) for key, (expires_at, value) in self._entries.items()]
+
+    def restore_state(self, state: List[Tuple[Hashable, float, Any]]) -> None:
+        """
+        Restore entries from a snapshot, dropping the ones that expired meanwhile.
+
+        Args:
+            state: State returned by snapshot_state()
+        """
+        with self._lock:
+            offset = time.time() - time.monotonic()
+            for key, expires_at, value in state:
+                if expires_at > time.time():
+                    self._entries[key] = (expires_at - offset, value)
+                    self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Get the number of stored entries, including expired ones."""
+        return len(self._entries)
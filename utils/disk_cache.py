@@ -0,0 +1,118 @@
+"""
+Disk Cache module for the Reddit Fetcher application.
+
+This module provides a content-addressed on-disk cache: JSON records are
+stored under the SHA-256 of their key and binary blobs under the SHA-256 of
+their contents, so identical content is stored once.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class DiskCache:
+    """Content-addressed cache of JSON records and binary blobs in a directory."""
+
+    def __init__(self, directory: str):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Cache directory (created if missing)
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        """Get the SHA-256 hex digest of some bytes."""
+        return hashlib.sha256(data).hexdigest()
+
+    def _path(self, kind: str, digest: str) -> str:
+        """Get the path of an entry, fanned out over subdirectories."""
+        return os.path.join(self.directory, kind, digest[:2], digest[2:])
+
+    def _write(self, path: str, data: bytes) -> None:
+        """Write a file atomically."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(descriptor, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    def get_record(self, key: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a JSON record.
+
+        Args:
+            key: Record key
+            max_age: Maximum age in seconds (optional)
+
+        Returns:
+            Optional[Dict[str, Any]]: The record, or None if missing, stale or unreadable
+        """
+        path = self._path("records", self.digest(key.encode('utf-8')))
+        try:
+            if max_age is not None and time.time() - os.path.getmtime(path) > max_age:
+                return None
+            with open(path, 'rb') as f:
+                return json.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache record {path}: {str(e)}")
+            return None
+
+    def put_record(self, key: str, record: Dict[str, Any]) -> None:
+        """
+        Store a JSON record.
+
+        Args:
+            key: Record key
+            record: JSON-serializable record
+        """
+        path = self._path("records", self.digest(key.encode('utf-8')))
+        self._write(path, json.dumps(record, ensure_ascii=False).encode('utf-8'))
+
+    def put_blob(self, data: bytes) -> str:
+        """
+        Store a blob under the digest of its contents.
+
+        Args:
+            data: Blob contents
+
+        Returns:
+            str: SHA-256 hex digest addressing the blob
+        """
+        digest = self.digest(data)
+        path = self._path("blobs", digest)
+        if not os.path.exists(path):
+            self._write(path, data)
+        return digest
+
+    def get_blob(self, digest: str) -> Optional[bytes]:
+        """
+        Get a blob by digest.
+
+        Args:
+            digest: SHA-256 hex digest returned by put_blob()
+
+        Returns:
+            Optional[bytes]: Blob contents, or None if missing
+        """
+        try:
+            with open(self._path("blobs", digest), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def blob_path(self, digest: str) -> str:
+        """Get the file path of a blob."""
+        return self._path("blobs", digest)
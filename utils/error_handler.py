@@ -5,7 +5,7 @@ This module provides error handling utilities and custom exceptions.
 """
 
 import sys
-from typing import Union
+from typing import Dict, List, Union
 
 from utils.logger import get_logger
 
@@ -28,10 +28,44 @@ class RateLimitError(RedditAPIError):
     """Exception raised when the Reddit API rate limit is exceeded."""
     pass
 
+class CircuitOpenError(RedditAPIError):
+    """Exception raised when a subreddit is skipped because its circuit breaker is open."""
+    pass
+
 class ConfigurationError(RedditFetcherError):
     """Exception raised for configuration errors."""
     pass
 
+class PartialFetchError(RedditFetcherError):
+    """Exception raised when some subreddits of a batch could not be fetched."""
+    
+    def __init__(self, succeeded: List[str], failed: Dict[str, Exception]):
+        """
+        Initialize the error.
+        
+        Args:
+            succeeded: Names of the subreddits that were fetched
+            failed: Errors keyed by the name of the subreddit that failed
+        """
+        self.succeeded = succeeded
+        self.failed = failed
+        super().__init__(
+            f"Fetched {len(succeeded)} of {len(succeeded) + len(failed)} subreddits"
+        )
+        
+    def summary(self) -> str:
+        """
+        Get a human-readable summary of the batch.
+        
+        Returns:
+            str: Summary with one line per failed subreddit
+        """
+        lines = [str(self)]
+        for name, error in self.failed.items():
+            reason = "skipped, circuit open" if isinstance(error, CircuitOpenError) else str(error)
+            lines.append(f"  r/{name}: {reason}")
+        return "\n".join(lines)
+
 
 def handle_application_error(error: Exception) -> int:
     """
@@ -58,6 +92,11 @@ def handle_application_error(error: Exception) -> int:
         print(f"Error: {str(error)}")
         return 3
         
+    elif isinstance(error, PartialFetchError):
+        logger.error(f"Partial fetch: {str(error)}")
+        print(f"Warning: {error.summary()}")
+        return 5
+        
     elif isinstance(error, ConfigurationError):
         logger.error(f"Configuration error: {str(error)}")
         print(f"Error: {str(error)}")
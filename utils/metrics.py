@@ -0,0 +1,140 @@
+"""
+Metrics module for the Reddit Fetcher application.
+
+This module provides lightweight in-process counters, gauges and timings.
+"""
+
+import threading
+from collections import defaultdict, deque
+from contextlib import contextmanager
+import time
+from typing import Deque, Dict, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class MetricsRegistry:
+    """Thread-safe registry of named counters, gauges and timing samples."""
+
+    # Number of most recent samples kept per timing for percentile estimates
+    MAX_SAMPLES = 1000
+
+    def __init__(self, max_samples: Optional[int] = None):
+        """
+        Initialize the metrics registry.
+
+        Args:
+            max_samples: Number of samples kept per timing (optional)
+        """
+        self._lock = threading.Lock()
+        self._max_samples = max_samples or self.MAX_SAMPLES
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._gauges: Dict[str, float] = {}
+        self._timings: Dict[str, Deque[float]] = {}
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """
+        Increment a counter.
+
+        Args:
+            name: Counter name
+            value: Amount to add
+        """
+        with self._lock:
+            self._counters[name] += value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """
+        Set a gauge to an absolute value.
+
+        Args:
+            name: Gauge name
+            value: New gauge value
+        """
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name: str, seconds: float) -> None:
+        """
+        Record a timing sample.
+
+        Args:
+            name: Timing name
+            seconds: Duration in seconds
+        """
+        with self._lock:
+            samples = self._timings.get(name)
+            if samples is None:
+                samples = deque(maxlen=self._max_samples)
+                self._timings[name] = samples
+            samples.append(seconds)
+
+    @contextmanager
+    def timer(self, name: str):
+        """
+        Context manager recording the wall time of its block.
+
+        Args:
+            name: Timing name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def counter(self, name: str) -> float:
+        """Get the current value of a counter."""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def gauge(self, name: str) -> Optional[float]:
+        """Get the current value of a gauge, or None if never set."""
+        with self._lock:
+            return self._gauges.get(name)
+
+    def percentile(self, name: str, pct: float) -> Optional[float]:
+        """
+        Get a percentile of the recent samples of a timing.
+
+        Args:
+            name: Timing name
+            pct: Percentile between 0 and 100
+
+        Returns:
+            Optional[float]: Percentile value, or None if there are no samples
+        """
+        with self._lock:
+            samples = sorted(self._timings.get(name, ()))
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(round(pct / 100.0 * (len(samples) - 1))))
+        return samples[index]
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get a point-in-time copy of all metrics.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Counters, gauges and timing summaries
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            timings = {name: list(samples) for name, samples in self._timings.items()}
+
+        summaries = {}
+        for name, samples in timings.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            summaries[name] = {
+                'count': len(ordered),
+                'mean': sum(ordered) / len(ordered),
+                'p50': ordered[len(ordered) // 2],
+                'p95': ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))],
+                'max': ordered[-1],
+            }
+
+        return {'counters': counters, 'gauges': gauges, 'timings': summaries}
@@ -0,0 +1,241 @@
+"""
+Profiler module for the Reddit Fetcher application.
+
+This module provides per-stage busy-time accounting and optional cProfile
+or sampling profiler sessions that write pstats or speedscope files. Both
+profilers cover every thread, including pipeline workers.
+"""
+
+import cProfile
+import json
+import pstats
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class StageTimer:
+    """Accumulates busy time per named stage of a run, summed over threads."""
+
+    def __init__(self):
+        """Initialize the stage timer."""
+        self._totals: "OrderedDict[str, float]" = OrderedDict()
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._created = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Context manager adding the wall time of its block to a stage.
+
+        Args:
+            name: Stage name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._totals[name] = self._totals.get(name, 0.0) + elapsed
+                self._counts[name] = self._counts.get(name, 0) + 1
+
+    def totals(self) -> Dict[str, float]:
+        """Get the accumulated seconds per stage, in first-use order."""
+        with self._lock:
+            return dict(self._totals)
+
+    def report(self) -> str:
+        """
+        Format the per-stage breakdown.
+
+        Stages running concurrently overlap, so their busy times can add up
+        to more than the wall time of the run, which is reported separately.
+
+        Returns:
+            str: Table of stages with busy seconds, calls and milliseconds per call
+        """
+        totals = self.totals()
+        with self._lock:
+            counts = dict(self._counts)
+        lines = [f"{'stage':<10} {'busy':>9} {'calls':>6} {'ms/call':>8}"]
+        for name, seconds in totals.items():
+            lines.append(f"{name:<10} {seconds:>9.3f} {counts[name]:>6} {seconds * 1000 / counts[name]:>8.2f}")
+        lines.append(f"{'wall':<10} {time.perf_counter() - self._created:>9.3f}")
+        return "\n".join(lines)
+
+
+class SamplingProfiler:
+    """Periodically samples the stacks of running threads and writes a speedscope profile."""
+
+    DEFAULT_INTERVAL = 0.005  # seconds
+
+    def __init__(self, interval: Optional[float] = None,
+                 thread_id: Optional[int] = None):
+        """
+        Initialize the sampling profiler.
+
+        Args:
+            interval: Seconds between samples
+            thread_id: Only sample this thread (defaults to every thread)
+        """
+        self.interval = interval or self.DEFAULT_INTERVAL
+        self.thread_id = thread_id
+        self._frames: List[Dict[str, object]] = []
+        self._frame_index: Dict[Tuple[str, str, int], int] = {}
+        # Samples, weights and name of every sampled thread, by thread id
+        self._threads: "OrderedDict[int, Dict[str, object]]" = OrderedDict()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started_at = 0.0
+        self._duration = 0.0
+
+    def start(self) -> None:
+        """Start sampling in a background thread."""
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._duration = time.perf_counter() - self._started_at
+
+    def _stack(self, frame) -> List[int]:
+        """Get the frame indices of a stack, root first."""
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            key = (code.co_name, code.co_filename, code.co_firstlineno)
+            index = self._frame_index.get(key)
+            if index is None:
+                index = len(self._frames)
+                self._frame_index[key] = index
+                self._frames.append({'name': key[0], 'file': key[1], 'line': key[2]})
+            stack.append(index)
+            frame = frame.f_back
+        stack.reverse()  # speedscope expects root first
+        return stack
+
+    def _run(self) -> None:
+        """Sample the target threads until stopped."""
+        own_id = threading.get_ident()
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            now = time.perf_counter()
+            if self.thread_id is not None:
+                frames = {self.thread_id: frames[self.thread_id]} if self.thread_id in frames else {}
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+
+            for thread_id, frame in frames.items():
+                if thread_id == own_id:
+                    continue
+                thread = self._threads.get(thread_id)
+                if thread is None:
+                    thread = {'name': names.get(thread_id, str(thread_id)), 'samples': [], 'weights': []}
+                    self._threads[thread_id] = thread
+                thread['samples'].append(self._stack(frame))
+                thread['weights'].append(now - last)
+            last = now
+
+    def write_speedscope(self, path: str, name: str = "reddit_fetcher") -> None:
+        """
+        Write the samples in speedscope's sampled profile format, one profile per thread.
+
+        Args:
+            path: Output file path
+            name: Profile name shown in speedscope
+        """
+        document = {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'shared': {'frames': self._frames},
+            'profiles': [{
+                'type': 'sampled',
+                'name': thread['name'],
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': self._duration,
+                'samples': thread['samples'],
+                'weights': thread['weights'],
+            } for thread in self._threads.values()],
+            'name': name,
+            'exporter': 'reddit_fetcher',
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(document, f)
+
+
+class _ThreadProfile(cProfile.Profile):
+    """cProfile profiler of one worker thread, read from another thread when the session ends."""
+
+    def create_stats(self):
+        # disable() would only unhook the calling thread; this profile ends with its own
+        self.snapshot_stats()
+
+
+class ProfileSession:
+    """Runs cProfile or the sampling profiler around a block of code, covering every thread."""
+
+    MODES = ("cprofile", "sample")
+
+    def __init__(self, output_path: str, mode: str = "cprofile"):
+        """
+        Initialize the profiling session.
+
+        Args:
+            output_path: File the profile is written to (pstats or speedscope JSON)
+            mode: Profiler to use (cprofile or sample)
+
+        Raises:
+            ValueError: If the mode is not supported
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unsupported profiler mode: {mode}")
+        self.output_path = output_path
+        self.mode = mode
+        self._profiler = None
+        self._thread_profilers: List[_ThreadProfile] = []
+        self._lock = threading.Lock()
+
+    def _profile_thread(self, frame, event, arg) -> None:
+        """Profile hook of new threads: replaces itself with a cProfile profiler for the thread."""
+        profiler = _ThreadProfile()
+        with self._lock:
+            self._thread_profilers.append(profiler)
+        profiler.enable()
+
+    def __enter__(self):
+        if self.mode == "cprofile":
+            self._profiler = cProfile.Profile()
+            # Before Python 3.12 cProfile only sees the thread enabling it, so
+            # every thread started during the session gets its own profiler
+            if sys.version_info < (3, 12):
+                threading.setprofile(self._profile_thread)
+            self._profiler.enable()
+        else:
+            self._profiler = SamplingProfiler()
+            self._profiler.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.mode == "cprofile":
+            self._profiler.disable()
+            threading.setprofile(None)
+            with self._lock:
+                thread_profilers = list(self._thread_profilers)
+            pstats.Stats(self._profiler, *thread_profilers).dump_stats(self.output_path)
+        else:
+            self._profiler.stop()
+            self._profiler.write_speedscope(self.output_path)
+        logger.info(f"Profile written to {self.output_path}")
+        return False
@@ -0,0 +1,94 @@
+"""
+Rate Limiter module for the Reddit Fetcher application.
+
+This module provides a token bucket used to pace Reddit API requests.
+"""
+
+import threading
+import time
+from typing import Optional
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class RateLimiter:
+    """Thread-safe token bucket rate limiter."""
+
+    # Reddit allows 100 queries per minute for OAuth clients
+    DEFAULT_RATE = 100 / 60.0  # requests per second
+    DEFAULT_BURST = 10
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[int] = None):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Sustained number of requests per second
+            burst: Maximum number of requests allowed back to back
+        """
+        self.rate = rate or self.DEFAULT_RATE
+        self.burst = burst or self.DEFAULT_BURST
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._last_refill = now
+
+    def try_acquire(self, tokens: int = 1) -> bool:
+        """
+        Take tokens without waiting.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            bool: True if the tokens were taken
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: int = 1) -> float:
+        """
+        Take tokens, sleeping until enough are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            float: Total number of seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait_time = (tokens - self._tokens) / self.rate
+
+            logger.debug(f"Rate limiter waiting {wait_time:.2f} seconds")
+            time.sleep(wait_time)
+            waited += wait_time
+
+    def penalize(self, seconds: float) -> None:
+        """
+        Drain the bucket so no request is issued for the given time.
+
+        Used when the API reports that the quota is exhausted.
+
+        Args:
+            seconds: Number of seconds to hold off
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate